@@ -54,10 +54,27 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authenticate.CachedJWTAuthentication',
     ),
+    # Token buckets per <throttle_scope>_<ip|user|email> (core/throttling.py)
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': '20/min',
+        'login_email': '5/min',
+        'register_ip': '10/hour',
+        'register_email': '3/hour',
+        'apply_user': '20/hour',
+        'apply_ip': '60/hour',
+        'contact_ip': '5/min',
+    },
+    # Reverse proxies in front of the app that append to X-Forwarded-For. With 0
+    # the client IP is REMOTE_ADDR and a client-supplied X-Forwarded-For is ignored.
+    'NUM_PROXIES': int(os.environ.get('DJANGO_NUM_PROXIES', 0)),
 }
 
+# Shared memory-mapped file holding the throttle buckets of every worker on the host
+THROTTLE_STORE_PATH = BASE_DIR / '.throttle'
+THROTTLE_STORE_SLOTS = 65536
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=10),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=30),
@@ -68,6 +85,7 @@ SIMPLE_JWT = {
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'main_app.staticfiles.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -120,11 +138,54 @@ LOCALE_PATHS = [
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('DJANGO_DB_NAME', BASE_DIR / 'db.sqlite3'),
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# 'shared' is visible to every worker process on the host; point it at
+# memcached/redis when running on more than one machine.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+}
+
+CATALOG_CACHE_ALIAS = 'shared'
+CATALOG_CACHE_TIMEOUT = 60 * 10
+
+# about/ statistics: seconds a counters snapshot is fresh, then served stale while reloading
+STAT_COUNTERS_TTL = 30
+STAT_COUNTERS_STALE_TTL = 60 * 5
+# Counted tables by counter name, and the model storing the counts (see core/counters.py)
+STAT_COUNTER_MODEL = 'main_app.StatCounter'
+STAT_COUNTED_MODELS = {
+    'internships': 'main_app.Internship',
+    'applications': 'main_app.InternshipApplication',
+    'users': 'auth.User',
+}
+
+# JWT authentication: seconds a user's active/staff flags are cached (evicted on any user save/delete)
+USER_FLAGS_CACHE_ALIAS = 'shared'
+USER_FLAGS_CACHE_TIMEOUT = 60
+
+# Refresh-token blacklist: per-process bloom filter, resynced when the shared version key changes
+TOKEN_BLACKLIST_CACHE_ALIAS = 'shared'
+TOKEN_BLACKLIST_FILTER_CAPACITY = 100000
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = 0.001
+TOKEN_BLACKLIST_FILTER_MAX_AGE = 60 * 5
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -171,8 +232,40 @@ STATICFILES_DIRS = [
 # STATIC_ROOT (required for production)
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# collectstatic stores content-hashed copies plus .gz variants, which
+# main_app.staticfiles.StaticFilesMiddleware serves with immutable caching.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'main_app.staticfiles.CompressedManifestStaticFilesStorage'},
+}
+# Cache lifetime (seconds) of static files served under their plain, unhashed names
+STATIC_FILES_MAX_AGE = 60
+
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 MEDIA_URL = '/media/'
+
+# How the application file download endpoint sends files: None streams them
+# from Django (sendfile() under gunicorn); 'x-accel-redirect' (nginx) or
+# 'x-sendfile' (Apache/lighttpd) hands them to the front-end server.
+PRIVATE_FILES_SERVER = None
+# For 'x-accel-redirect': the nginx `internal` location aliased to MEDIA_ROOT
+PRIVATE_FILES_ACCEL_PREFIX = '/protected-media/'
+
+# Contact form ingestion: 'spool' appends validated messages to a local file
+# that a background thread bulk-inserts (see main_app/contact_spool.py);
+# 'direct' inserts each one during the request.
+CONTACT_INGEST_MODE = 'spool'
+CONTACT_SPOOL_DIR = BASE_DIR / '.spool'
+# Seconds between flushes; 0 leaves flushing to `manage.py flush_contact_spool`
+CONTACT_SPOOL_FLUSH_INTERVAL = 1.0
+CONTACT_SPOOL_BATCH_SIZE = 500
+# A message identical to one received within this many seconds is dropped
+CONTACT_SPOOL_DEDUP_WINDOW = 600
+
+# Resumable application file uploads: partial files live here until complete
+CHUNKED_UPLOAD_TEMP_DIR = BASE_DIR / '.uploads'
+CHUNKED_UPLOAD_MAX_SIZE = 20 * 1024 * 1024
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = 4 * 1024 * 1024
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
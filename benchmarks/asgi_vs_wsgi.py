@@ -0,0 +1,85 @@
+"""
+Compare concurrent-request throughput of the sync read endpoints under
+gunicorn (CONFIG/wsgi.py) with their async versions under uvicorn
+(CONFIG/asgi.py), on the same seeded database.
+
+    python -m benchmarks.asgi_vs_wsgi --workers 2 --concurrency 32 --duration 10
+"""
+import argparse
+import itertools
+import tempfile
+
+from benchmarks import common
+
+# (name, sync path, async path); {pk} is filled with a seeded internship id.
+ENDPOINTS = [
+    ('internship-list', '/api/internships/?page_size=20', '/api/async/internships/?page_size=20'),
+    ('internship-detail', '/api/internships/{pk}/', '/api/async/internships/{pk}/'),
+    ('internship-search', '/api/internships/search/?query=python&page_size=20',
+     '/api/async/internships/search/?query=python&page_size=20'),
+    ('about', '/api/about/', '/api/async/about/'),
+    ('my-applications', '/api/my-applications/', '/api/async/my-applications/'),
+    ('profile', '/users/profile/', '/users/async/profile/'),
+]
+
+
+def run(base_url, paths, token, concurrency, duration):
+    cycles = [itertools.cycle(paths) for _ in range(concurrency)]
+    headers = {'Authorization': f'token {token}'}
+
+    def next_request(index):
+        name, path = next(cycles[index])
+        status, latency = common.request('GET', base_url + path, headers=headers)
+        return name, status, latency
+
+    results, wall_time = common.run_load(next_request, concurrency, duration)
+    rows = [{'endpoint': name, **common.summarize(samples, wall_time)} for name, samples in sorted(results.items())]
+    total = [sample for samples in results.values() for sample in samples]
+    rows.append({'endpoint': 'TOTAL', **common.summarize(total, wall_time)})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=1, help="Threads per gunicorn (WSGI) worker.")
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds per server.")
+    parser.add_argument('--internships', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--json', help="Write the results to this file.")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-asgi-')
+    env = common.bench_environment(workdir)
+    common.setup_django(env)
+    users = common.seed_catalog(args.internships, args.users)
+    token = common.access_token(users[0][0])
+    from main_app.models import Internship
+    pk = Internship.objects.order_by('pk').values_list('pk', flat=True).first()
+
+    sync_paths = [(name, sync.format(pk=pk)) for name, sync, _ in ENDPOINTS]
+    async_paths = [(name, async_.format(pk=pk)) for name, _, async_ in ENDPOINTS]
+    report = {}
+
+    port = common.free_port()
+    command = common.gunicorn_command(port, workers=args.workers, threads=args.threads)
+    with common.Server(command, env, port) as server:
+        report['wsgi'] = run(server.base_url, sync_paths, token, args.concurrency, args.duration)
+
+    port = common.free_port()
+    with common.Server(common.uvicorn_command(port, workers=args.workers), env, port) as server:
+        report['asgi'] = run(server.base_url, async_paths, token, args.concurrency, args.duration)
+
+    columns = ['endpoint', 'requests', 'rps', 'p50_ms', 'p95_ms', 'p99_ms', 'error_rate']
+    for mode in ('wsgi', 'asgi'):
+        print(f"\n{mode.upper()} ({args.workers} workers, concurrency {args.concurrency})")
+        common.print_table(report[mode], columns)
+    wsgi_rps, asgi_rps = report['wsgi'][-1]['rps'], report['asgi'][-1]['rps']
+    print(f"\nASGI/WSGI throughput ratio: {asgi_rps / wsgi_rps if wsgi_rps else 0:.2f}x")
+    if args.json:
+        common.write_json(args.json, {'args': vars(args), 'results': report})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+"""
+Shared helpers for the benchmark scripts: a throwaway seeded database,
+server processes and a small threaded HTTP load generator.
+
+Scripts are run from the repository root, e.g.
+``python -m benchmarks.asgi_vs_wsgi``.
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SETTINGS_TEMPLATE = '''\
+from CONFIG.settings import *  # noqa
+
+DEBUG = False
+ALLOWED_HOSTS = ['*']
+CACHES['shared']['LOCATION'] = {cache_dir!r}
+MEDIA_ROOT = {media_dir!r}
+CONTACT_SPOOL_DIR = {spool_dir!r}
+# Load comes from one address: measure the app, not the throttles.
+REST_FRAMEWORK = {{**REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {{}}}}
+THROTTLE_STORE_PATH = {throttle_path!r}
+CACHES['disabled'] = {{'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+CATALOG_CACHE_ALIAS = {catalog_cache_alias!r}
+'''
+
+
+def bench_environment(workdir, catalog_cache=False):
+    """
+    Write a settings module for a benchmark run and return the environment
+    that selects it. The database, uploaded media and contact spool live in
+    ``workdir`` so the repository's db.sqlite3 and media/ are never touched.
+    """
+    workdir = Path(workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+    (workdir / 'bench_settings.py').write_text(SETTINGS_TEMPLATE.format(
+        cache_dir=str(workdir / 'cache'),
+        media_dir=str(workdir / 'media'),
+        spool_dir=str(workdir / 'spool'),
+        throttle_path=str(workdir / 'throttle'),
+        catalog_cache_alias='shared' if catalog_cache else 'disabled',
+    ))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([str(workdir), str(REPO_ROOT), env.get('PYTHONPATH', '')])
+    env['DJANGO_SETTINGS_MODULE'] = 'bench_settings'
+    env['DJANGO_DB_NAME'] = str(workdir / 'bench.sqlite3')
+    return env
+
+
+def setup_django(env):
+    os.environ.update({key: env[key] for key in ('DJANGO_SETTINGS_MODULE', 'DJANGO_DB_NAME')})
+    for path in reversed(env['PYTHONPATH'].split(os.pathsep)):
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+    import django
+    django.setup()
+
+
+def seed_catalog(internships, users, applications_per_user=2):
+    """
+    Migrate the benchmark database and fill it with synthetic rows.
+
+    Returns a list of ``(email, password)`` for the created users.
+    """
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from core import counters
+    from main_app import search
+    from main_app.models import Company, Internship, InternshipCategory, InternshipApplication
+    from users.models import UserProfile
+
+    call_command('migrate', verbosity=0)
+    companies = Company.objects.bulk_create(Company(name=f"Company {i}") for i in range(max(internships // 20, 1)))
+    categories = InternshipCategory.objects.bulk_create(InternshipCategory(name=f"Category {i}") for i in range(12))
+    Internship.objects.bulk_create(
+        (Internship(
+            company=companies[i % len(companies)],
+            category=categories[i % len(categories)],
+            title=f"Python developer intern {i}",
+            description="Build and maintain REST APIs with Django. " * 3,
+            full_description="Long description of the role and the team. " * 60,
+        ) for i in range(internships)),
+        batch_size=1000,
+    )
+    password = 'bench-password-1'
+    password_hash = make_password(password)
+    created = User.objects.bulk_create(
+        User(username=f"bench{i}", email=f"bench{i}@example.com", password=password_hash, first_name="Bench")
+        for i in range(users)
+    )
+    UserProfile.objects.bulk_create(
+        UserProfile(user=user, first_name=user.first_name, last_name='', email=user.email) for user in created
+    )
+    internship_ids = list(Internship.objects.values_list('pk', flat=True)[:50])
+    InternshipApplication.objects.bulk_create(
+        InternshipApplication(user=user, internship_id=internship_ids[(i + k) % len(internship_ids)], file='apply/cv.pdf')
+        for i, user in enumerate(created) for k in range(applications_per_user)
+    )
+    search.rebuild_index()
+    counters.reconcile()
+    return [(user.email, password) for user in created]
+
+
+def access_token(email):
+    from django.contrib.auth.models import User
+    from rest_framework_simplejwt.tokens import RefreshToken
+    return str(RefreshToken.for_user(User.objects.get(email=email)).access_token)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class Server:
+    """
+    Run a server command until the block exits; waits until it answers HTTP.
+    """
+    def __init__(self, command, env, port, ready_path='/api/about/', timeout=30):
+        self.command = command
+        self.env = env
+        self.base_url = f'http://127.0.0.1:{port}'
+        self.ready_path = ready_path
+        self.timeout = timeout
+        self.process = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(
+            self.command, env=self.env, cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"server exited early: {' '.join(self.command)}")
+            try:
+                urllib.request.urlopen(self.base_url + self.ready_path, timeout=1).read()
+                return self
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"server did not start: {' '.join(self.command)}")
+
+    def __exit__(self, *exc_info):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+def gunicorn_command(port, app='CONFIG.wsgi:application', workers=2, threads=1, worker_class=None):
+    command = [sys.executable, '-m', 'gunicorn', app, '--bind', f'127.0.0.1:{port}',
+               '--workers', str(workers), '--threads', str(threads), '--log-level', 'warning']
+    if worker_class:
+        command += ['--worker-class', worker_class]
+    return command
+
+
+def uvicorn_command(port, app='CONFIG.asgi:application', workers=2):
+    return [sys.executable, '-m', 'uvicorn', app, '--host', '127.0.0.1', '--port', str(port),
+            '--workers', str(workers), '--log-level', 'warning', '--no-access-log']
+
+
+def request(method, url, body=None, headers=None, content_type=None, timeout=30):
+    """
+    Send one request and return ``(status, latency_seconds)``; network errors are status 0.
+    """
+    headers = dict(headers or {})
+    if content_type:
+        headers['Content-Type'] = content_type
+    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    except (urllib.error.URLError, ConnectionError, socket.timeout):
+        status = 0
+    return status, time.perf_counter() - started
+
+
+def run_load(next_request, concurrency, duration):
+    """
+    Call ``next_request(worker_index)`` from ``concurrency`` threads for
+    ``duration`` seconds. ``next_request`` returns ``(name, status, latency)``.
+
+    Returns ``{name: [(status, latency), ...]}`` and the wall time.
+    """
+    results = defaultdict(list)
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def worker(index):
+        local = defaultdict(list)
+        while time.monotonic() < stop_at:
+            name, status, latency = next_request(index)
+            local[name].append((status, latency))
+        with lock:
+            for name, samples in local.items():
+                results[name].extend(samples)
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return dict(results), time.monotonic() - started
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples, wall_time):
+    latencies = sorted(latency for _, latency in samples)
+    errors = sum(1 for status, _ in samples if status == 0 or status >= 500)
+    return {
+        'requests': len(samples),
+        'rps': len(samples) / wall_time if wall_time else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'error_rate': errors / len(samples) if samples else 0.0,
+    }
+
+
+def print_table(rows, columns):
+    widths = [max(len(str(column)), *(len(_fmt(row.get(column))) for row in rows)) for column in columns]
+    print('  '.join(str(column).ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print('  '.join(_fmt(row.get(column)).ljust(width) for column, width in zip(columns, widths)))
+
+
+def _fmt(value):
+    if isinstance(value, float):
+        return f'{value:.2f}'
+    return '' if value is None else str(value)
+
+
+def write_json(path, payload):
+    Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True))
@@ -0,0 +1,191 @@
+"""
+Replay a realistic traffic mix against the app under gunicorn, on a seeded
+throwaway database, and report throughput, latency percentiles and error
+rates per endpoint.
+
+    python -m benchmarks.loadtest --workers 4 --threads 2 --concurrency 64 --duration 30
+    python -m benchmarks.loadtest --mix browse=70,search=20,apply=10 --worker-class gthread
+
+Every virtual user repeatedly picks a scenario by weight and sends its
+requests in order:
+
+    browse  anonymous catalog list page, then an internship detail
+    search  anonymous full-text search
+    login   POST /users/login/ with a seeded user's credentials
+    apply   authenticated multipart application with a file upload
+    review  admin review queue, then approving one pending application
+"""
+import argparse
+import itertools
+import json
+import random
+import tempfile
+import threading
+import uuid
+
+from benchmarks import common
+
+SEARCH_TERMS = ['python', 'django', 'developer', 'intern', 'apis', 'team', 'role', 'maintain']
+
+SCENARIOS = ('browse', 'search', 'login', 'apply', 'review')
+
+DEFAULT_MIX = 'browse=50,search=20,login=10,apply=10,review=10'
+
+
+def multipart(fields, files):
+    """
+    Encode ``fields`` ({name: value}) and ``files`` ({name: (filename, bytes)})
+    as multipart/form-data; returns ``(body, content_type)``.
+    """
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'.encode() + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+class Traffic:
+    """
+    Builds the requests of each scenario against one seeded database.
+    """
+    def __init__(self, base_url, data, upload_bytes):
+        self.base_url = base_url
+        self.data = data
+        self.upload = b'%PDF-1.4\n' + b'0' * max(upload_bytes - 9, 0)
+
+    def send(self, name, method, path, body=None, headers=None, content_type=None):
+        status, latency = common.request(method, self.base_url + path, body=body, headers=headers,
+                                         content_type=content_type)
+        return name, status, latency
+
+    def browse(self, rng):
+        yield self.send('GET internships/', 'GET', '/api/internships/?page_size=20')
+        yield self.send('GET internships/<pk>/', 'GET', f'/api/internships/{rng.choice(self.data["internships"])}/')
+
+    def search(self, rng):
+        yield self.send('GET internships/search/', 'GET',
+                        f'/api/internships/search/?query={rng.choice(SEARCH_TERMS)}&page_size=20')
+
+    def login(self, rng):
+        email, password = rng.choice(self.data['credentials'])
+        body = json.dumps({'email': email, 'password': password}).encode()
+        yield self.send('POST users/login/', 'POST', '/users/login/', body=body, content_type='application/json')
+
+    def apply(self, rng):
+        body, content_type = multipart(
+            {'internship': rng.choice(self.data['internships']), 'description': "Load test application."},
+            # Unique content, so content-addressed storage cannot deduplicate it.
+            {'file': (f'cv-{rng.randrange(10 ** 9)}.pdf', self.upload + rng.randbytes(16))},
+        )
+        headers = {'Authorization': f'token {rng.choice(self.data["tokens"])}'}
+        yield self.send('POST apply/', 'POST', '/api/apply/', body=body, headers=headers, content_type=content_type)
+
+    def review(self, rng):
+        headers = {'Authorization': f'token {self.data["admin_token"]}'}
+        yield self.send('GET applications/admin/', 'GET', '/api/applications/admin/?page_size=20', headers=headers)
+        pk = rng.choice(self.data['pending'])
+        yield self.send('POST applications/admin/<pk>/approve/', 'POST',
+                        f'/api/applications/admin/{pk}/approve/', headers=headers)
+
+
+def parse_mix(text):
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"bad weight for {name!r}: {weight!r}")
+    if not any(weight > 0 for weight in mix.values()):
+        raise argparse.ArgumentTypeError("the mix needs at least one positive weight")
+    return mix
+
+
+def seed(args):
+    """
+    Seed the database and collect what the scenarios need: internship ids,
+    credentials, access tokens, an admin token and pending application ids.
+    """
+    from django.contrib.auth.models import User
+    from main_app.models import Internship, InternshipApplication
+
+    credentials = common.seed_catalog(args.internships, args.users)
+    admin_email = credentials[0][0]
+    User.objects.filter(email=admin_email).update(is_staff=True)
+    return {
+        'internships': list(Internship.objects.values_list('pk', flat=True)),
+        'credentials': credentials,
+        'tokens': [common.access_token(email) for email, _ in credentials[1:] or credentials],
+        'admin_token': common.access_token(admin_email),
+        'pending': list(InternshipApplication.objects.filter(status='pending').values_list('pk', flat=True)),
+    }
+
+
+def run(traffic, mix, concurrency, duration, seed_value):
+    scenarios, weights = zip(*mix.items())
+    local = threading.local()
+    rngs = [random.Random(f'{seed_value}-{i}') for i in range(concurrency)]
+
+    def requests(rng):
+        for scenario in iter(lambda: rng.choices(scenarios, weights)[0], None):
+            yield from getattr(traffic, scenario)(rng)
+
+    def next_request(index):
+        if not hasattr(local, 'requests'):
+            local.requests = requests(rngs[index])
+        return next(local.requests)
+
+    results, wall_time = common.run_load(next_request, concurrency, duration)
+    rows = [{'endpoint': name, **common.summarize(samples, wall_time)} for name, samples in sorted(results.items())]
+    total = list(itertools.chain.from_iterable(results.values()))
+    rows.append({'endpoint': 'TOTAL', **common.summarize(total, wall_time)})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=1, help="Threads per gunicorn worker.")
+    parser.add_argument('--worker-class', help="gunicorn worker class, e.g. gthread.")
+    parser.add_argument('--concurrency', type=int, default=32, help="Simultaneous virtual users.")
+    parser.add_argument('--duration', type=float, default=20.0, help="Seconds of traffic.")
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"Scenario weights (default {DEFAULT_MIX}).")
+    parser.add_argument('--internships', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--upload-kb', type=int, default=64, help="Size of each uploaded application file.")
+    parser.add_argument('--catalog-cache', action='store_true', help="Serve the catalog through the response cache.")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed of the traffic.")
+    parser.add_argument('--json', help="Write the results to this file.")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-load-')
+    env = common.bench_environment(workdir, catalog_cache=args.catalog_cache)
+    common.setup_django(env)
+    data = seed(args)
+
+    port = common.free_port()
+    command = common.gunicorn_command(port, workers=args.workers, threads=args.threads,
+                                      worker_class=args.worker_class)
+    with common.Server(command, env, port) as server:
+        traffic = Traffic(server.base_url, data, args.upload_kb * 1024)
+        rows = run(traffic, args.mix, args.concurrency, args.duration, args.seed)
+
+    print(f"gunicorn {args.workers} worker(s) x {args.threads} thread(s), "
+          f"concurrency {args.concurrency}, {args.duration:g}s, mix {args.mix}")
+    common.print_table(rows, ['endpoint', 'requests', 'rps', 'p50_ms', 'p95_ms', 'p99_ms', 'error_rate'])
+    if args.json:
+        common.write_json(args.json, {'args': {**vars(args), 'mix': args.mix}, 'results': rows})
+
+
+if __name__ == '__main__':
+    main()
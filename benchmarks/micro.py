@@ -0,0 +1,314 @@
+"""
+In-process microbenchmarks for the hot serializers and views, against a
+seeded database at several sizes.
+
+    python -m benchmarks.micro --sizes 100,1000,5000 --json bench-new.json
+    python -m benchmarks.micro --compare bench-old.json --json bench-new.json
+
+Each case reports ops/sec, p50/p99 latency and the peak memory allocated
+per operation (measured in a separate tracemalloc pass, so it does not
+slow the timed runs). With ``--compare``, cases whose p50 grew by more than
+``--threshold`` are flagged and the script exits with status 1.
+"""
+import argparse
+import collections
+import contextlib
+import inspect
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks import common
+
+
+class Case:
+    """
+    A named operation. ``setup(size)`` returns the callable that is timed,
+    or is a generator that yields it and cleans up once it has been measured.
+    """
+    def __init__(self, name, setup, sized=True):
+        self.name = name
+        self.setup = setup
+        self.sized = sized
+
+    @contextlib.contextmanager
+    def prepare(self, size):
+        prepared = self.setup(size)
+        if not inspect.isgenerator(prepared):
+            yield prepared
+            return
+        try:
+            yield next(prepared)
+        finally:
+            next(prepared, None)
+
+
+def internship_serializer_many(size):
+    from main_app.models import Internship
+    from main_app.serializers import InternshipSerializer
+    internships = list(Internship.objects.select_related('company', 'category').order_by('pk')[:size])
+    return lambda: InternshipSerializer(internships, many=True).data
+
+
+def internship_list_query_and_serialize(size):
+    from main_app.models import Internship
+    from main_app.serializers import InternshipSerializer
+    queryset = Internship.objects.select_related('company', 'category').order_by('pk')
+    return lambda: InternshipSerializer(queryset[:size], many=True).data
+
+
+def application_serializer_many(size):
+    from main_app.models import InternshipApplication
+    from main_app.serializers import InternshipApplicationSerializer
+    applications = list(InternshipApplication.objects.order_by('pk')[:size])
+    return lambda: InternshipApplicationSerializer(applications, many=True).data
+
+
+def internship_values_plan_streamed(size):
+    from main_app import streaming
+    from main_app.models import Internship
+    from main_app.serializers import InternshipSerializer
+    queryset = Internship.objects.order_by('pk')
+    # Chunks are consumed one by one, as the WSGI server sends them.
+    return lambda: collections.deque(streaming.streaming_json_response(InternshipSerializer(), queryset[:size]), 0)
+
+
+def internship_serializer_rendered(size):
+    from rest_framework.renderers import JSONRenderer
+    from main_app.models import Internship
+    from main_app.serializers import InternshipSerializer
+    queryset = Internship.objects.select_related('company', 'category').order_by('pk')
+    return lambda: JSONRenderer().render(InternshipSerializer(queryset[:size], many=True).data)
+
+
+def application_values_plan_streamed(size):
+    from main_app import streaming
+    from main_app.models import InternshipApplication
+    from main_app.serializers import InternshipApplicationSerializer
+    queryset = InternshipApplication.objects.order_by('pk')
+    return lambda: collections.deque(
+        streaming.streaming_json_response(InternshipApplicationSerializer(), queryset[:size]), 0,
+    )
+
+
+def application_serializer_rendered(size):
+    from rest_framework.renderers import JSONRenderer
+    from main_app.models import InternshipApplication
+    from main_app.serializers import InternshipApplicationSerializer
+    queryset = InternshipApplication.objects.order_by('pk')
+    return lambda: JSONRenderer().render(InternshipApplicationSerializer(queryset[:size], many=True).data)
+
+
+def application_serializer_validate(size):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from main_app.models import Internship
+    from main_app.serializers import InternshipApplicationSerializer
+    internship_id = Internship.objects.values_list('pk', flat=True).first()
+
+    def run():
+        data = {
+            'internship': internship_id,
+            'file': SimpleUploadedFile('cv.pdf', b'%PDF-1.4 benchmark', content_type='application/pdf'),
+            'additional_titles': {'languages': ['en', 'uz']},
+            'description': "Motivation letter. " * 20,
+        }
+        serializer = InternshipApplicationSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+    return run
+
+
+def register_serializer_create(size):
+    from users.serializers import RegisterSerializer
+    numbers = itertools.count()
+
+    def run():
+        n = next(numbers)
+        serializer = RegisterSerializer(data={
+            'username': f'micro{n}', 'first_name': 'Micro', 'last_name': 'Bench',
+            'email': f'micro{n}@example.com', 'password': 'micro-password-1', 'confirm_password': 'micro-password-1',
+        })
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+    return run
+
+
+def login_view_post(size, credentials):
+    from rest_framework.test import APIRequestFactory
+    from users.views import LoginAPIView
+    factory = APIRequestFactory()
+    view = LoginAPIView.as_view()
+    email, password = credentials[0]
+
+    def run():
+        response = view(factory.post('/users/login/', {'email': email, 'password': password}, format='json'))
+        assert response.status_code == 200, response.data
+    return run
+
+
+def jwt_authenticate(size, credentials, authentication_class):
+    from rest_framework.test import APIRequestFactory
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    from users.authenticate import CachedJWTAuthentication
+    authentication = {'row': JWTAuthentication, 'cached': CachedJWTAuthentication}[authentication_class]()
+    factory = APIRequestFactory()
+    header = f'token {common.access_token(credentials[0][0])}'
+    return lambda: authentication.authenticate(factory.get('/', HTTP_AUTHORIZATION=header))
+
+
+def throttle_allow_request(size):
+    from django.conf import settings
+    from django.test import override_settings
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+    from core.throttling import EmailRateThrottle, IPRateThrottle
+
+    class View:
+        throttle_scope = 'micro'
+
+    request = Request(APIRequestFactory().post('/users/login/'))
+    request._full_data = {'email': 'micro@example.com'}
+
+    def run():
+        assert IPRateThrottle().allow_request(request, View) and EmailRateThrottle().allow_request(request, View)
+
+    # The bench settings disable throttling; rates for this case only.
+    with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {
+        'micro_ip': '1000000000/s', 'micro_email': '1000000000/s',
+    }}):
+        yield run
+
+
+def measure(operation, min_time, min_ops, max_ops, alloc_ops):
+    operation()  # warm up caches, lazy imports and the query plan
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < max_ops and (len(latencies) < min_ops or time.perf_counter() - started < min_time):
+        t0 = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - t0)
+    total = sum(latencies)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_ops):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            operation()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'ops': len(latencies),
+        'ops_per_sec': len(latencies) / total if total else 0.0,
+        'p50_ms': common.percentile(latencies, 50) * 1000,
+        'p99_ms': common.percentile(latencies, 99) * 1000,
+        'peak_alloc_kb': max(peaks) / 1024 if peaks else 0.0,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Annotate ``results`` with the p50 change against ``baseline`` and
+    return the names of the cases that regressed.
+    """
+    regressions = []
+    for name, row in results.items():
+        old = baseline.get(name)
+        if not old or not old.get('p50_ms'):
+            continue
+        change = row['p50_ms'] / old['p50_ms'] - 1
+        row['p50_change'] = change
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=common.REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='100,1000,5000',
+                        help="Comma-separated row counts for the sized cases.")
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--only', help="Run only cases whose name contains this text.")
+    parser.add_argument('--min-time', type=float, default=1.0, help="Seconds to spend timing each case.")
+    parser.add_argument('--min-ops', type=int, default=5)
+    parser.add_argument('--max-ops', type=int, default=10000)
+    parser.add_argument('--alloc-ops', type=int, default=3, help="Operations traced for the allocation figure.")
+    parser.add_argument('--json', help="Write the results to this file.")
+    parser.add_argument('--compare', help="Results file of an earlier run to compare against.")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative p50 increase that counts as a regression (default 0.10).")
+    args = parser.parse_args()
+    sizes = sorted({int(size) for size in args.sizes.split(',') if size.strip()})
+    if not sizes or sizes[0] < 1:
+        parser.error("--sizes must list positive row counts.")
+
+    workdir = tempfile.mkdtemp(prefix='bench-micro-')
+    env = common.bench_environment(workdir)
+    common.setup_django(env)
+    credentials = common.seed_catalog(sizes[-1], args.users, applications_per_user=-(-sizes[-1] // args.users))
+
+    cases = [
+        Case('InternshipSerializer(many=True)', internship_serializer_many),
+        Case('InternshipSerializer(many=True) incl. query', internship_list_query_and_serialize),
+        Case('InternshipApplicationSerializer(many=True)', application_serializer_many),
+        Case('InternshipSerializer rendered incl. query', internship_serializer_rendered),
+        Case('InternshipSerializer streamed values() incl. query', internship_values_plan_streamed),
+        Case('InternshipApplicationSerializer rendered incl. query', application_serializer_rendered),
+        Case('InternshipApplicationSerializer streamed values() incl. query', application_values_plan_streamed),
+        Case('InternshipApplicationSerializer.is_valid', application_serializer_validate, sized=False),
+        Case('RegisterSerializer.create', register_serializer_create, sized=False),
+        Case('LoginAPIView.post', lambda size: login_view_post(size, credentials), sized=False),
+        Case('IP + email throttles', throttle_allow_request, sized=False),
+        Case('JWTAuthentication.authenticate', lambda size: jwt_authenticate(size, credentials, 'row'), sized=False),
+        Case('CachedJWTAuthentication.authenticate', lambda size: jwt_authenticate(size, credentials, 'cached'),
+             sized=False),
+    ]
+    if args.only:
+        cases = [case for case in cases if args.only.lower() in case.name.lower()]
+
+    results = {}
+    for case in cases:
+        for size in sizes if case.sized else [None]:
+            name = f'{case.name} [{size}]' if size else case.name
+            with case.prepare(size) as operation:
+                results[name] = measure(operation, args.min_time, args.min_ops, args.max_ops, args.alloc_ops)
+            print(f"{name}: {results[name]['ops_per_sec']:.1f} ops/s", file=sys.stderr)
+
+    columns = ['case', 'ops', 'ops_per_sec', 'p50_ms', 'p99_ms', 'peak_alloc_kb']
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        columns.append('p50_change')
+    common.print_table([{'case': name, **row} for name, row in results.items()], columns)
+
+    if args.json:
+        common.write_json(args.json, {
+            'args': vars(args),
+            'meta': {'revision': git_revision(), 'python': platform.python_version()},
+            'results': results,
+        })
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%} p50:", *regressions, sep='\n  ')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
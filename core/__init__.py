@@ -0,0 +1,6 @@
+"""
+Building blocks shared by ``main_app`` and ``users``.
+
+Nothing in this package imports either app, so both can depend on it
+without importing each other.
+"""
@@ -0,0 +1,28 @@
+"""
+Response helpers for the plain Django async views of both apps.
+"""
+from django.http import HttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+
+_renderer = JSONRenderer()
+
+
+def json_response(data, status=200):
+    return HttpResponse(_renderer.render(data), content_type='application/json', status=status)
+
+
+def method_not_allowed(request):
+    return json_response({'detail': f'Method "{request.method}" not allowed.'}, status=405)
+
+
+def sparse_fields(view):
+    """
+    Answer 400 for unknown ``fields``/``omit`` names, like the REST framework views.
+    """
+    async def wrapper(request, *args, **kwargs):
+        try:
+            return await view(request, *args, **kwargs)
+        except ValidationError as e:
+            return json_response(e.detail, status=400)
+    return wrapper
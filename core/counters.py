@@ -0,0 +1,115 @@
+"""
+Row counts for the about/statistics endpoints, served without COUNT(*).
+
+The counted tables are ``STAT_COUNTED_MODELS`` (counter name -> model
+label) and the stored values live in ``STAT_COUNTER_MODEL`` rows with a
+``name`` and a ``value``. The rows are kept up to date by create/delete
+receivers in ``main_app/signals.py``; ``manage.py reconcile_counters``
+repairs any drift (e.g. after ``bulk_create`` or raw SQL, which send no
+signals).
+
+Reads go through a per-process snapshot with stale-while-revalidate: a
+fresh snapshot is returned as is, a stale one is returned immediately while
+a background thread reloads it, and only an expired (or missing) snapshot
+is reloaded on the request path.
+"""
+import threading
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+
+_lock = threading.Lock()
+_snapshot = {'values': None, 'fetched_at': 0.0, 'refreshing': False}
+
+
+def _counter_model():
+    return apps.get_model(settings.STAT_COUNTER_MODEL)
+
+
+def _counted_models():
+    return {name: apps.get_model(label) for name, label in settings.STAT_COUNTED_MODELS.items()}
+
+
+def _fresh_for():
+    return getattr(settings, 'STAT_COUNTERS_TTL', 30)
+
+
+def _stale_for():
+    return getattr(settings, 'STAT_COUNTERS_STALE_TTL', 300)
+
+
+def increment(name, delta=1):
+    StatCounter = _counter_model()
+    updated = StatCounter.objects.filter(name=name).update(value=F('value') + delta)
+    if not updated:
+        StatCounter.objects.get_or_create(name=name, defaults={'value': _counted_models()[name].objects.count()})
+    mark_stale()
+
+
+def mark_stale():
+    """
+    Let the next read in this process serve the snapshot and reload it.
+    """
+    with _lock:
+        if _snapshot['values'] is not None:
+            _snapshot['fetched_at'] = min(_snapshot['fetched_at'], time.monotonic() - _fresh_for())
+
+
+def _load():
+    names = settings.STAT_COUNTED_MODELS
+    values = dict.fromkeys(names, 0)
+    values.update(_counter_model().objects.filter(name__in=names).values_list('name', 'value'))
+    with _lock:
+        _snapshot['values'] = values
+        _snapshot['fetched_at'] = time.monotonic()
+    return values
+
+
+def _refresh_in_background():
+    try:
+        _load()
+    finally:
+        with _lock:
+            _snapshot['refreshing'] = False
+        connection.close()
+
+
+def get_counts():
+    """
+    Return ``{'internships': n, 'applications': n, 'users': n}``.
+    """
+    with _lock:
+        values = _snapshot['values']
+        age = time.monotonic() - _snapshot['fetched_at']
+        if values is not None and age < _fresh_for():
+            return values
+        stale = values is not None and age < _fresh_for() + _stale_for()
+        if stale and _snapshot['refreshing']:
+            return values
+        if stale:
+            _snapshot['refreshing'] = True
+    if stale:
+        threading.Thread(target=_refresh_in_background, daemon=True).start()
+        return values
+    return _load()
+
+
+def reconcile():
+    """
+    Recount every counted table and store the exact values.
+
+    Returns ``{name: (stored, actual)}`` for the counters that had drifted.
+    """
+    StatCounter = _counter_model()
+    drift = {}
+    for name, model in _counted_models().items():
+        actual = model.objects.count()
+        counter, created = StatCounter.objects.get_or_create(name=name, defaults={'value': actual})
+        if not created and counter.value != actual:
+            drift[name] = (counter.value, actual)
+            StatCounter.objects.filter(pk=counter.pk).update(value=actual)
+    _load()
+    return drift
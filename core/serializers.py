@@ -0,0 +1,71 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+
+class SparseFieldsetMixin:
+    """
+    Let the client pick the serialized fields with query parameters:
+    ``?fields=id,title`` keeps only those, ``?omit=description`` drops some.
+    Unknown names are a 400.
+
+    With ``summary=True`` in the serializer context and no ``fields``
+    parameter, only ``summary_fields`` are serialized (all of
+    ``Meta.fields`` when unset). ``project_queryset()`` loads just the
+    columns the selected fields read.
+    """
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+    summary_fields = None
+    # Model columns (for QuerySet.only()) read by fields not named after one.
+    field_columns = {}
+
+    @classmethod
+    def _names(cls, params, param):
+        raw = params.get(param)
+        if not raw:
+            return None
+        names = [name.strip() for name in raw.split(',') if name.strip()]
+        unknown = set(names) - set(cls.Meta.fields)
+        if unknown:
+            raise serializers.ValidationError({param: _("Unknown field(s): %(names)s.") % {
+                'names': ', '.join(sorted(unknown)),
+            }})
+        return names
+
+    @classmethod
+    def selected_fields(cls, request, summary=False):
+        """
+        The field names to serialize, in ``Meta.fields`` order, or ``None`` for all of them.
+        """
+        params = request.GET if request is not None else {}
+        requested = cls._names(params, cls.fields_query_param)
+        omitted = cls._names(params, cls.omit_query_param) or ()
+        if requested is None:
+            if summary and cls.summary_fields is not None:
+                requested = cls.summary_fields
+            elif not omitted:
+                return None
+            else:
+                requested = cls.Meta.fields
+        return [name for name in cls.Meta.fields if name in requested and name not in omitted]
+
+    @classmethod
+    def project_queryset(cls, queryset, selected, always=()):
+        """
+        Restrict ``queryset`` to the columns read by the ``selected`` fields
+        (plus ``always``), joining only the relations they need.
+        """
+        if selected is None:
+            return queryset
+        columns = [column for name in selected for column in cls.field_columns.get(name, (name,))]
+        related = dict.fromkeys(column.split('__')[0] for column in columns if '__' in column)
+        queryset = queryset.select_related(None)
+        if related:
+            # select_related() without arguments would follow every relation.
+            queryset = queryset.select_related(*related)
+        return queryset.only(*columns, *always)
+
+    def get_field_names(self, declared_fields, info):
+        names = super().get_field_names(declared_fields, info)
+        selected = self.selected_fields(self.context.get('request'), self.context.get('summary', False))
+        return names if selected is None else [name for name in names if name in selected]
@@ -0,0 +1,176 @@
+"""
+Token-bucket throttling shared by every worker process on the host.
+
+Buckets live in a memory-mapped file (``THROTTLE_STORE_PATH``): a fixed
+table of ``THROTTLE_STORE_SLOTS`` slots, each holding a key hash, the
+tokens left and when they were last topped up. A check is a hash, a few
+``struct`` reads and writes in shared memory and an ``flock()`` pair, so
+an allowed request pays microseconds and no cache or database round trip.
+
+Rates come from ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`` in DRF's
+``"<number>/<period>"`` format, keyed ``<throttle_scope>_<kind>``, e.g.
+``login_ip`` or ``login_email``. ``"5/min"`` is a bucket of 5 tokens that
+refills at 5 per minute. A view opts in with ``throttle_scope`` and the
+throttle classes below; a missing rate means no limit. A throttled request
+gets DRF's 429 with ``Retry-After``.
+
+Hash collisions probe a few neighbouring slots; when they are all taken the
+least recently used bucket is recycled, which can only reset it to full.
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+SLOT = struct.Struct('<Qdd')  # key hash, tokens, last refill (epoch seconds)
+PROBES = 8
+DURATIONS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 24 * 60 * 60}
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def parse_rate(rate):
+    """
+    ``(capacity, tokens per second)`` of a ``"<number>/<period>"`` rate.
+    """
+    number, period = rate.split('/')
+    capacity = int(number)
+    return capacity, capacity / DURATIONS[period[0]]
+
+
+class BucketTable:
+    """
+    Token buckets in a shared memory-mapped file.
+    """
+    def __init__(self, path, slots):
+        self.slots = slots
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = slots * SLOT.size
+        if os.fstat(self.fd).st_size != size:
+            os.ftruncate(self.fd, size)
+        self.map = mmap.mmap(self.fd, size)
+        # flock() does not exclude threads sharing this descriptor.
+        self.lock = threading.Lock()
+
+    def _find(self, key_hash, now):
+        oldest, oldest_updated = None, now
+        for probe in range(PROBES):
+            offset = (key_hash + probe) % self.slots * SLOT.size
+            slot_hash, tokens, updated = SLOT.unpack_from(self.map, offset)
+            if slot_hash == key_hash:
+                return offset, tokens, updated
+            if slot_hash == 0:
+                return offset, None, None
+            if oldest is None or updated < oldest_updated:
+                oldest, oldest_updated = offset, updated
+        return oldest, None, None
+
+    def consume(self, key, capacity, refill_rate):
+        """
+        Take a token from ``key``'s bucket. Returns 0 when one was
+        available, else the seconds until there will be one.
+        """
+        key_hash = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little') or 1
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                offset, tokens, updated = self._find(key_hash, now)
+                if tokens is None:
+                    tokens = capacity
+                else:
+                    tokens = min(capacity, tokens + max(now - updated, 0) * refill_rate)
+                wait = 0 if tokens >= 1 else (1 - tokens) / refill_rate
+                SLOT.pack_into(self.map, offset, key_hash, tokens - 1 if not wait else tokens, now)
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+        return wait
+
+    def reset(self):
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                self.map[:] = bytes(len(self.map))
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+
+def get_table():
+    path = str(getattr(settings, 'THROTTLE_STORE_PATH', os.path.join(settings.BASE_DIR, '.throttle')))
+    # Per process: a descriptor inherited across fork() shares its flock() with the parent.
+    key = (path, getattr(settings, 'THROTTLE_STORE_SLOTS', 65536), os.getpid())
+    table = _tables.get(key)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(key)
+            if table is None:
+                table = _tables[key] = BucketTable(path, key[1])
+    return table
+
+
+def reset():
+    """
+    Refill every bucket (for tests).
+    """
+    get_table().reset()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Base class: one bucket per ``get_ident()`` value under the view's
+    ``throttle_scope``. Subclasses set ``kind`` and may override
+    ``get_ident()``; ``None`` skips the check.
+    """
+    kind = None
+
+    def allow_request(self, request, view):
+        scope = getattr(view, 'throttle_scope', None)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(f'{scope}_{self.kind}') if scope else None
+        if rate is None:
+            return True
+        ident = self.get_ident(request)
+        if ident is None:
+            return True
+        capacity, refill_rate = parse_rate(rate)
+        self.wait_time = get_table().consume(f'{scope}:{self.kind}:{ident}', capacity, refill_rate)
+        return not self.wait_time
+
+    def wait(self):
+        return self.wait_time
+
+
+class IPRateThrottle(TokenBucketThrottle):
+    """
+    Per client IP: ``REMOTE_ADDR``, or with ``NUM_PROXIES`` set to N > 0,
+    the address the outermost of those N proxies appended to ``X-Forwarded-For``.
+    """
+    kind = 'ip'
+
+
+class UserRateThrottle(TokenBucketThrottle):
+    """
+    Per authenticated user; anonymous requests are left to the other throttles.
+    """
+    kind = 'user'
+
+    def get_ident(self, request):
+        return request.user.pk if request.user and request.user.is_authenticated else None
+
+
+class EmailRateThrottle(TokenBucketThrottle):
+    """
+    Per ``email`` in the request body, so one account cannot be attacked from many addresses.
+    """
+    kind = 'email'
+
+    def get_ident(self, request):
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        return email.strip().lower() if isinstance(email, str) and email.strip() else None
@@ -0,0 +1,195 @@
+"""
+Async (ASGI) versions of the read-heavy catalog endpoints.
+
+These are plain Django async views using the async ORM, so under an ASGI
+server a slow query parks a coroutine instead of a whole worker. They
+return the same JSON as their REST framework counterparts in ``views.py``
+but skip the response cache. Raw SQL (the full-text index, the counters
+snapshot) still runs through ``sync_to_async``.
+"""
+import base64
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.utils.urls import replace_query_param
+
+from core import counters
+from core.async_views import json_response, method_not_allowed, sparse_fields
+from users.authenticate import login_required
+from . import search
+from .models import Internship, InternshipApplication, StatCounter
+from .pagination import KeysetCursorPagination
+from .serializers import InternshipSerializer, InternshipSearchResultSerializer, InternshipApplicationSerializer
+
+
+def _page_size(request):
+    paginator = KeysetCursorPagination
+    value = request.GET.get(paginator.page_size_query_param)
+    if value is None:
+        return paginator.page_size
+    try:
+        size = int(value)
+    except ValueError:
+        return paginator.page_size
+    return min(size, paginator.max_page_size) if size > 0 else paginator.page_size
+
+
+def _encode_position(internship, reverse=False):
+    # A reverse position asks for the rows before it (the previous page).
+    raw = f"{internship.created_at.isoformat()}|{internship.pk}" + ('|r' if reverse else '')
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_position(value):
+    try:
+        created_at, pk, *flags = base64.urlsafe_b64decode(value.encode()).decode().split('|')
+        if flags not in ([], ['r']):
+            return None
+        return parse_datetime(created_at), int(pk), bool(flags)
+    except ValueError:
+        return None
+
+
+@sparse_fields
+async def internship_list(request):
+    if request.method != 'GET':
+        return method_not_allowed(request)
+    context = {'request': request, 'summary': True}
+    internships = InternshipSerializer.project_queryset(
+        Internship.objects.select_related('company', 'category'),
+        InternshipSerializer.selected_fields(request, summary=True),
+        always=['created_at'],
+    )
+    paginator = KeysetCursorPagination
+    if paginator.cursor_query_param not in request.GET and paginator.page_size_query_param not in request.GET:
+        results = [internship async for internship in internships]
+        return json_response(InternshipSerializer(results, many=True, context=context).data)
+
+    # True (created_at, id) keyset: the cursor is the last row of the previous page,
+    # or for a reverse cursor the first row of the next one.
+    page_size = _page_size(request)
+    encoded = request.GET.get(paginator.cursor_query_param)
+    reverse = False
+    if encoded:
+        position = _decode_position(encoded)
+        if position is None or position[0] is None:
+            return json_response({'detail': paginator.invalid_cursor_message}, status=404)
+        created_at, pk, reverse = position
+        if reverse:
+            internships = internships.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+        else:
+            internships = internships.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+    internships = internships.order_by(*(('created_at', 'id') if reverse else ('-created_at', '-id')))
+    results = [internship async for internship in internships[:page_size + 1]]
+    has_more = len(results) > page_size
+    results = results[:page_size]
+    if reverse:
+        results.reverse()
+    # Coming back from a later page, or past a forward cursor, there is always a page on the other side.
+    has_next, has_previous = (bool(encoded), has_more) if reverse else (has_more, bool(encoded))
+    url = request.build_absolute_uri()
+    next_url = previous_url = None
+    if has_next and results:
+        next_url = replace_query_param(url, paginator.cursor_query_param, _encode_position(results[-1]))
+    if has_previous and results:
+        previous_url = replace_query_param(url, paginator.cursor_query_param,
+                                           _encode_position(results[0], reverse=True))
+    return json_response({
+        'next': next_url,
+        'previous': previous_url,
+        'results': InternshipSerializer(results, many=True, context=context).data,
+    })
+
+
+@sparse_fields
+async def internship_detail(request, pk):
+    if request.method != 'GET':
+        return method_not_allowed(request)
+    internships = InternshipSerializer.project_queryset(
+        Internship.objects.select_related('company', 'category'), InternshipSerializer.selected_fields(request),
+    )
+    try:
+        internship = await internships.aget(pk=pk)
+    except Internship.DoesNotExist:
+        return json_response({'detail': 'No Internship matches the given query.'}, status=404)
+    return json_response(InternshipSerializer(internship, context={'request': request}).data)
+
+
+@sparse_fields
+async def internship_search(request):
+    if request.method != 'GET':
+        return method_not_allowed(request)
+    context = {'request': request, 'summary': True}
+    query = request.GET.get('query', '')
+    category = request.GET.get('category')
+    company = request.GET.get('company')
+    internships = Internship.objects.select_related('company', 'category')
+    if category:
+        internships = internships.filter(category__name__icontains=category)
+    if company:
+        internships = internships.filter(company__name__icontains=company)
+
+    if not (query and search.is_enabled()):
+        if query:
+            internships = internships.filter(Q(title__icontains=query) | Q(description__icontains=query))
+        internships = InternshipSerializer.project_queryset(
+            internships, InternshipSerializer.selected_fields(request, summary=True), always=['created_at'],
+        )
+        results = [internship async for internship in internships]
+        return json_response(InternshipSerializer(results, many=True, context=context).data)
+
+    paginator = KeysetCursorPagination
+    paginated = paginator.cursor_query_param in request.GET or paginator.page_size_query_param in request.GET
+    cursor = None
+    if paginated and request.GET.get(paginator.cursor_query_param):
+        try:
+            cursor = search.decode_cursor(request.GET[paginator.cursor_query_param])
+        except search.InvalidCursor:
+            return json_response({'detail': paginator.invalid_cursor_message}, status=404)
+    hits, has_more = await sync_to_async(search.search)(
+        query,
+        queryset=internships if (category or company) else None,
+        limit=_page_size(request) if paginated else None,
+        cursor=cursor,
+    )
+    internships = InternshipSearchResultSerializer.project_queryset(
+        internships, InternshipSearchResultSerializer.selected_fields(request, summary=True),
+    )
+    objects = {internship.pk: internship async for internship in internships.filter(pk__in=[hit[0] for hit in hits])}
+    results = []
+    for pk, score, snippet in hits:
+        internship = objects.get(pk)
+        if internship is not None:
+            internship.search_highlight = snippet
+            results.append(internship)
+    data = InternshipSearchResultSerializer(results, many=True, context=context).data
+    if not paginated:
+        return json_response(data)
+
+    next_cursor, previous_cursor = search.page_cursors(hits, has_more, cursor)
+    url = request.build_absolute_uri()
+    return json_response({
+        'next': next_cursor and replace_query_param(url, paginator.cursor_query_param, next_cursor),
+        'previous': previous_cursor and replace_query_param(url, paginator.cursor_query_param, previous_cursor),
+        'results': data,
+    })
+
+
+async def about(request):
+    if request.method != 'GET':
+        return method_not_allowed(request)
+    counts = await sync_to_async(counters.get_counts)()
+    return json_response({
+        'internship_count': counts[StatCounter.INTERNSHIPS],
+        'application_count': counts[StatCounter.APPLICATIONS],
+        'user_count': counts[StatCounter.USERS],
+    })
+
+
+@login_required
+async def user_applications(request, user):
+    if request.method != 'GET':
+        return method_not_allowed(request)
+    applications = [application async for application in InternshipApplication.objects.filter(user=user)]
+    return json_response(InternshipApplicationSerializer(applications, many=True).data)
@@ -0,0 +1,141 @@
+"""
+Server-side response cache for the public internship catalog.
+
+Entries are keyed by scheme, host, path, query string and active
+language (responses carry absolute URLs built from the first two), and are
+namespaced by a catalog version. Saving or deleting an internship, company
+or category bumps the version (see ``main_app/signals.py``), which makes
+every older entry unreachable at once.
+"""
+import functools
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.translation import get_language
+from rest_framework.response import Response
+
+from . import streaming
+
+VERSION_KEY = 'catalog:version'
+HITS_KEY = 'catalog:hits'
+MISSES_KEY = 'catalog:misses'
+
+
+def get_cache():
+    return caches[getattr(settings, 'CATALOG_CACHE_ALIAS', 'default')]
+
+
+def get_version():
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate():
+    # A fresh timestamp rather than incr(): if the version key is ever evicted
+    # the next one still can't collide with a version used by older entries.
+    get_cache().set(VERSION_KEY, time.time_ns(), None)
+
+
+def response_key(request):
+    query = '&'.join(sorted(request.GET.urlencode().split('&')))
+    raw = f"{request.scheme}://{request.get_host()}{request.path}?{query}|{get_language()}"
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f"catalog:{get_version()}:{digest}"
+
+
+class RenderedJSON(bytes):
+    """
+    A cached response body that was streamed (see ``main_app/streaming.py``)
+    and is stored already rendered.
+    """
+
+
+def _cache_stream(chunks, key, timeout):
+    """
+    Pass ``chunks`` through and cache their concatenation once the stream
+    has been sent in full.
+    """
+    body = []
+    for chunk in chunks:
+        body.append(chunk)
+        yield chunk
+    get_cache().set(key, RenderedJSON(b''.join(body)), timeout)
+
+
+def _count(key):
+    """
+    Bump a hit/miss counter. ``incr()`` is atomic on locmem, Redis and
+    Memcached, but on ``FileBasedCache`` it is a read followed by a write,
+    so concurrent workers can lose increments: the stats are approximate.
+    """
+    cache = get_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def stats():
+    cache = get_cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / total if total else 0.0,
+    }
+
+
+def reset_stats():
+    get_cache().delete_many([HITS_KEY, MISSES_KEY])
+
+
+def cache_catalog_response(view_method):
+    """
+    Cache the data of successful responses of a catalog ``get`` handler.
+
+    The serialized ``response.data`` is stored, so a hit skips the queries
+    and serialization but still goes through content negotiation and
+    rendering. A streamed response is stored as its rendered body once it
+    has been sent in full, and served as is to requests that negotiate
+    plain JSON (and re-rendered for any other format). Responses carry
+    ``X-Cache: HIT`` or ``X-Cache: MISS``.
+    """
+    @functools.wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        cache = get_cache()
+        key = response_key(request)
+        data = cache.get(key)
+        if data is not None:
+            _count(HITS_KEY)
+            if isinstance(data, RenderedJSON) and streaming.can_stream(request):
+                response = HttpResponse(data, content_type='application/json')
+            elif isinstance(data, RenderedJSON):
+                # Negotiated something other than plain JSON: render the data again.
+                response = Response(json.loads(data))
+            else:
+                response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = view_method(view, request, *args, **kwargs)
+        if response.status_code == 200:
+            timeout = getattr(settings, 'CATALOG_CACHE_TIMEOUT', 300)
+            if response.streaming:
+                response.streaming_content = _cache_stream(response.streaming_content, key, timeout)
+            else:
+                cache.set(key, response.data, timeout)
+            _count(MISSES_KEY)
+            response['X-Cache'] = 'MISS'
+        return response
+    return wrapper
@@ -0,0 +1,204 @@
+"""
+Write-behind ingestion of contact form messages.
+
+``enqueue()`` appends a validated message as one JSON line to a spool file
+on local disk (``fdatasync``-ed, so an accepted message survives a crash)
+and returns without touching the database. A flusher thread in each
+process periodically claims the spool and inserts its messages with
+``bulk_create`` in batches, so a burst of submissions costs a few write
+transactions instead of one per message. Messages identical to one received
+within ``CONTACT_SPOOL_DEDUP_WINDOW`` seconds are dropped.
+
+Spool layout (``CONTACT_SPOOL_DIR``)::
+
+    spool.lock       writers hold it shared while appending, a claim holds it exclusively
+    contact.jsonl    the spool being appended to
+    <uuid>.batch     a claimed spool; flock-ed while it is being inserted
+
+A flusher claims the spool by renaming it to a ``.batch`` file. A batch
+whose flusher died is unlocked and is picked up by the next flush.
+"""
+import datetime
+import fcntl
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models.functions import Lower, Trim
+
+from .models import ContactMessage
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('first_name', 'last_name', 'email', 'phone_number', 'message')
+
+_flusher = None
+_flusher_pid = None
+_flusher_lock = threading.Lock()
+
+
+def spool_dir():
+    return str(getattr(settings, 'CONTACT_SPOOL_DIR', os.path.join(settings.BASE_DIR, '.spool')))
+
+
+def enabled():
+    return getattr(settings, 'CONTACT_INGEST_MODE', 'direct') == 'spool'
+
+
+def digest(data):
+    """
+    Identity of a message for deduplication: its fields, case- and space-normalized.
+    """
+    normalized = [' '.join(str(data.get(field, '')).split()).lower() for field in FIELDS]
+    return hashlib.sha256(json.dumps(normalized).encode()).hexdigest()
+
+
+def _locked(path, operation):
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    fcntl.flock(fd, operation)
+    return fd
+
+
+def enqueue(data):
+    """
+    Durably append the validated message ``data`` to the spool.
+    """
+    directory = spool_dir()
+    os.makedirs(directory, exist_ok=True)
+    line = json.dumps({
+        **{field: data.get(field, '') for field in FIELDS},
+        'received_at': time.time(),
+    }, ensure_ascii=False) + '\n'
+    lock = _locked(os.path.join(directory, 'spool.lock'), fcntl.LOCK_SH)
+    try:
+        fd = os.open(os.path.join(directory, 'contact.jsonl'), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, line.encode())
+            os.fdatasync(fd)
+        finally:
+            os.close(fd)
+    finally:
+        os.close(lock)
+    _ensure_flusher()
+
+
+def _claim(directory):
+    lock = _locked(os.path.join(directory, 'spool.lock'), fcntl.LOCK_EX)
+    try:
+        spool = os.path.join(directory, 'contact.jsonl')
+        if not os.path.exists(spool):
+            return
+        os.rename(spool, os.path.join(directory, f'{uuid.uuid4().hex}.batch'))
+    finally:
+        os.close(lock)
+
+
+def _read_batch(fd):
+    with os.fdopen(os.dup(fd), 'rb') as f:
+        for number, line in enumerate(f, 1):
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Only a write cut short by a crash can leave a partial line.
+                logger.warning("Skipping unreadable contact spool line %s", number)
+
+
+def _insert(records):
+    """
+    Insert ``records`` in batches, minus duplicates of each other or of
+    messages already stored within the dedup window. Returns the number inserted.
+    """
+    window = getattr(settings, 'CONTACT_SPOOL_DEDUP_WINDOW', 600)
+    batch_size = getattr(settings, 'CONTACT_SPOOL_BATCH_SIZE', 500)
+    records = sorted(records, key=lambda record: record.get('received_at', 0))
+    if not records:
+        return 0
+
+    since = datetime.datetime.fromtimestamp(records[0].get('received_at', 0) - window, tz=datetime.timezone.utc)
+    # Matched case-insensitively, like digest(); email__in is case-sensitive on SQLite.
+    emails = {str(record.get('email', '')).strip().lower() for record in records}
+    seen = {}
+    recent = ContactMessage.objects.alias(email_lower=Lower(Trim('email'))).filter(
+        created_at__gte=since, email_lower__in=emails,
+    )
+    for row in recent.values(*FIELDS, 'created_at').iterator():
+        seen[digest(row)] = row['created_at'].timestamp()
+
+    messages = []
+    for record in records:
+        key, received_at = digest(record), record.get('received_at', 0)
+        if key in seen and received_at - seen[key] < window:
+            continue
+        seen[key] = received_at
+        messages.append(ContactMessage(**{field: record.get(field, '') for field in FIELDS}))
+    with transaction.atomic():
+        ContactMessage.objects.bulk_create(messages, batch_size=batch_size)
+    return len(messages)
+
+
+def _flush_batch(path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return 0
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return 0  # another flusher has it
+        try:
+            if os.stat(path).st_ino != os.fstat(fd).st_ino:
+                return 0
+        except FileNotFoundError:
+            return 0  # flushed by someone else while we waited
+        inserted = _insert(_read_batch(fd))
+        os.unlink(path)
+        return inserted
+    finally:
+        os.close(fd)
+
+
+def flush():
+    """
+    Claim the spool and insert every unclaimed batch; returns the number of messages inserted.
+    """
+    directory = spool_dir()
+    if not os.path.isdir(directory):
+        return 0
+    _claim(directory)
+    return sum(_flush_batch(path) for path in sorted(glob.glob(os.path.join(directory, '*.batch'))))
+
+
+def _run(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            flush()
+        except Exception:
+            logger.exception("Could not flush the contact spool")
+        finally:
+            close_old_connections()
+
+
+def _ensure_flusher():
+    """
+    Start this process's flusher thread, unless ``CONTACT_SPOOL_FLUSH_INTERVAL``
+    is 0 (flushing is left to ``manage.py flush_contact_spool``).
+    """
+    global _flusher, _flusher_pid
+    interval = getattr(settings, 'CONTACT_SPOOL_FLUSH_INTERVAL', 1.0)
+    if not interval or (_flusher_pid == os.getpid() and _flusher.is_alive()):
+        return
+    with _flusher_lock:
+        if _flusher_pid == os.getpid() and _flusher.is_alive():
+            return
+        _flusher = threading.Thread(target=_run, args=(interval,), name='contact-spool', daemon=True)
+        _flusher.start()
+        _flusher_pid = os.getpid()
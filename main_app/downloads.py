@@ -0,0 +1,147 @@
+"""
+Serving private files (application CVs) once the caller has been authorized.
+
+By default the file is sent by Django: as a ``FileResponse``, which WSGI
+servers with ``wsgi.file_wrapper`` (gunicorn) send with ``sendfile()``
+instead of reading it through Python, with single byte ranges and
+conditional requests handled here. With ``PRIVATE_FILES_SERVER`` set, the
+response only carries an ``X-Accel-Redirect`` (nginx) or ``X-Sendfile``
+(Apache, lighttpd) header and the front-end server sends the file, ranges
+and all.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class FileRange:
+    """
+    ``length`` bytes of ``file`` from ``start``. Exposes the file's
+    descriptor (positioned at ``start``), so ``sendfile()`` can be used
+    with the response's ``Content-Length`` as the byte count.
+    """
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size else b''
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    The ``(start, end)`` (inclusive) of a single ``bytes=`` range in
+    ``header``; ``None`` when it is absent, malformed or lists several
+    ranges (the whole file is sent), ``False`` when it cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # Suffix range: the last N bytes.
+        length = int(last)
+        return (max(size - length, 0), size - 1) if length and size else False
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    return (start, end) if start < size else False
+
+
+def _if_range_matches(header, etag, mtime):
+    if header is None:
+        return True
+    if header.startswith(('"', 'W/')):
+        return header == etag
+    return parse_http_date_safe(header) == int(mtime)
+
+
+def _disposition(filename, as_attachment):
+    kind = 'attachment' if as_attachment else 'inline'
+    try:
+        filename.encode('ascii')
+        return f'{kind}; filename="{filename}"'
+    except UnicodeEncodeError:
+        return f"{kind}; filename*=utf-8''{quote(filename)}"
+
+
+def _handoff(path, content_type, disposition):
+    response = HttpResponse(content_type=content_type)
+    response['Content-Disposition'] = disposition
+    server = settings.PRIVATE_FILES_SERVER
+    if server == 'x-accel-redirect':
+        relative = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, '/')
+        response['X-Accel-Redirect'] = quote(settings.PRIVATE_FILES_ACCEL_PREFIX.rstrip('/') + '/' + relative)
+    elif server == 'x-sendfile':
+        response['X-Sendfile'] = path
+    else:
+        raise ValueError(f"Unknown PRIVATE_FILES_SERVER {server!r}.")
+    return response
+
+
+def serve_file(request, path, filename, as_attachment=True):
+    """
+    Response sending the file at ``path`` as ``filename``.
+
+    Answers ``If-None-Match``/``If-Modified-Since`` (304) and
+    ``If-Match``/``If-Unmodified-Since`` (412), and a single ``Range``
+    with 206 or 416, honouring ``If-Range``.
+    """
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    disposition = _disposition(filename, as_attachment)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise Http404("File not found.")
+    if getattr(settings, 'PRIVATE_FILES_SERVER', None):
+        return _handoff(path, content_type, disposition)
+
+    size = stat.st_size
+    etag = f'"{int(stat.st_mtime):x}-{size:x}"'
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is not None:
+        return response
+
+    byte_range = None
+    if request.method == 'GET' and _if_range_matches(request.headers.get('If-Range'), etag, stat.st_mtime):
+        byte_range = parse_range(request.headers.get('Range'), size)
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+    elif byte_range is None:
+        response = FileResponse(open(path, 'rb'), content_type=content_type)
+    else:
+        start, end = byte_range
+        response = FileResponse(FileRange(open(path, 'rb'), start, end - start + 1), content_type=content_type,
+                                status=206)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = end - start + 1
+    response['Content-Disposition'] = disposition
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    # The file is private: shared caches must not keep it.
+    response['Cache-Control'] = 'private, no-cache'
+    return response
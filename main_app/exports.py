@@ -0,0 +1,134 @@
+"""
+Streaming CSV/NDJSON export of internship applications.
+
+Rows are read as tuples with a server-side iterator and written out one at
+a time, so memory stays flat no matter how many applications match.
+"""
+import csv
+import datetime
+import json
+
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils import timezone
+
+from .models import InternshipApplication
+
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+# (output column, queryset lookup)
+COLUMNS = [
+    ('id', 'id'),
+    ('status', 'status'),
+    ('applied_at', 'applied_at'),
+    ('description', 'description'),
+    ('file', 'file'),
+    ('user_id', 'user_id'),
+    ('user_email', 'user__email'),
+    ('user_first_name', 'user__first_name'),
+    ('user_last_name', 'user__last_name'),
+    ('internship_id', 'internship_id'),
+    ('internship_title', 'internship__title'),
+    ('company_id', 'internship__company_id'),
+    ('company_name', 'internship__company__name'),
+]
+
+CHUNK_SIZE = 2000
+
+# Text cells starting with these are read as formulas by spreadsheet applications.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class InvalidFilter(ValueError):
+    pass
+
+
+def _parse_moment(value, name, end_of_day=False):
+    try:
+        moment = parse_datetime(value)
+        day = parse_date(value) if moment is None else None
+    except ValueError:
+        moment = day = None
+    if moment is None:
+        if day is None:
+            raise InvalidFilter(f"'{name}' must be an ISO date or datetime.")
+        moment = datetime.datetime.combine(day, datetime.time.max if end_of_day else datetime.time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def _parse_id(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise InvalidFilter(f"'{name}' must be an integer id.")
+
+
+def filter_applications(applications, status=None, internship=None, company=None, date_from=None, date_to=None):
+    """
+    Narrow ``applications`` by the given filters.
+
+    Filter values may be raw strings (query params, command options);
+    invalid ones raise ``InvalidFilter``.
+    """
+    if status:
+        if status not in dict(InternshipApplication.STATUS_CHOICES):
+            raise InvalidFilter(f"'status' must be one of: {', '.join(dict(InternshipApplication.STATUS_CHOICES))}.")
+        applications = applications.filter(status=status)
+    if internship:
+        applications = applications.filter(internship_id=_parse_id(internship, 'internship'))
+    if company:
+        applications = applications.filter(internship__company_id=_parse_id(company, 'company'))
+    if date_from:
+        applications = applications.filter(applied_at__gte=_parse_moment(date_from, 'date_from'))
+    if date_to:
+        applications = applications.filter(applied_at__lte=_parse_moment(date_to, 'date_to', end_of_day=True))
+    return applications
+
+
+def get_queryset(**filters):
+    """
+    Applications matching ``filters`` (see ``filter_applications``), as tuples in ``COLUMNS`` order.
+    """
+    applications = filter_applications(InternshipApplication.objects.all(), **filters)
+    return applications.order_by('pk').values_list(*(lookup for _, lookup in COLUMNS))
+
+
+def _rows(queryset, chunk_size):
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield [value.isoformat() if hasattr(value, 'isoformat') else value for value in row]
+
+
+class _Echo:
+    """
+    File-like object whose write() returns the value, for csv.writer.
+    """
+    def write(self, value):
+        return value
+
+
+def _escape_formula(value):
+    # Applicants write the description: a leading quote keeps a spreadsheet from evaluating it.
+    return "'" + value if isinstance(value, str) and value.startswith(FORMULA_PREFIXES) else value
+
+
+def iter_csv(queryset, chunk_size=CHUNK_SIZE):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in COLUMNS])
+    for row in _rows(queryset, chunk_size):
+        yield writer.writerow([_escape_formula(value) for value in row])
+
+
+def iter_ndjson(queryset, chunk_size=CHUNK_SIZE):
+    names = [name for name, _ in COLUMNS]
+    for row in _rows(queryset, chunk_size):
+        yield json.dumps(dict(zip(names, row)), ensure_ascii=False) + '\n'
+
+
+def iter_export(export_format, queryset, chunk_size=CHUNK_SIZE):
+    if export_format == 'csv':
+        return iter_csv(queryset, chunk_size)
+    return iter_ndjson(queryset, chunk_size)
@@ -0,0 +1,188 @@
+"""
+Resized WebP/JPEG variants of ``Internship.image``.
+
+``render_variants`` only touches storage, so it can run in any thread or
+process. The result is stored in ``Internship.image_variants``::
+
+    {'source': 'internships/a.jpeg',
+     'thumbnail': {'width': 320, 'height': 200, 'webp': '<name>', 'jpeg': '<name>'}, ...}
+
+New uploads are rendered in a background thread after the saving
+transaction commits; ``manage.py generate_image_variants`` (re)renders
+everything across a process pool.
+"""
+import hashlib
+import io
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.db.models import Q
+from PIL import Image, ImageOps
+
+from . import cache
+from .models import Internship
+
+logger = logging.getLogger(__name__)
+
+# name -> maximum width in pixels; images are never upscaled.
+VARIANTS = {
+    'thumbnail': 320,
+    'medium': 768,
+    'large': 1280,
+}
+
+FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+VARIANTS_DIR = 'internships/variants'
+
+_executor = None
+
+
+def variant_name(source_name, variant, ext):
+    digest = hashlib.sha1(source_name.encode()).hexdigest()[:12]
+    stem = posixpath.splitext(posixpath.basename(source_name))[0]
+    return f"{VARIANTS_DIR}/{stem}-{digest}/{variant}.{ext}"
+
+
+def _flatten(image):
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def render_variants(source_name, storage=None):
+    """
+    Write every variant of ``source_name`` and return the ``image_variants`` dict.
+    """
+    storage = storage or default_storage
+    with storage.open(source_name, 'rb') as source:
+        original = Image.open(source)
+        original = ImageOps.exif_transpose(original)
+        original = _flatten(original)
+
+    variants = {'source': source_name}
+    for variant, max_width in VARIANTS.items():
+        image = original
+        if original.width > max_width:
+            height = round(original.height * max_width / original.width)
+            image = original.resize((max_width, height), Image.LANCZOS)
+        entry = {'width': image.width, 'height': image.height}
+        for ext, (pil_format, options) in FORMATS.items():
+            buffer = io.BytesIO()
+            image.save(buffer, pil_format, **options)
+            name = variant_name(source_name, variant, ext)
+            if storage.exists(name):
+                storage.delete(name)
+            entry[ext] = storage.save(name, ContentFile(buffer.getvalue()))
+        variants[variant] = entry
+    return variants
+
+
+def variant_files(image_variants):
+    """
+    Storage names of every file listed in ``image_variants``.
+    """
+    return {entry[ext] for variant, entry in (image_variants or {}).items()
+            if variant in VARIANTS for ext in FORMATS if ext in entry}
+
+
+def delete_variants(image_variants, keep=(), storage=None):
+    """
+    Delete the files of superseded ``image_variants``, except those in
+    ``keep``. Variant names only depend on the source image, so nothing is
+    deleted while another internship still uses that source.
+    """
+    source_name = (image_variants or {}).get('source')
+    if source_name and Internship.objects.filter(Q(image=source_name) | Q(image_variants__source=source_name)).exists():
+        return
+    storage = storage or default_storage
+    for name in variant_files(image_variants) - set(keep):
+        try:
+            storage.delete(name)
+        except OSError:
+            logger.warning("Could not delete image variant %s", name)
+
+
+def store_variants(pk, source_name, variants):
+    """
+    Save rendered variants unless the internship's image changed meanwhile,
+    and delete the files of the variants they replace.
+    """
+    previous = Internship.objects.filter(pk=pk).values_list('image_variants', flat=True).first()
+    updated = Internship.objects.filter(pk=pk, image=source_name).update(image_variants=variants)
+    if updated:
+        cache.invalidate()
+        delete_variants(previous, keep=variant_files(variants))
+    return updated
+
+
+def generate_for_internship(pk, source_name):
+    try:
+        store_variants(pk, source_name, render_variants(source_name))
+    except Exception:
+        logger.exception("Could not render image variants for internship %s (%s)", pk, source_name)
+    finally:
+        connection.close()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=getattr(settings, 'IMAGE_VARIANT_THREADS', 1),
+                                       thread_name_prefix='image-variants')
+    return _executor
+
+
+def schedule(internship):
+    """
+    Render variants for ``internship`` in the background once the current transaction commits.
+    """
+    pk, source_name = internship.pk, internship.image.name
+    transaction.on_commit(lambda: _get_executor().submit(generate_for_internship, pk, source_name))
+
+
+def needs_variants(internship):
+    return bool(internship.image) and internship.image_variants.get('source') != internship.image.name
+
+
+def variant_urls(image_variants, source_name, request=None):
+    """
+    Public URLs of the stored variants, plus ``srcset`` strings per format;
+    ``None`` when they were not rendered from ``source_name`` (the image
+    was replaced and its variants are still being rendered).
+    """
+    if not image_variants or not source_name or image_variants.get('source') != source_name:
+        return None
+
+    def url(name):
+        value = default_storage.url(name)
+        return request.build_absolute_uri(value) if request is not None else value
+
+    data = {}
+    srcset = {ext: [] for ext in FORMATS}
+    widths = set()
+    for variant in VARIANTS:
+        entry = image_variants.get(variant)
+        if not entry:
+            continue
+        data[variant] = {'width': entry['width'], 'height': entry['height']}
+        for ext in FORMATS:
+            data[variant][ext] = url(entry[ext])
+        # Small originals give several variants of the same width; list each width once.
+        if entry['width'] not in widths:
+            widths.add(entry['width'])
+            for ext in FORMATS:
+                srcset[ext].append(f"{data[variant][ext]} {entry['width']}w")
+    data['srcset'] = {ext: ', '.join(items) for ext, items in srcset.items()}
+    return data
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from main_app import cache
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters of the internship catalog response cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Reset the counters after printing them.")
+        parser.add_argument('--invalidate', action='store_true', help="Drop every cached catalog response.")
+
+    def handle(self, *args, **options):
+        stats = cache.stats()
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} hit_rate={stats['hit_rate']:.1%}"
+        )
+        if options['reset']:
+            cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
+        if options['invalidate']:
+            cache.invalidate()
+            self.stdout.write(self.style.SUCCESS("Catalog cache invalidated."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from main_app import contact_spool
+
+
+class Command(BaseCommand):
+    help = (
+        "Insert the spooled contact messages now, including batches left by a process that died. "
+        "Run it from cron when CONTACT_SPOOL_FLUSH_INTERVAL is 0."
+    )
+
+    def handle(self, *args, **options):
+        inserted = contact_spool.flush()
+        self.stdout.write(self.style.SUCCESS(f"Inserted {inserted} contact message(s)."))
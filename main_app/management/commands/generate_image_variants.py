@@ -0,0 +1,64 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from main_app import cache, images
+from main_app.models import Internship
+
+
+def _render(source_name):
+    try:
+        return source_name, images.render_variants(source_name), None
+    except Exception as e:
+        return source_name, None, str(e)
+
+
+class Command(BaseCommand):
+    help = "Render thumbnail/medium/large WebP and JPEG variants of internship images across a process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Number of worker processes.")
+        parser.add_argument('--force', action='store_true',
+                            help="Re-render images whose variants are already up to date.")
+
+    def handle(self, *args, **options):
+        # source image name -> internships using it; each file is rendered once.
+        jobs = {}
+        rows = (
+            Internship.objects.exclude(image='').exclude(image__isnull=True)
+            .values_list('pk', 'image', 'image_variants').iterator()
+        )
+        for pk, name, variants in rows:
+            if options['force'] or (variants or {}).get('source') != name:
+                jobs.setdefault(name, []).append(pk)
+        if not jobs:
+            self.stdout.write("All image variants are up to date.")
+            return
+
+        started = time.monotonic()
+        done = failed = 0
+        # Workers only read and write media files; the parent process does
+        # every database write, so close connections before forking.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            futures = [pool.submit(_render, name) for name in jobs]
+            for future in as_completed(futures):
+                source_name, variants, error = future.result()
+                if error:
+                    failed += 1
+                    self.stderr.write(f"{source_name}: {error}")
+                    continue
+                for pk in jobs[source_name]:
+                    images.store_variants(pk, source_name, variants)
+                done += 1
+
+        if done:
+            cache.invalidate()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered variants for {done} image(s) in {time.monotonic() - started:.2f}s"
+            f" with {options['workers']} worker(s); {failed} failed."
+        ))
@@ -0,0 +1,223 @@
+import csv
+import io
+import itertools
+import json
+import sys
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import URLValidator
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from core import counters
+from main_app import cache, search
+from main_app.models import Company, Internship, InternshipCategory, StatCounter
+
+UPDATE_FIELDS = ['company', 'category', 'title', 'published', 'description', 'full_description', 'apply_url']
+
+
+class RowError(ValueError):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream internships from a CSV or JSONL file and upsert them in chunks. "
+        "Rows are matched on 'external_id'; companies and categories are looked up "
+        "(and created) by name."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to import, or '-' for stdin.")
+        parser.add_argument('--format', choices=['csv', 'jsonl'],
+                            help="Input format (default: guessed from the file extension).")
+        parser.add_argument('--chunk-size', type=int, default=1000,
+                            help="Rows written per transaction.")
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or self.guess_format(options['path'])
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        self.company_ids = {}
+        self.category_ids = {}
+        totals = {'rows': 0, 'created': 0, 'updated': 0, 'skipped': 0}
+        started = time.monotonic()
+
+        with self.open_input(options['path']) as stream:
+            rows = self.read_rows(stream, fmt)
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                created, updated, skipped = self.import_chunk(chunk)
+                totals['rows'] += len(chunk)
+                totals['created'] += created
+                totals['updated'] += updated
+                totals['skipped'] += skipped
+                if options['verbosity'] > 1:
+                    self.stdout.write(f"{totals['rows']} rows, {self.rate(totals['rows'], started):.0f} rows/s")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{totals['rows']} rows in {elapsed:.2f}s ({self.rate(totals['rows'], started):.0f} rows/s): "
+            f"{totals['created']} created, {totals['updated']} updated, {totals['skipped']} skipped."
+        ))
+
+    @staticmethod
+    def rate(rows, started):
+        return rows / max(time.monotonic() - started, 1e-9)
+
+    @staticmethod
+    def guess_format(path):
+        if path.endswith('.csv'):
+            return 'csv'
+        if path.endswith(('.jsonl', '.ndjson')):
+            return 'jsonl'
+        raise CommandError("Cannot guess the input format, pass --format.")
+
+    @staticmethod
+    def open_input(path):
+        if path == '-':
+            return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+        try:
+            return open(path, encoding='utf-8', newline='')
+        except OSError as e:
+            raise CommandError(str(e))
+
+    def read_rows(self, stream, fmt):
+        """
+        Yield ``(line_number, row_dict)`` one at a time.
+        """
+        if fmt == 'csv':
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                row = e
+            yield line_number, row
+
+    def clean_row(self, row):
+        if not isinstance(row, dict):
+            raise RowError(f"invalid JSON ({row})")
+
+        def text(name, required=False, max_length=None):
+            value = row.get(name)
+            value = '' if value is None else str(value).strip()
+            if required and not value:
+                raise RowError(f"'{name}' is required")
+            if max_length and len(value) > max_length:
+                raise RowError(f"'{name}' is longer than {max_length} characters")
+            return value
+
+        cleaned = {
+            'external_id': text('external_id', max_length=100) or None,
+            'title': text('title', required=True, max_length=255),
+            'company': text('company', required=True, max_length=50),
+            'category': text('category', required=True, max_length=20),
+            'description': text('description'),
+            'full_description': text('full_description'),
+            'apply_url': text('apply_url') or None,
+            'published': None,
+        }
+        published = text('published')
+        if published:
+            try:
+                cleaned['published'] = parse_date(published)
+            except ValueError:
+                cleaned['published'] = None
+            if cleaned['published'] is None:
+                raise RowError(f"'published' is not a YYYY-MM-DD date: {published!r}")
+        if cleaned['apply_url']:
+            try:
+                URLValidator()(cleaned['apply_url'])
+            except ValidationError:
+                raise RowError(f"'apply_url' is not a valid URL: {cleaned['apply_url']!r}")
+        return cleaned
+
+    def resolve_names(self, model, cache_map, names):
+        """
+        Fill ``cache_map`` (name -> id) for ``names``, creating missing rows in one batch.
+        """
+        missing = {name for name in names if name not in cache_map}
+        if not missing:
+            return
+        for name, pk in model.objects.filter(name__in=missing).order_by('-pk').values_list('name', 'pk'):
+            cache_map[name] = pk
+        created = model.objects.bulk_create([model(name=name) for name in missing if name not in cache_map])
+        for obj in created:
+            cache_map[obj.name] = obj.pk
+
+    def import_chunk(self, chunk):
+        rows = []
+        skipped = 0
+        for line_number, raw in chunk:
+            try:
+                rows.append(self.clean_row(raw))
+            except RowError as e:
+                skipped += 1
+                self.stderr.write(f"line {line_number}: skipped, {e}")
+
+        # Last occurrence of an external_id within a chunk wins.
+        keyed = {}
+        anonymous = []
+        for row in rows:
+            if row['external_id']:
+                keyed[row['external_id']] = row
+            else:
+                anonymous.append(row)
+        rows = list(keyed.values()) + anonymous
+
+        with transaction.atomic():
+            self.resolve_names(Company, self.company_ids, {row['company'] for row in rows})
+            self.resolve_names(InternshipCategory, self.category_ids, {row['category'] for row in rows})
+            existing = dict(
+                Internship.objects.filter(external_id__in=keyed).values_list('external_id', 'pk')
+            )
+
+            upserts, inserts = [], []
+            for row in rows:
+                internship = Internship(
+                    external_id=row['external_id'],
+                    company_id=self.company_ids[row['company']],
+                    category_id=self.category_ids[row['category']],
+                    title=row['title'],
+                    published=row['published'],
+                    description=row['description'],
+                    full_description=row['full_description'],
+                    apply_url=row['apply_url'],
+                )
+                (upserts if internship.external_id else inserts).append(internship)
+
+            if upserts:
+                Internship.objects.bulk_create(
+                    upserts,
+                    update_conflicts=True,
+                    unique_fields=['external_id'],
+                    update_fields=UPDATE_FIELDS,
+                )
+            if inserts:
+                Internship.objects.bulk_create(inserts)
+            created = len(upserts) - len(existing) + len(inserts)
+            if created:
+                counters.increment(StatCounter.INTERNSHIPS, created)
+            if upserts or inserts:
+                # Each chunk is visible once committed, so drop cached pages then.
+                transaction.on_commit(cache.invalidate)
+
+            # bulk_create sends no signals, so index the chunk here.
+            search.index_internships(
+                Internship.objects.filter(external_id__in=keyed)
+                | Internship.objects.filter(pk__in=[obj.pk for obj in inserts])
+            )
+
+        return created, len(existing), skipped
@@ -0,0 +1,24 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from main_app import uploads
+from main_app.models import UploadSession
+
+
+class Command(BaseCommand):
+    help = "Delete upload sessions that were never completed, together with their partial files."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24,
+                            help="Abandon incomplete sessions older than this many hours.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - datetime.timedelta(hours=options['hours'])
+        stale = UploadSession.objects.filter(blob='', created_at__lt=cutoff)
+        pruned = 0
+        for session in stale.iterator():
+            uploads.abort_session(session)
+            pruned += 1
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} abandoned upload session(s)."))
@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from main_app import search
+
+
+class Command(BaseCommand):
+    help = "Repopulate the internship full-text search index from the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help="Number of internships indexed per statement.")
+
+    def handle(self, *args, **options):
+        if not search.is_enabled():
+            raise CommandError("Full-text search is only available on the SQLite backend.")
+        started = time.monotonic()
+        total = search.rebuild_index(batch_size=options['batch_size'])
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} internships in {elapsed:.2f}s."))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from core import counters
+
+
+class Command(BaseCommand):
+    help = "Recount internships, applications and users and fix drifted statistics counters."
+
+    def handle(self, *args, **options):
+        drift = counters.reconcile()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("All counters are accurate."))
+            return
+        for name, (stored, actual) in drift.items():
+            self.stdout.write(f"{name}: {stored} -> {actual}")
+        self.stdout.write(self.style.SUCCESS(f"Fixed {len(drift)} counter(s)."))
@@ -0,0 +1,276 @@
+import bisect
+import contextlib
+import datetime
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max
+from django.utils import timezone
+
+from core import counters
+from main_app import cache, search
+from main_app.models import Company, ContactMessage, Internship, InternshipApplication, InternshipCategory
+from users.models import UserProfile
+
+WORDS = (
+    "python django api backend frontend react data analyst intern team project product design research "
+    "mentor remote office flexible schedule learning growth database cloud mobile testing security "
+    "marketing finance sales support customer students graduates skills experience requirements "
+    "responsibilities build maintain develop deploy review document collaborate tashkent samarkand "
+    "english russian uzbek paid unpaid months weeks hours junior senior engineer manager"
+).split()
+
+FIRST_NAMES = ["Ali", "Vali", "Aziz", "Dilnoza", "Madina", "Jasur", "Nodira", "Sardor", "Kamola", "Bekzod",
+               "Anna", "Ivan", "Olga", "Timur", "Laylo", "Shahzod", "Gulnora", "Rustam", "Malika", "Otabek"]
+LAST_NAMES = ["Karimov", "Aliyev", "Yusupova", "Rahimov", "Tursunova", "Ivanov", "Petrova", "Saidov",
+              "Nazarova", "Ergashev", "Xolmatov", "Qodirova", "Abdullayev", "Mirzayeva", "Sobirov"]
+
+# Most applications are already decided; the review queue is a small slice.
+STATUS_WEIGHTS = {'pending': 15, 'approved': 20, 'rejected': 65}
+
+CORPUS_SIZE = 1 << 20
+
+
+def _hash_passwords(password, count):
+    return [make_password(password) for _ in range(count)]
+
+
+class Text:
+    """
+    Random-looking text of a requested size, sliced out of one pre-built corpus.
+    """
+    def __init__(self, rng):
+        self.rng = rng
+        words = rng.choices(WORDS, k=CORPUS_SIZE // 6)
+        self.corpus = ' '.join(words)
+
+    def __call__(self, low, high):
+        # Log-uniform length: many short texts, a long tail of big ones.
+        size = int(low * (high / low) ** self.rng.random())
+        start = self.rng.randrange(0, len(self.corpus) - size - 1)
+        start = self.corpus.find(' ', start) + 1
+        return self.corpus[start:start + size].strip().capitalize()
+
+
+class Zipf:
+    """
+    Draw items with probability proportional to 1 / rank ** exponent.
+    """
+    def __init__(self, rng, items, exponent=1.1):
+        self.rng = rng
+        self.items = list(items)
+        self.rng.shuffle(self.items)
+        self.cumulative = list(itertools.accumulate(1 / (rank ** exponent) for rank in range(1, len(self.items) + 1)))
+
+    def __call__(self):
+        return self.items[bisect.bisect(self.cumulative, self.rng.random() * self.cumulative[-1])]
+
+
+@contextlib.contextmanager
+def explicit_timestamps(*fields):
+    """
+    Let bulk_create keep the ``auto_now_add`` values we set, to spread rows over time.
+    """
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the database with synthetic companies, categories, internships, users (with profiles), "
+        "applications and contact messages for scale testing. Distributions are skewed: a few companies, "
+        "internships and users account for most rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--companies', type=int, default=500)
+        parser.add_argument('--categories', type=int, default=40)
+        parser.add_argument('--internships', type=int, default=50000)
+        parser.add_argument('--users', type=int, default=20000)
+        parser.add_argument('--applications', type=int, default=1000000)
+        parser.add_argument('--contacts', type=int, default=20000)
+        parser.add_argument('--days', type=int, default=365,
+                            help="Spread creation dates over this many past days.")
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help="Rows per bulk_create batch.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Processes used to compute password hashes.")
+        parser.add_argument('--password', default='seed-password',
+                            help="Password of every generated user.")
+        parser.add_argument('--distinct-hashes', type=int, default=32,
+                            help="Number of distinct (salted) password hashes shared out among the users.")
+        parser.add_argument('--seed', type=int, default=None, help="Random seed, for repeatable data.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be positive.")
+        if options['internships'] and not (options['companies'] and options['categories']):
+            raise CommandError("Internships need at least one company and one category.")
+        if options['applications'] and not (options['internships'] and options['users']):
+            raise CommandError("Applications need at least one internship and one user.")
+
+        self.rng = random.Random(options['seed'])
+        self.text = Text(self.rng)
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        self.days = max(options['days'], 1)
+        self.total_rows = 0
+        self.started = time.monotonic()
+
+        password_hashes = self.hash_passwords(options)
+        company_ids = self.create_named(Company, 'Company', options['companies'], 50, "companies")
+        category_ids = self.create_named(InternshipCategory, 'Category', options['categories'], 20, "categories")
+        internship_ids = self.create_internships(options['internships'], company_ids, category_ids)
+        user_ids = self.create_users(options['users'], password_hashes)
+        self.create_applications(options['applications'], internship_ids, user_ids)
+        self.create_contacts(options['contacts'])
+
+        step = time.monotonic()
+        search.rebuild_index()
+        counters.reconcile()
+        cache.invalidate()
+        self.log(f"search index and counters rebuilt in {time.monotonic() - step:.1f}s")
+
+        elapsed = time.monotonic() - self.started
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {self.total_rows} rows in {elapsed:.1f}s ({self.total_rows / max(elapsed, 1e-9):.0f} rows/s). "
+            f"Users log in with password {options['password']!r}."
+        ))
+
+    def log(self, message):
+        self.stdout.write(f"[{time.monotonic() - self.started:7.1f}s] {message}")
+
+    def moment(self):
+        # Skewed towards recent dates, like a growing site.
+        age = self.days * (self.rng.random() ** 2)
+        return self.now - datetime.timedelta(days=age)
+
+    def insert(self, model, objects, label):
+        count = 0
+        step = time.monotonic()
+        for batch in batched(objects, self.batch_size):
+            model.objects.bulk_create(batch)
+            count += len(batch)
+        self.total_rows += count
+        self.log(f"{count} {label} ({count / max(time.monotonic() - step, 1e-9):.0f} rows/s)")
+        return count
+
+    def hash_passwords(self, options):
+        if not options['users']:
+            return []
+        count = max(1, min(options['distinct_hashes'], options['users']))
+        workers = max(1, min(options['workers'], count))
+        step = time.monotonic()
+        # Hashing is CPU-bound; forked workers need no database connection.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shares = [count // workers + (1 if i < count % workers else 0) for i in range(workers)]
+            hashes = [h for chunk in pool.map(_hash_passwords, [options['password']] * workers, shares) for h in chunk]
+        self.log(f"{len(hashes)} password hashes on {workers} process(es) in {time.monotonic() - step:.1f}s")
+        return hashes
+
+    def create_named(self, model, prefix, count, max_length, label):
+        start = (model.objects.aggregate(Max('pk'))['pk__max'] or 0) + 1
+        self.insert(model, (model(name=f"{prefix} {start + i}"[:max_length]) for i in range(count)), label)
+        return list(model.objects.filter(pk__gte=start).values_list('pk', flat=True))
+
+    def create_internships(self, count, company_ids, category_ids):
+        if not count:
+            return []
+        start = (Internship.objects.aggregate(Max('pk'))['pk__max'] or 0) + 1
+        company = Zipf(self.rng, company_ids)
+        category = Zipf(self.rng, category_ids, exponent=0.8)
+        rows = (
+            Internship(
+                company_id=company(),
+                category_id=category(),
+                title=self.text(20, 120)[:255],
+                published=self.moment().date() if self.rng.random() < 0.8 else None,
+                description=self.text(80, 400),
+                full_description=self.text(800, 8000),
+                apply_url=f"https://example.com/jobs/{start + i}" if self.rng.random() < 0.3 else None,
+                created_at=self.moment(),
+            )
+            for i in range(count)
+        )
+        with explicit_timestamps(Internship._meta.get_field('created_at')):
+            self.insert(Internship, rows, "internships")
+        return list(Internship.objects.filter(pk__gte=start).values_list('pk', flat=True))
+
+    def create_users(self, count, password_hashes):
+        if not count:
+            return []
+        start = (User.objects.aggregate(Max('pk'))['pk__max'] or 0) + 1
+        rows = (
+            User(
+                username=f"seed{start + i}",
+                email=f"seed{start + i}@example.com",
+                first_name=self.rng.choice(FIRST_NAMES),
+                last_name=self.rng.choice(LAST_NAMES),
+                password=password_hashes[i % len(password_hashes)],
+                date_joined=self.moment(),
+            )
+            for i in range(count)
+        )
+        self.insert(User, rows, "users")
+        users = User.objects.filter(pk__gte=start).values_list('pk', 'first_name', 'last_name', 'email')
+        self.insert(UserProfile, (
+            UserProfile(user_id=pk, first_name=first_name, last_name=last_name, email=email,
+                        phone_number=f"+99890{self.rng.randrange(10 ** 7):07d}")
+            for pk, first_name, last_name, email in users.iterator()
+        ), "profiles")
+        return list(User.objects.filter(pk__gte=start).values_list('pk', flat=True))
+
+    def create_applications(self, count, internship_ids, user_ids):
+        if not count:
+            return
+        internship = Zipf(self.rng, internship_ids)
+        user = Zipf(self.rng, user_ids, exponent=0.9)
+        statuses = list(STATUS_WEIGHTS)
+        weights = list(itertools.accumulate(STATUS_WEIGHTS.values()))
+        rows = (
+            InternshipApplication(
+                user_id=user(),
+                internship_id=internship(),
+                file=f"apply/seed/cv-{self.rng.randrange(5000)}.pdf",
+                description=self.text(50, 1500) if self.rng.random() < 0.7 else None,
+                status=self.rng.choices(statuses, cum_weights=weights)[0],
+                applied_at=self.moment(),
+            )
+            for _ in range(count)
+        )
+        with explicit_timestamps(InternshipApplication._meta.get_field('applied_at')):
+            self.insert(InternshipApplication, rows, "applications")
+
+    def create_contacts(self, count):
+        rows = (
+            ContactMessage(
+                first_name=self.rng.choice(FIRST_NAMES),
+                last_name=self.rng.choice(LAST_NAMES),
+                email=f"contact{self.rng.randrange(10 ** 6)}@example.com",
+                phone_number=f"+99890{self.rng.randrange(10 ** 7):07d}",
+                message=self.text(30, 2000),
+                created_at=self.moment(),
+            )
+            for _ in range(count)
+        )
+        with explicit_timestamps(ContactMessage._meta.get_field('created_at')):
+            self.insert(ContactMessage, rows, "contact messages")
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0003_alter_company_name_alter_contactmessage_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['created_at', 'id'], name='internship_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+def create_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS main_app_internship_fts USING fts5("
+        "title, description, full_description, company_name, category_name, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    schema_editor.execute(
+        "INSERT INTO main_app_internship_fts "
+        "(rowid, title, description, full_description, company_name, category_name) "
+        "SELECT i.id, i.title, i.description, i.full_description, c.name, g.name "
+        "FROM main_app_internship i "
+        "INNER JOIN main_app_company c ON c.id = i.company_id "
+        "INNER JOIN main_app_internshipcategory g ON g.id = i.category_id"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS main_app_internship_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0004_internship_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_counters(apps, schema_editor):
+    StatCounter = apps.get_model('main_app', 'StatCounter')
+    counts = {
+        'internships': apps.get_model('main_app', 'Internship').objects.count(),
+        'applications': apps.get_model('main_app', 'InternshipApplication').objects.count(),
+        'users': apps.get_model(settings.AUTH_USER_MODEL).objects.count(),
+    }
+    StatCounter.objects.bulk_create(StatCounter(name=name, value=value) for name, value in counts.items())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('main_app', '0005_internship_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='Name')),
+                ('value', models.BigIntegerField(default=0, verbose_name='Value')),
+            ],
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
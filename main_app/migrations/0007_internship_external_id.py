@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0006_statcounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='internship',
+            name='external_id',
+            field=models.CharField(blank=True, max_length=100, null=True, unique=True, verbose_name='External ID'),
+        ),
+    ]
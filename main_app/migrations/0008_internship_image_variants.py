@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0007_internship_external_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='internship',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Image Variants'),
+        ),
+    ]
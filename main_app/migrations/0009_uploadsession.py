@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:52
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('main_app', '0008_internship_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name='File Name')),
+                ('size', models.BigIntegerField(verbose_name='Size')),
+                ('sha256', models.CharField(blank=True, max_length=64, verbose_name='SHA-256')),
+                ('offset', models.BigIntegerField(default=0, verbose_name='Offset')),
+                ('blob', models.CharField(blank=True, max_length=255, verbose_name='Stored File')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='Completed At')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0009_uploadsession'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='internshipapplication',
+            index=models.Index(fields=['status', 'applied_at'], name='application_status_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internshipapplication',
+            index=models.Index(fields=['internship', 'status'], name='application_internship_st_idx'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from users.models import User
@@ -19,6 +21,7 @@ class Company(models.Model):
 
 class Internship(models.Model):
     image = models.ImageField(_("Image"), upload_to='internships/', blank=True, null=True)
+    image_variants = models.JSONField(_("Image Variants"), default=dict, blank=True, editable=False)
     company = models.ForeignKey(Company, on_delete=models.CASCADE, verbose_name=_("Company"))
     category = models.ForeignKey(InternshipCategory, on_delete=models.CASCADE, verbose_name=_("Category"))
     title = models.CharField(_("Title"), max_length=255)
@@ -26,8 +29,14 @@ class Internship(models.Model):
     description = models.TextField(_("Description"))
     full_description = models.TextField(_("Full Description"))
     apply_url = models.URLField(_("Apply URL"), blank=True, null=True)
+    external_id = models.CharField(_("External ID"), max_length=100, unique=True, blank=True, null=True)
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='internship_created_id_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -59,5 +68,42 @@ class InternshipApplication(models.Model):
     status = models.CharField(_("Status"), max_length=10, choices=STATUS_CHOICES, default='pending')
     applied_at = models.DateTimeField(_("Applied At"), auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'applied_at'], name='application_status_applied_idx'),
+            models.Index(fields=['internship', 'status'], name='application_internship_st_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.username} - {self.internship.title} ({self.status})"
+
+
+class StatCounter(models.Model):
+    INTERNSHIPS = 'internships'
+    APPLICATIONS = 'applications'
+    USERS = 'users'
+
+    name = models.CharField(_("Name"), max_length=50, unique=True)
+    value = models.BigIntegerField(_("Value"), default=0)
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+
+
+class UploadSession(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions', verbose_name=_("User"))
+    filename = models.CharField(_("File Name"), max_length=255)
+    size = models.BigIntegerField(_("Size"))
+    sha256 = models.CharField(_("SHA-256"), max_length=64, blank=True)
+    offset = models.BigIntegerField(_("Offset"), default=0)
+    blob = models.CharField(_("Stored File"), max_length=255, blank=True)
+    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
+    completed_at = models.DateTimeField(_("Completed At"), null=True, blank=True)
+
+    @property
+    def is_complete(self):
+        return bool(self.blob)
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
@@ -0,0 +1,69 @@
+"""
+Bulk approve/reject of internship applications.
+
+Only pending applications move: the transition is one conditional
+``UPDATE ... SET status=<target> WHERE status='pending' AND ...``, so two
+reviewers working the same batch can't overwrite each other's decisions.
+"""
+from django.db import transaction
+
+from .models import InternshipApplication
+
+PENDING = 'pending'
+TARGET_STATUSES = ('approved', 'rejected')
+MAX_IDS = 1000
+
+# Per-id outcomes
+UPDATED = 'updated'
+ALREADY_DECIDED = 'already_decided'
+NOT_FOUND = 'not_found'
+
+
+def set_status_by_ids(ids, target):
+    """
+    Move the pending applications among ``ids`` to ``target``.
+
+    Returns ``(updated_count, outcomes)`` where ``outcomes`` maps every
+    requested id to ``{'outcome': ..., 'status': <status afterwards>}``.
+
+    The UPDATE's own ``WHERE status='pending'`` is what keeps decisions from
+    being overwritten. ``select_for_update()`` makes the outcomes exact where
+    rows can be locked; SQLite ignores it, so when the UPDATE changes fewer
+    rows than were read as pending, the statuses are read again inside the
+    write transaction. An application another reviewer moved to the same
+    ``target`` in between is then reported as ``updated``.
+    """
+    ids = list(dict.fromkeys(ids))
+    with transaction.atomic():
+        current = dict(
+            InternshipApplication.objects.select_for_update()
+            .filter(pk__in=ids).values_list('pk', 'status')
+        )
+        pending = [pk for pk, status in current.items() if status == PENDING]
+        updated = 0
+        if pending:
+            updated = InternshipApplication.objects.filter(pk__in=pending, status=PENDING).update(status=target)
+        decided = {}
+        if updated != len(pending):
+            # Some changed between the read and the UPDATE; this transaction now holds the write lock.
+            after = dict(InternshipApplication.objects.filter(pk__in=pending).values_list('pk', 'status'))
+            decided = {pk: after.get(pk) for pk in pending if after.get(pk) != target}
+
+    outcomes = {}
+    for pk in ids:
+        if pk not in current or (pk in decided and decided[pk] is None):
+            outcomes[pk] = {'outcome': NOT_FOUND, 'status': None}
+        elif pk in decided:
+            outcomes[pk] = {'outcome': ALREADY_DECIDED, 'status': decided[pk]}
+        elif current[pk] == PENDING:
+            outcomes[pk] = {'outcome': UPDATED, 'status': target}
+        else:
+            outcomes[pk] = {'outcome': ALREADY_DECIDED, 'status': current[pk]}
+    return updated, outcomes
+
+
+def set_status_by_filter(applications, target):
+    """
+    Move every pending application in the ``applications`` queryset to ``target``.
+    """
+    return applications.filter(status=PENDING).update(status=target)
@@ -0,0 +1,34 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination on a stable ``(created_at, id)`` ordering.
+
+    Cursors are opaque, so deep pages cost the same as the first one.
+    The mode is opt-in: plain list responses are kept unless the client
+    sends ``cursor`` or ``page_size``.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    paginate_only_when_requested = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.paginate_only_when_requested and not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+
+class ReviewQueuePagination(KeysetCursorPagination):
+    """
+    Oldest-first keyset pages over ``(applied_at, id)``, always on.
+    """
+    ordering = ('applied_at', 'id')
+    paginate_only_when_requested = False
+
@@ -0,0 +1,228 @@
+"""
+Full-text search over internships backed by an SQLite FTS5 virtual table.
+
+The index is a standalone FTS5 table whose rowid is the internship id.
+It stores the internship text together with the company and category
+names, so a search never has to join or LIKE-scan the base tables.
+It is kept in sync by the receivers in ``main_app/signals.py`` and can be
+repopulated with ``manage.py rebuild_search_index``.
+"""
+import base64
+import json
+import re
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+
+from .models import Internship
+
+FTS_TABLE = 'main_app_internship_fts'
+FTS_COLUMNS = ('title', 'description', 'full_description', 'company_name', 'category_name')
+
+# bm25() column weights, in FTS_COLUMNS order: a hit in the title matters
+# more than one buried in the full description.
+BM25_WEIGHTS = (10.0, 4.0, 1.0, 3.0, 2.0)
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_END = '</mark>'
+SNIPPET_ELLIPSIS = '…'
+SNIPPET_TOKENS = 16
+SNIPPET_BATCH_SIZE = 500
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def is_enabled():
+    return connection.vendor == 'sqlite' and getattr(settings, 'INTERNSHIP_FULL_TEXT_SEARCH', True)
+
+
+def build_match_query(query):
+    """
+    Turn free user input into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term and all terms must match, so
+    partially typed words still find results and FTS5 operators typed by
+    the user are never interpreted.
+    """
+    words = _WORD_RE.findall(query)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def _ids_sql(queryset):
+    return queryset.order_by().values('id').query.sql_with_params()
+
+
+def _source_sql(ids_sql):
+    """
+    SELECT producing index rows for the internship ids selected by ``ids_sql``.
+    """
+    return (
+        "SELECT i.id, i.title, i.description, i.full_description, c.name, g.name "
+        "FROM main_app_internship i "
+        "INNER JOIN main_app_company c ON c.id = i.company_id "
+        "INNER JOIN main_app_internshipcategory g ON g.id = i.category_id "
+        f"WHERE i.id IN ({ids_sql})"
+    )
+
+
+def index_internships(queryset):
+    """
+    (Re)index every internship in ``queryset``.
+    """
+    if not is_enabled():
+        return
+    try:
+        ids_sql, ids_params = _ids_sql(queryset)
+    except EmptyResultSet:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({ids_sql})", ids_params)
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FTS_COLUMNS)}) {_source_sql(ids_sql)}",
+            ids_params,
+        )
+
+
+def remove_internships(ids):
+    if not is_enabled() or not ids:
+        return
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})", list(ids))
+
+
+def rebuild_index(batch_size=5000):
+    """
+    Drop every index row and repopulate the index from the base tables.
+
+    Returns the number of indexed internships.
+    """
+    if not is_enabled():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+    total = 0
+    last_id = 0
+    while True:
+        batch = list(
+            Internship.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not batch:
+            break
+        index_internships(Internship.objects.filter(pk__gte=batch[0], pk__lte=batch[-1]))
+        total += len(batch)
+        last_id = batch[-1]
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+    return total
+
+
+def encode_cursor(score, pk, reverse=False):
+    payload = {'s': score, 'id': pk}
+    if reverse:
+        payload['r'] = 1
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(value):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(value.encode()))
+        return float(payload['s']), int(payload['id']), bool(payload.get('r'))
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor(value)
+
+
+def page_cursors(hits, has_more, cursor=None):
+    """
+    Encoded ``(next, previous)`` cursors for a page returned by ``search()``.
+    """
+    if not hits:
+        return None, None
+    reverse = cursor is not None and cursor[2]
+    has_next = True if reverse else has_more
+    has_previous = has_more if reverse else cursor is not None
+    next_cursor = encode_cursor(hits[-1][1], hits[-1][0]) if has_next else None
+    previous_cursor = encode_cursor(hits[0][1], hits[0][0], reverse=True) if has_previous else None
+    return next_cursor, previous_cursor
+
+
+def search(query, queryset=None, limit=None, cursor=None):
+    """
+    Run a BM25-ranked search and return ``(hits, has_more)``.
+
+    ``hits`` is a list of ``(internship_id, score, snippet)`` in relevance
+    order. ``queryset`` restricts the candidates (category/company filters)
+    and ``cursor`` continues from a position returned by ``encode_cursor``.
+    ``has_more`` tells whether another page exists in the paging direction.
+    """
+    match = build_match_query(query)
+    if not match:
+        return [], False
+
+    weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+    sql = (
+        f"SELECT rowid, score FROM ("
+        f"SELECT rowid, bm25({FTS_TABLE}, {weights}) AS score "
+        f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s"
+        f") AS hits"
+    )
+    params = [match]
+    where = []
+    if queryset is not None:
+        ids_sql, ids_params = _ids_sql(queryset)
+        where.append(f"rowid IN ({ids_sql})")
+        params.extend(ids_params)
+
+    reverse = False
+    if cursor is not None:
+        score, pk, reverse = cursor
+        op = '<' if reverse else '>'
+        where.append(f"(score {op} %s OR (score = %s AND rowid {op} %s))")
+        params.extend([score, score, pk])
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    sql += ' ORDER BY score DESC, rowid DESC' if reverse else ' ORDER BY score, rowid'
+    if limit is not None:
+        sql += ' LIMIT %s'
+        params.append(limit + 1)
+
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(sql, params)
+        rows = db_cursor.fetchall()
+
+    has_more = limit is not None and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+    if reverse:
+        rows.reverse()
+
+    snippets = _snippets(match, [row[0] for row in rows])
+    return [(pk, score, snippets.get(pk)) for pk, score in rows], has_more
+
+
+def _snippets(match, ids):
+    """
+    Highlighted snippets for an already-ranked page of ids.
+
+    Done as a second query so snippet() only runs for the rows returned to
+    the client rather than for every match.
+    """
+    snippets = {}
+    with connection.cursor() as cursor:
+        for start in range(0, len(ids), SNIPPET_BATCH_SIZE):
+            batch = ids[start:start + SNIPPET_BATCH_SIZE]
+            placeholders = ', '.join(['%s'] * len(batch))
+            sql = (
+                f"SELECT rowid, snippet({FTS_TABLE}, -1, %s, %s, %s, %s) "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid IN ({placeholders})"
+            )
+            params = [HIGHLIGHT_START, HIGHLIGHT_END, SNIPPET_ELLIPSIS, SNIPPET_TOKENS, match, *batch]
+            cursor.execute(sql, params)
+            snippets.update(cursor.fetchall())
+    return snippets
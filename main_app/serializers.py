@@ -1,6 +1,10 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
 from rest_framework import serializers
 from django.utils.translation import gettext_lazy as _
-from .models import InternshipCategory, Company, Internship, ContactMessage, InternshipApplication
+from core.serializers import SparseFieldsetMixin
+from . import images, moderation, uploads
+from .models import InternshipCategory, Company, Internship, ContactMessage, InternshipApplication, UploadSession
 
 
 class InternshipCategorySerializer(serializers.ModelSerializer):
@@ -21,15 +25,17 @@ class CompanySerializer(serializers.ModelSerializer):
         }
 
 
-class InternshipSerializer(serializers.ModelSerializer):
+class InternshipSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     company = CompanySerializer()
     category = InternshipCategorySerializer()
+    image_variants = serializers.SerializerMethodField(label=_("Image Variants"))
 
     class Meta:
         model = Internship
         fields = [
             'id',
             'image',
+            'image_variants',
             'company',
             'category',
             'title',
@@ -46,6 +52,50 @@ class InternshipSerializer(serializers.ModelSerializer):
             'apply_url': {'label': _("Application Link")},
         }
 
+    # The default projection for lists and search: everything but the long full_description.
+    summary_fields = [name for name in Meta.fields if name != 'full_description']
+    field_columns = {
+        'company': ('company__id', 'company__name'),
+        'category': ('category__id', 'category__name'),
+        'image_variants': ('image_variants', 'image'),
+    }
+    # Columns the method fields read, for the values() fast path (main_app/streaming.py).
+    values_sources = {'image_variants': ('image_variants', 'image')}
+
+    def get_image_variants(self, obj):
+        # A FieldFile on a model instance, the stored name on the values() fast path.
+        source_name = getattr(obj.image, 'name', obj.image)
+        return images.variant_urls(obj.image_variants, source_name, self.context.get('request'))
+
+    def resolve_related(self, validated_data):
+        """
+        Swap the nested company/category data for existing rows (looked up by name) or new ones.
+        """
+        for field, model in (('company', Company), ('category', InternshipCategory)):
+            if field in validated_data:
+                name = validated_data[field]['name']
+                validated_data[field] = model.objects.filter(name=name).first() or model.objects.create(name=name)
+        return validated_data
+
+    def create(self, validated_data):
+        return super().create(self.resolve_related(validated_data))
+
+    def update(self, instance, validated_data):
+        return super().update(instance, self.resolve_related(validated_data))
+
+
+class InternshipSearchResultSerializer(InternshipSerializer):
+    highlight = serializers.SerializerMethodField(label=_("Highlighted Snippet"))
+
+    class Meta(InternshipSerializer.Meta):
+        fields = InternshipSerializer.Meta.fields + ['highlight']
+
+    summary_fields = InternshipSerializer.summary_fields + ['highlight']
+    field_columns = {**InternshipSerializer.field_columns, 'highlight': ()}
+
+    def get_highlight(self, obj):
+        return getattr(obj, 'search_highlight', None)
+
 
 class ContactMessageSerializer(serializers.ModelSerializer):
     class Meta:
@@ -61,16 +111,126 @@ class ContactMessageSerializer(serializers.ModelSerializer):
 
 
 class InternshipApplicationSerializer(serializers.ModelSerializer):
+    upload = serializers.UUIDField(
+        write_only=True, required=False, label=_("Upload Session"),
+        help_text=_("ID of a completed upload session, instead of sending 'file'."),
+    )
+    file_url = serializers.SerializerMethodField(label=_("Download URL"))
+
     class Meta:
         model = InternshipApplication
-        fields = ['id', 'internship', 'file', 'additional_titles', 'description', 'status']
+        fields = ['id', 'internship', 'file', 'file_url', 'upload', 'additional_titles', 'description', 'status']
         read_only_fields = ['status']
         extra_kwargs = {
-            'file': {'label': _("Uploaded File")},
+            'file': {'label': _("Uploaded File"), 'required': False},
             'description': {'label': _("Application Description")},
             'status': {'label': _("Application Status")},
         }
 
+    def validate(self, attrs):
+        upload = attrs.pop('upload', None)
+        if upload is None:
+            if not attrs.get('file'):
+                raise serializers.ValidationError({'file': _("Send either 'file' or 'upload'.")})
+            return attrs
+        if attrs.get('file'):
+            raise serializers.ValidationError({'upload': _("Send either 'file' or 'upload', not both.")})
+        session = UploadSession.objects.filter(pk=upload, user=self.context['request'].user).first()
+        if session is None:
+            raise serializers.ValidationError({'upload': _("Unknown upload session.")})
+        if not session.is_complete:
+            raise serializers.ValidationError({'upload': _("Upload is not complete yet.")})
+        attrs['file'] = session.blob
+        return attrs
+
+    def create(self, validated_data):
+        if not isinstance(validated_data['file'], str):
+            validated_data['file'] = uploads.store_file(validated_data['file'])
+        return super().create(validated_data)
+
+    values_sources = {'file_url': ('id',)}
+
     def get_file_url(self, obj):
+        url = reverse('application-file', args=[obj.id])
         request = self.context.get('request')
-        return request.build_absolute_uri(obj.file.url) if obj.file and request else None
+        return request.build_absolute_uri(url) if request else url
+
+
+class ApplicantSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'email', 'first_name', 'last_name']
+
+
+class ReviewInternshipSerializer(serializers.ModelSerializer):
+    company = CompanySerializer()
+
+    class Meta:
+        model = Internship
+        fields = ['id', 'title', 'company']
+
+
+class ApplicationReviewSerializer(serializers.ModelSerializer):
+    """
+    An application as shown in the admin review queue, with applicant and internship inlined.
+    """
+    user = ApplicantSerializer()
+    internship = ReviewInternshipSerializer()
+    file_url = serializers.SerializerMethodField(label=_("Download URL"))
+
+    class Meta:
+        model = InternshipApplication
+        fields = ['id', 'user', 'internship', 'file', 'file_url', 'additional_titles', 'description', 'status',
+                  'applied_at']
+        extra_kwargs = {
+            'file': {'label': _("Uploaded File")},
+            'description': {'label': _("Application Description")},
+            'status': {'label': _("Application Status")},
+        }
+
+    get_file_url = InternshipApplicationSerializer.get_file_url
+
+
+class ApplicationBulkStatusSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(
+        choices=[(value, label) for value, label in InternshipApplication.STATUS_CHOICES
+                 if value in moderation.TARGET_STATUSES],
+        label=_("New Status"),
+    )
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False,
+        max_length=moderation.MAX_IDS, label=_("Application IDs"),
+    )
+    internship = serializers.IntegerField(required=False, label=_("Internship ID"))
+    company = serializers.IntegerField(required=False, label=_("Company ID"))
+    date_from = serializers.CharField(required=False, label=_("Applied From"),
+                                      help_text=_("ISO date or datetime."))
+    date_to = serializers.CharField(required=False, label=_("Applied To"),
+                                    help_text=_("ISO date or datetime."))
+
+    FILTERS = ['internship', 'company', 'date_from', 'date_to']
+
+    def validate(self, attrs):
+        has_filter = any(name in attrs for name in self.FILTERS)
+        if 'ids' in attrs and has_filter:
+            raise serializers.ValidationError(_("Send either 'ids' or filters, not both."))
+        if 'ids' not in attrs and not has_filter:
+            raise serializers.ValidationError(_("Send 'ids' or at least one filter."))
+        return attrs
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    sha256 = serializers.RegexField(
+        r'^[0-9a-fA-F]{64}$', required=False, allow_blank=True, label=_("SHA-256"),
+        help_text=_("Hex digest of the whole file; lets the server skip uploads it already has."),
+    )
+    is_complete = serializers.BooleanField(read_only=True, label=_("Complete"))
+
+    class Meta:
+        model = UploadSession
+        fields = ['id', 'filename', 'size', 'sha256', 'offset', 'is_complete', 'created_at', 'completed_at']
+        read_only_fields = ['offset', 'created_at', 'completed_at']
+        extra_kwargs = {
+            'filename': {'label': _("File Name")},
+            'size': {'label': _("File Size"), 'min_value': 0},
+        }
@@ -0,0 +1,72 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core import counters
+from users.models import CachedUser
+from .models import Internship, Company, InternshipCategory, InternshipApplication, StatCounter
+from . import cache, images, search
+
+
+@receiver(post_save, sender=Internship)
+def index_internship(sender, instance, **kwargs):
+    search.index_internships(Internship.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Internship)
+def render_image_variants(sender, instance, **kwargs):
+    if images.needs_variants(instance):
+        images.schedule(instance)
+    elif not instance.image and instance.image_variants:
+        Internship.objects.filter(pk=instance.pk).update(image_variants={})
+        variants = instance.image_variants
+        transaction.on_commit(lambda: images.delete_variants(variants))
+
+
+@receiver(post_delete, sender=Internship)
+def unindex_internship(sender, instance, **kwargs):
+    search.remove_internships([instance.pk])
+
+
+@receiver(post_save, sender=Company)
+def reindex_company_internships(sender, instance, created, **kwargs):
+    if not created:
+        search.index_internships(Internship.objects.filter(company=instance))
+
+
+@receiver(post_save, sender=InternshipCategory)
+def reindex_category_internships(sender, instance, created, **kwargs):
+    if not created:
+        search.index_internships(Internship.objects.filter(category=instance))
+
+
+@receiver([post_save, post_delete], sender=Internship)
+@receiver([post_save, post_delete], sender=Company)
+@receiver([post_save, post_delete], sender=InternshipCategory)
+def invalidate_catalog_cache(sender, **kwargs):
+    # After commit, so a concurrent request can't re-cache the old rows.
+    transaction.on_commit(cache.invalidate)
+
+
+COUNTER_NAMES = {
+    Internship: StatCounter.INTERNSHIPS,
+    InternshipApplication: StatCounter.APPLICATIONS,
+    User: StatCounter.USERS,
+    CachedUser: StatCounter.USERS,
+}
+
+
+@receiver(post_save, sender=Internship)
+@receiver(post_save, sender=InternshipApplication)
+@receiver(post_save, sender=User)
+def count_created(sender, instance, created, **kwargs):
+    if created:
+        counters.increment(COUNTER_NAMES[sender])
+
+
+@receiver(post_delete, sender=Internship)
+@receiver(post_delete, sender=InternshipApplication)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=CachedUser)
+def count_deleted(sender, instance, **kwargs):
+    counters.increment(COUNTER_NAMES[sender], -1)
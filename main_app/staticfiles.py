@@ -0,0 +1,157 @@
+"""
+Fingerprinted, precompressed static files, served by the app itself.
+
+``collectstatic`` with ``CompressedManifestStaticFilesStorage`` stores each
+file under a content-hashed name (``base.3c1b2e.css``) and writes a gzip
+variant next to every compressible one. ``StaticFilesMiddleware`` serves
+``STATIC_ROOT`` from an index built once at startup: hashed names are
+cached for a year as immutable, the gzip variant is sent to clients that
+accept it, and ``If-None-Match`` gets a 304.
+"""
+import gzip
+import mimetypes
+import os
+from email.utils import formatdate
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+
+COMPRESSIBLE_EXTENSIONS = {
+    '.css', '.js', '.mjs', '.map', '.json', '.svg', '.html', '.txt', '.xml', '.ttf', '.otf', '.eot', '.ico',
+}
+
+# Smaller files, or ones gzip barely shrinks, are not worth a second copy.
+MIN_COMPRESS_SIZE = 256
+MIN_COMPRESS_RATIO = 0.95
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    ``ManifestStaticFilesStorage`` that also writes ``<name>.gz`` for every
+    compressible file it stores, hashed or not.
+    """
+    # A reference missing from the manifest falls back to the plain name instead of a 500.
+    manifest_strict = False
+
+    def stored_name(self, name):
+        # Until collectstatic has written a manifest, STATIC_ROOT only has the plain names.
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        stored = set()
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            yield name, hashed_name, processed
+            if not isinstance(processed, Exception):
+                stored.update(filter(None, (name, hashed_name)))
+        if dry_run:
+            return
+        for name in sorted(stored):
+            if os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                self.compress(name)
+
+    def compress(self, name):
+        path = self.path(name)
+        with open(path, 'rb') as f:
+            data = f.read()
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(data) < MIN_COMPRESS_SIZE or len(compressed) > len(data) * MIN_COMPRESS_RATIO:
+            # Drop a variant left over from an earlier, different version of the file.
+            if os.path.exists(path + '.gz'):
+                os.remove(path + '.gz')
+            return
+        with open(path + '.gz', 'wb') as f:
+            f.write(compressed)
+
+
+class StaticFile:
+    """
+    One servable file under ``STATIC_ROOT`` and its gzip variant, if any.
+    """
+    def __init__(self, path, immutable):
+        self.path = path
+        self.content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if self.content_type.startswith('text/') or self.content_type in ('application/javascript', 'image/svg+xml'):
+            self.content_type += '; charset=utf-8'
+        stat = os.stat(path)
+        self.size = stat.st_size
+        self.etag = f'"{int(stat.st_mtime):x}-{stat.st_size:x}"'
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+        self.gzip_path = path + '.gz' if os.path.isfile(path + '.gz') else None
+        if self.gzip_path:
+            self.gzip_size = os.path.getsize(self.gzip_path)
+        if immutable:
+            self.cache_control = f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+        else:
+            self.cache_control = f'public, max-age={getattr(settings, "STATIC_FILES_MAX_AGE", 60)}'
+
+
+def build_index(root, hashed_names):
+    """
+    Map each URL path below ``STATIC_URL`` to its ``StaticFile``; the
+    ``.gz`` variants are not addressable on their own.
+    """
+    index = {}
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            if filename.endswith('.gz') and os.path.isfile(path[:-3]):
+                continue
+            index[name] = StaticFile(path, immutable=name in hashed_names)
+    return index
+
+
+def _etag_matches(header, etag):
+    if header.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in header.split(','))
+
+
+class StaticFilesMiddleware:
+    """
+    Serve GET and HEAD requests for ``STATIC_URL`` out of ``STATIC_ROOT``.
+
+    The index is built when the middleware loads, so files collected later
+    are served after the next restart.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.STATIC_URL if (settings.STATIC_URL or '').startswith('/') else None
+        self.index = {}
+        if self.prefix and settings.STATIC_ROOT and os.path.isdir(settings.STATIC_ROOT):
+            manifest = getattr(staticfiles_storage, 'hashed_files', {})
+            hashed_names = {hashed for name, hashed in manifest.items() if hashed != name}
+            self.index = build_index(settings.STATIC_ROOT, hashed_names)
+
+    def __call__(self, request):
+        if self.prefix and request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefix):
+            static_file = self.index.get(request.path_info[len(self.prefix):])
+            if static_file is not None:
+                return self.serve(request, static_file)
+        return self.get_response(request)
+
+    def serve(self, request, static_file):
+        use_gzip = static_file.gzip_path is not None and 'gzip' in request.headers.get('Accept-Encoding', '')
+        etag = static_file.etag[:-1] + '-gz"' if use_gzip else static_file.etag
+
+        if _etag_matches(request.headers.get('If-None-Match', ''), etag):
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(open(static_file.gzip_path if use_gzip else static_file.path, 'rb'),
+                                    content_type=static_file.content_type)
+            response.headers.pop('Content-Disposition', None)
+            response['Content-Length'] = static_file.gzip_size if use_gzip else static_file.size
+            response['Last-Modified'] = static_file.last_modified
+            if use_gzip:
+                response['Content-Encoding'] = 'gzip'
+        response['ETag'] = etag
+        response['Cache-Control'] = static_file.cache_control
+        if static_file.gzip_path:
+            patch_vary_headers(response, ['Accept-Encoding'])
+        return response
@@ -0,0 +1,161 @@
+"""
+Read-only fast path for large list responses.
+
+Instead of building a model instance per row and running it through a
+``ModelSerializer``, a ``ValuesPlan`` fetches just the needed columns as
+tuples (``values_list()``) and maps each tuple into the serializer's output
+shape. Every value still goes through the serializer field's own
+``to_representation()``, so the output is the same as the serializer's.
+
+``streaming_json_response()`` then writes the JSON array out in chunks,
+byte for byte what ``JSONRenderer`` would produce for the whole list, so
+neither the objects nor the rendered body are held in memory at once.
+"""
+from types import SimpleNamespace
+
+from django.db import models
+from django.http import StreamingHttpResponse
+from rest_framework import serializers
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.relations import PKOnlyObject
+from rest_framework.renderers import JSONRenderer
+
+CHUNK_SIZE = 500
+
+
+class ValuesPlan:
+    """
+    Columns to fetch for ``serializer`` and how to turn one row of them
+    into its ``to_representation()`` output.
+
+    Supports model fields (including file fields), primary-key related
+    fields, nested model serializers and ``SerializerMethodField``s whose
+    columns the serializer lists in ``values_sources``. Anything else
+    raises ``TypeError``.
+    """
+    def __init__(self, serializer):
+        self.lookups = []
+        self.steps = self._plan(serializer, prefix='')
+
+    def _column(self, lookup):
+        self.lookups.append(lookup)
+        return len(self.lookups) - 1
+
+    def _plan(self, serializer, prefix):
+        model = serializer.Meta.model
+        steps = []
+        for field in serializer._readable_fields:
+            name, source = field.field_name, field.source
+            if isinstance(field, serializers.SerializerMethodField):
+                sources = getattr(serializer, 'values_sources', {}).get(name)
+                if sources is None:
+                    raise TypeError(f"{type(serializer).__name__}.{name} has no values_sources entry.")
+                columns = [(attr, self._column(prefix + attr)) for attr in sources]
+                steps.append((name, self._method(field, columns)))
+                continue
+            if '.' in source or source == '*':
+                raise TypeError(f"{type(serializer).__name__}.{name}: dotted sources are not supported.")
+            model_field = model._meta.get_field(source)
+            if isinstance(field, serializers.BaseSerializer):
+                present = self._column(prefix + model_field.attname)
+                nested = self._plan(field, prefix=f'{prefix}{source}__')
+                steps.append((name, self._nested(present, nested)))
+            elif isinstance(field, serializers.RelatedField):
+                steps.append((name, self._related(field, self._column(prefix + model_field.attname))))
+            elif isinstance(model_field, models.FileField):
+                steps.append((name, self._file(field, model_field, self._column(prefix + source))))
+            else:
+                steps.append((name, self._value(field, self._column(prefix + source))))
+        return steps
+
+    @staticmethod
+    def _value(field, index):
+        to_representation = field.to_representation
+        return lambda row: None if row[index] is None else to_representation(row[index])
+
+    @staticmethod
+    def _related(field, index):
+        to_representation = field.to_representation
+        return lambda row: None if row[index] is None else to_representation(PKOnlyObject(pk=row[index]))
+
+    @staticmethod
+    def _file(field, model_field, index):
+        # A FieldFile without an instance: enough for .url, which is all to_representation reads.
+        attr_class, to_representation = model_field.attr_class, field.to_representation
+        return lambda row: to_representation(attr_class(None, model_field, row[index]))
+
+    @staticmethod
+    def _method(field, columns):
+        to_representation = field.to_representation
+        return lambda row: to_representation(SimpleNamespace(**{attr: row[index] for attr, index in columns}))
+
+    @staticmethod
+    def _nested(present, steps):
+        def represent(row):
+            if row[present] is None:
+                return None
+            return {name: step(row) for name, step in steps}
+        return represent
+
+    def to_representation(self, row):
+        return {name: step(row) for name, step in self.steps}
+
+    def iter_rows(self, queryset, chunk_size=CHUNK_SIZE):
+        for row in queryset.values_list(*self.lookups).iterator(chunk_size=chunk_size):
+            yield self.to_representation(row)
+
+
+def can_stream(request):
+    """
+    Whether the negotiated response is plain (not indented) JSON, which the fast path reproduces.
+    """
+    renderer = getattr(request, 'accepted_renderer', None)
+    return (
+        type(renderer) is JSONRenderer
+        and renderer.get_indent(request.accepted_media_type, {}) is None
+    )
+
+
+def iter_json_array(items, chunk_size=CHUNK_SIZE):
+    """
+    Encode ``items`` as one JSON array, ``chunk_size`` items per yielded chunk.
+    """
+    # The encoder settings JSONRenderer passes to json.dumps() when not indenting.
+    renderer = JSONRenderer()
+    separators = SHORT_SEPARATORS if renderer.compact else LONG_SEPARATORS
+    encode = renderer.encoder_class(
+        ensure_ascii=renderer.ensure_ascii, allow_nan=not renderer.strict, separators=separators,
+    ).encode
+    item_separator = separators[0]
+
+    opening = '['
+    chunk = []
+    for item in items:
+        chunk.append(encode(item))
+        if len(chunk) >= chunk_size:
+            yield _escape(opening + item_separator.join(chunk))
+            opening = item_separator
+            chunk = []
+    if chunk:
+        yield _escape(opening + item_separator.join(chunk) + ']')
+    else:
+        yield b'[]' if opening == '[' else b']'
+
+
+def _escape(text):
+    # As JSONRenderer: keep the output a strict JavaScript subset.
+    return text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+
+
+def streaming_json_response(serializer, queryset, chunk_size=CHUNK_SIZE):
+    """
+    Stream ``serializer(queryset, many=True).data`` as JSON via a ``ValuesPlan``.
+
+    ``serializer`` is an unbound instance (e.g. ``InternshipSerializer(context=...)``)
+    whose fields and context decide the output.
+    """
+    plan = ValuesPlan(serializer)
+    return StreamingHttpResponse(
+        iter_json_array(plan.iter_rows(queryset, chunk_size), chunk_size),
+        content_type='application/json',
+    )
@@ -0,0 +1,63 @@
+"""
+Base test case shared by the test modules of both apps.
+"""
+import os
+import shutil
+import tempfile
+
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core import throttling
+
+PASSWORD = 'test-pass-123'
+
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-default'},
+    'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-shared'},
+}
+
+
+@override_settings(
+    CACHES=TEST_CACHES,
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+    STAT_COUNTERS_TTL=0,
+    STAT_COUNTERS_STALE_TTL=0,
+    CONTACT_SPOOL_FLUSH_INTERVAL=0,
+)
+class IsolatedAPITestCase(APITestCase):
+    """
+    API test case with its own caches, media and upload directories,
+    contact spool and throttle buckets, all emptied before every test.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.media_root = tempfile.mkdtemp()
+        cls.upload_dir = tempfile.mkdtemp()
+        cls.spool_dir = tempfile.mkdtemp()
+        cls.media_override = override_settings(MEDIA_ROOT=cls.media_root, CHUNKED_UPLOAD_TEMP_DIR=cls.upload_dir,
+                                               CONTACT_SPOOL_DIR=cls.spool_dir,
+                                               THROTTLE_STORE_PATH=os.path.join(cls.media_root, '.throttle'))
+        cls.media_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.media_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        shutil.rmtree(cls.upload_dir, ignore_errors=True)
+        shutil.rmtree(cls.spool_dir, ignore_errors=True)
+
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        throttling.reset()
+        for name in os.listdir(self.spool_dir):
+            os.remove(os.path.join(self.spool_dir, name))
+
+    def login(self, user):
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"token {token}")
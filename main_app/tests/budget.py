@@ -0,0 +1,182 @@
+"""
+Query-count and wall-time budgets for every API endpoint.
+
+Each test seeds a realistic amount of data once, calls one endpoint and
+fails if the request runs more SQL queries or takes longer than its entry
+in ``BUDGETS``. The failure message lists every query that ran, so an N+1
+introduced by a serializer change shows up with the offending SQL.
+
+Time budgets are generous on purpose; set ``BUDGET_TIME_FACTOR`` (e.g. ``3``)
+to scale them on a slow machine.
+
+Only the budget tests (``test_budgets`` in both apps) use this seed; the
+feature tests build just the rows they need on ``base.IsolatedAPITestCase``.
+"""
+import os
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+
+from users.models import UserProfile
+from core import counters
+from main_app import search
+from main_app.models import Company, Internship, InternshipApplication, InternshipCategory, ContactMessage
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+SEED = {
+    'categories': 8,
+    'companies': 25,
+    'internships': 500,
+    'users': 200,
+    'applications_per_user': 15,
+    'contact_messages': 100,
+}
+
+# (url name, method) -> (max queries, max milliseconds)
+BUDGETS = {
+    ('contact-message', 'GET'): (1, 250),
+    ('contact-message', 'POST'): (1, 150),
+    ('internship-list', 'GET'): (1, 300),
+    ('internship-list', 'POST'): (9, 200),
+    ('internship-detail', 'GET'): (1, 150),
+    ('internship-detail', 'PATCH'): (5, 200),
+    # Cascaded applications each decrement the applications counter.
+    ('internship-detail', 'DELETE'): (12, 250),
+    ('internship-search', 'GET'): (3, 250),
+    ('apply-to-internship', 'POST'): (5, 250),
+    ('upload-session', 'POST'): (2, 150),
+    ('upload-session-detail', 'GET'): (2, 150),
+    ('upload-session-detail', 'PATCH'): (5, 200),
+    ('upload-session-detail', 'DELETE'): (3, 150),
+    ('about-api', 'GET'): (1, 150),
+    ('user-applications', 'GET'): (2, 150),
+    ('application-file', 'GET'): (2, 150),
+    ('admin-about-api', 'GET'): (2, 150),
+    ('admin-applications', 'GET'): (2, 250),
+    ('admin-application-bulk-status', 'POST'): (5, 200),
+    ('admin-application-export', 'GET'): (2, 1000),
+    ('admin-application-action', 'POST'): (2, 150),
+    ('admin-application-action', 'DELETE'): (4, 200),
+    ('async-internship-list', 'GET'): (1, 250),
+    ('async-internship-detail', 'GET'): (1, 150),
+    ('async-internship-search', 'GET'): (3, 250),
+    ('async-about-api', 'GET'): (1, 150),
+    ('async-user-applications', 'GET'): (2, 150),
+    ('change-language', 'POST'): (4, 150),
+}
+
+def time_factor():
+    return float(os.environ.get('BUDGET_TIME_FACTOR', 1))
+
+
+def seed_data():
+    """
+    Create catalog, users (with profiles) and applications in bulk; returns the users.
+    """
+    categories = InternshipCategory.objects.bulk_create(
+        [InternshipCategory(name=f"Category {n}") for n in range(SEED['categories'])]
+    )
+    companies = Company.objects.bulk_create([Company(name=f"Company {n}") for n in range(SEED['companies'])])
+    internships = Internship.objects.bulk_create([
+        Internship(
+            company=companies[n % len(companies)],
+            category=categories[n % len(categories)],
+            title=f"Python developer intern {n}",
+            description=f"Backend internship number {n} working with Django and PostgreSQL.",
+            full_description=f"Full description of internship {n}. " * 20,
+        )
+        for n in range(SEED['internships'])
+    ])
+    search.rebuild_index()
+
+    password = make_password(PASSWORD)
+    users = User.objects.bulk_create([
+        User(username=f"user{n}", email=f"user{n}@example.com", first_name=f"First{n}",
+             last_name=f"Last{n}", password=password)
+        for n in range(SEED['users'])
+    ])
+    UserProfile.objects.bulk_create([
+        UserProfile(user=user, first_name=user.first_name, last_name=user.last_name, email=user.email)
+        for user in users
+    ])
+    statuses = ['pending', 'pending', 'approved', 'rejected']
+    InternshipApplication.objects.bulk_create([
+        InternshipApplication(
+            user=user,
+            internship=internships[(u * 7 + n) % len(internships)],
+            file=f"apply/cv-{u}.pdf",
+            description="Motivation letter",
+            status=statuses[(u + n) % len(statuses)],
+        )
+        for u, user in enumerate(users)
+        for n in range(SEED['applications_per_user'])
+    ])
+    ContactMessage.objects.bulk_create([
+        ContactMessage(first_name="Ali", last_name="Valiyev", email=f"contact{n}@example.com",
+                       phone_number="+998901234567", message="Hello")
+        for n in range(SEED['contact_messages'])
+    ])
+    counters.reconcile()
+    return users
+
+
+def format_queries(queries):
+    return '\n'.join(f"  {n}. {query['sql']}" for n, query in enumerate(queries, 1))
+
+
+class BudgetTestCase(IsolatedAPITestCase):
+    """
+    Base class: seeded data and ``assertWithinBudget``.
+    """
+    budgets = BUDGETS
+    urlconf = 'main_app.urls'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = seed_data()
+        cls.user = cls.users[0]
+        cls.admin = User.objects.create_user('admin', 'admin@example.com', PASSWORD, is_staff=True)
+        cls.internship = Internship.objects.order_by('pk').first()
+        # Warm up URL resolving, serializer fields etc. outside any timed request.
+        Client().get(reverse('internship-list'))
+
+    def assertWithinBudget(self, name, method, url=None, expected_status=200, **kwargs):
+        """
+        Request ``url`` (default: ``reverse(name)``) and check it against ``budgets[(name, method)]``.
+        """
+        max_queries, max_ms = self.budgets[(name, method)]
+        max_ms *= time_factor()
+        url = url or reverse(name)
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = getattr(self.client, method.lower())(url, **kwargs)
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        if response.streaming:
+            response.streaming_content = [body]
+
+        self.assertEqual(
+            response.status_code, expected_status,
+            f"{method} {url} answered {response.status_code}: {body[:500]!r}",
+        )
+        problems = []
+        if len(captured) > max_queries:
+            problems.append(f"{len(captured)} queries, budget is {max_queries}")
+        if elapsed_ms > max_ms:
+            problems.append(f"{elapsed_ms:.0f} ms, budget is {max_ms:.0f} ms")
+        if problems:
+            self.fail(
+                f"{method} {url} ({name}) is over budget: {'; '.join(problems)}.\n"
+                f"Queries:\n{format_queries(captured.captured_queries)}"
+            )
+        return response
+
+    def test_every_url_has_a_budget(self):
+        names = {pattern.name for pattern in get_resolver(self.urlconf).url_patterns if pattern.name}
+        budgeted = {name for name, method in self.budgets}
+        self.assertEqual(names - budgeted, set(), "URLs without a query/time budget")
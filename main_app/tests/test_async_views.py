@@ -0,0 +1,28 @@
+from django.urls import reverse
+
+from main_app.models import Company, Internship, InternshipCategory
+from main_app.tests.base import IsolatedAPITestCase
+
+
+class AsyncInternshipListTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        company = Company.objects.create(name='Acme')
+        category = InternshipCategory.objects.create(name='IT')
+        Internship.objects.bulk_create([
+            Internship(company=company, category=category, title=f'Intern {n}', description='d', full_description='f')
+            for n in range(12)
+        ])
+
+    def test_internship_list_pages_back(self):
+        url = reverse('async-internship-list') + '?page_size=5&fields=id'
+        first = self.client.get(url).json()
+        self.assertIsNone(first['previous'])
+        second = self.client.get(first['next']).json()
+        third = self.client.get(second['next']).json()
+        back = self.client.get(third['previous']).json()
+        self.assertEqual(back['results'], second['results'])
+        self.assertEqual(back['next'], second['next'])
+        back = self.client.get(back['previous']).json()
+        self.assertEqual(back['results'], first['results'])
+        self.assertIsNone(back['previous'])
@@ -0,0 +1,279 @@
+"""
+Query-count and wall-time budgets of the main_app endpoints (see ``budget``).
+"""
+import json
+import os
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from main_app import contact_spool
+from main_app.models import ContactMessage, Internship, InternshipApplication
+from main_app.serializers import InternshipApplicationSerializer, InternshipSerializer
+from main_app.tests.budget import SEED, BudgetTestCase
+
+
+class CatalogBudgetTests(BudgetTestCase):
+    def test_internship_list(self):
+        self.assertWithinBudget('internship-list', 'GET')
+
+    def test_internship_list_page(self):
+        response = self.assertWithinBudget('internship-list', 'GET', reverse('internship-list') + '?page_size=50')
+        self.assertWithinBudget('internship-list', 'GET', response.data['next'])
+
+    def test_internship_list_cached(self):
+        b''.join(self.client.get(reverse('internship-list')).streaming_content)
+        response = self.assertWithinBudget('internship-list', 'GET')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_internship_list_streamed_matches_serializer(self):
+        variant = {'width': 320, 'height': 200, 'webp': 'internships/variants/a.webp',
+                   'jpeg': 'internships/variants/a.jpeg'}
+        Internship.objects.filter(pk=self.internship.pk).update(
+            image='internships/a.jpg', image_variants={'source': 'internships/a.jpg', 'thumbnail': variant},
+            title="Caf\u00e9 \u2028 intern",
+        )
+        # Variants of a replaced image are not served.
+        Internship.objects.exclude(pk=self.internship.pk).filter(pk__lte=self.internship.pk + 3).update(
+            image='internships/b.jpg', image_variants={'source': 'internships/a.jpg', 'thumbnail': variant},
+        )
+        for query in ('', '?fields=id,company,image', '?omit=image_variants'):
+            response = self.assertWithinBudget('internship-list', 'GET', reverse('internship-list') + query)
+            self.assertTrue(response.streaming)
+            request = Request(APIRequestFactory().get(reverse('internship-list') + query))
+            serializer = InternshipSerializer(
+                Internship.objects.select_related('company', 'category'), many=True,
+                context={'request': request, 'summary': True},
+            )
+            self.assertEqual(response.getvalue(), JSONRenderer().render(serializer.data))
+
+    def test_internship_list_not_streamed_when_indented(self):
+        response = self.client.get(reverse('internship-list'), HTTP_ACCEPT='application/json; indent=2')
+        self.assertFalse(response.streaming)
+
+    def test_internship_create(self):
+        self.login(self.admin)
+        self.assertWithinBudget('internship-list', 'POST', expected_status=201, data={
+            'company': {'name': 'Acme'}, 'category': {'name': 'IT'}, 'title': 'New', 'description': 'd',
+            'full_description': 'f',
+        }, format='json')
+
+    def test_internship_detail(self):
+        self.assertWithinBudget('internship-detail', 'GET', reverse('internship-detail', args=[self.internship.pk]))
+
+    def test_internship_update(self):
+        self.login(self.admin)
+        self.assertWithinBudget('internship-detail', 'PATCH', reverse('internship-detail', args=[self.internship.pk]),
+                                data={'title': 'Renamed'}, format='json')
+
+    def test_internship_delete(self):
+        self.login(self.admin)
+        self.assertWithinBudget('internship-detail', 'DELETE',
+                                reverse('internship-detail', args=[self.internship.pk]), expected_status=204)
+
+    def test_internship_search(self):
+        self.assertWithinBudget('internship-search', 'GET', reverse('internship-search') + '?query=python')
+
+    def test_internship_search_page(self):
+        self.assertWithinBudget('internship-search', 'GET',
+                                reverse('internship-search') + '?query=django&category=Category&page_size=20')
+
+    def test_internship_list_summary(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('internship-list') + '?page_size=5')
+        self.assertNotIn('full_description', response.data['results'][0])
+        self.assertNotIn('full_description', captured.captured_queries[-1]['sql'])
+
+    def test_internship_list_fields_and_omit(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('internship-list') + '?page_size=5&fields=id,title,company&omit=company')
+        self.assertEqual(set(response.data['results'][0]), {'id', 'title'})
+        self.assertNotIn('main_app_company', captured.captured_queries[-1]['sql'])
+        response = self.client.get(reverse('internship-list') + '?page_size=5&fields=id,full_description')
+        self.assertEqual(set(response.data['results'][0]), {'id', 'full_description'})
+        self.assertEqual(self.client.get(reverse('internship-list') + '?fields=id,secret').status_code, 400)
+
+    def test_internship_image_variants_projection(self):
+        for query in ('?page_size=10&fields=id,image_variants', '?fields=image_variants'):
+            response = self.assertWithinBudget('internship-list', 'GET', reverse('internship-list') + query)
+            self.assertEqual(response.status_code, 200)
+        self.assertWithinBudget('internship-detail', 'GET',
+                                reverse('internship-detail', args=[self.internship.pk]) + '?fields=image_variants')
+
+    def test_internship_detail_is_full(self):
+        response = self.client.get(reverse('internship-detail', args=[self.internship.pk]))
+        self.assertIn('full_description', response.data)
+        response = self.client.get(reverse('internship-detail', args=[self.internship.pk]) + '?omit=full_description')
+        self.assertNotIn('full_description', response.data)
+
+    def test_internship_search_summary(self):
+        response = self.client.get(reverse('internship-search') + '?query=python&page_size=5')
+        self.assertIn('highlight', response.data['results'][0])
+        self.assertNotIn('full_description', response.data['results'][0])
+
+    def test_about(self):
+        self.assertWithinBudget('about-api', 'GET')
+
+    def test_admin_about(self):
+        self.login(self.admin)
+        self.assertWithinBudget('admin-about-api', 'GET')
+
+    def test_contact_list(self):
+        self.assertWithinBudget('contact-message', 'GET')
+
+    def test_contact_create(self):
+        self.assertWithinBudget('contact-message', 'POST', expected_status=202, data={
+            'first_name': 'Ali', 'last_name': 'Valiyev', 'email': 'ali@example.com',
+            'phone_number': '+998901234567', 'message': 'Hi',
+        }, format='json')
+        self.assertEqual(contact_spool.flush(), 1)
+        self.assertTrue(ContactMessage.objects.filter(email='ali@example.com', message='Hi').exists())
+
+    def test_contact_create_direct(self):
+        with self.settings(CONTACT_INGEST_MODE='direct'):
+            self.assertWithinBudget('contact-message', 'POST', expected_status=201, data={
+                'first_name': 'Ali', 'last_name': 'Valiyev', 'email': 'direct@example.com', 'message': 'Hi',
+            }, format='json')
+        self.assertTrue(ContactMessage.objects.filter(email='direct@example.com').exists())
+
+    def test_change_language(self):
+        self.assertWithinBudget('change-language', 'POST', data={'language': 'uz'}, format='json')
+
+
+class ApplicationBudgetTests(BudgetTestCase):
+    def test_apply_with_file(self):
+        self.login(self.user)
+        self.assertWithinBudget('apply-to-internship', 'POST', expected_status=201, data={
+            'internship': self.internship.pk, 'file': SimpleUploadedFile('cv.pdf', b'%PDF-1.4 cv'),
+            'description': 'Hello',
+        }, format='multipart')
+
+    def test_apply_with_upload_session(self):
+        self.login(self.user)
+        session = self.client.post(reverse('upload-session'), {'filename': 'cv.pdf', 'size': 4}, format='json')
+        self.client.generic('PATCH', reverse('upload-session-detail', args=[session.data['id']]), b'%PDF',
+                            content_type='application/offset+octet-stream', HTTP_UPLOAD_OFFSET='0')
+        self.assertWithinBudget('apply-to-internship', 'POST', expected_status=201, data={
+            'internship': self.internship.pk, 'upload': session.data['id'],
+        }, format='json')
+
+    def test_upload_session(self):
+        self.login(self.user)
+        response = self.assertWithinBudget('upload-session', 'POST', expected_status=201,
+                                           data={'filename': 'cv.pdf', 'size': 8}, format='json')
+        url = reverse('upload-session-detail', args=[response.data['id']])
+        self.assertWithinBudget('upload-session-detail', 'PATCH', url, data=b'%PDF-1.4',
+                                content_type='application/offset+octet-stream', HTTP_UPLOAD_OFFSET='0')
+        self.assertWithinBudget('upload-session-detail', 'GET', url)
+
+    def test_upload_session_abort(self):
+        self.login(self.user)
+        response = self.client.post(reverse('upload-session'), {'filename': 'cv.pdf', 'size': 8}, format='json')
+        self.assertWithinBudget('upload-session-detail', 'DELETE',
+                                reverse('upload-session-detail', args=[response.data['id']]), expected_status=204)
+
+    def test_user_applications(self):
+        self.login(self.user)
+        response = self.assertWithinBudget('user-applications', 'GET')
+        serializer = InternshipApplicationSerializer(InternshipApplication.objects.filter(user=self.user), many=True)
+        body = response.getvalue()
+        self.assertEqual(body, JSONRenderer().render(serializer.data))
+        self.assertEqual(len(json.loads(body)), SEED['applications_per_user'])
+
+    def application_with_file(self, content=b'%PDF-1.4 0123456789'):
+        application = InternshipApplication.objects.filter(user=self.user).order_by('pk').first()
+        path = os.path.join(self.media_root, application.file.name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return application, content, reverse('application-file', args=[application.pk])
+
+    def test_application_file(self):
+        application, content, url = self.application_with_file()
+        self.login(self.user)
+        response = self.assertWithinBudget('application-file', 'GET', url)
+        self.assertEqual(response.getvalue(), content)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['Content-Disposition'], f'attachment; filename="application-{application.pk}.pdf"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+    def test_review_queue(self):
+        self.login(self.admin)
+        response = self.assertWithinBudget('admin-applications', 'GET')
+        self.assertWithinBudget('admin-applications', 'GET', response.data['next'])
+
+    def test_review_queue_filtered(self):
+        self.login(self.admin)
+        self.assertWithinBudget('admin-applications', 'GET',
+                                reverse('admin-applications') + f'?company={self.internship.company_id}')
+
+    def test_bulk_status(self):
+        self.login(self.admin)
+        ids = list(InternshipApplication.objects.filter(status='pending').values_list('pk', flat=True)[:200])
+        response = self.assertWithinBudget('admin-application-bulk-status', 'POST',
+                                           data={'status': 'approved', 'ids': ids}, format='json')
+        self.assertEqual(response.data['updated'], len(ids))
+
+    def test_bulk_status_by_filter(self):
+        self.login(self.admin)
+        self.assertWithinBudget('admin-application-bulk-status', 'POST',
+                                data={'status': 'rejected', 'company': self.internship.company_id}, format='json')
+
+    def test_export(self):
+        self.login(self.admin)
+        response = self.assertWithinBudget('admin-application-export', 'GET',
+                                           reverse('admin-application-export', args=['csv']))
+        self.assertEqual(response.getvalue().count(b'\n'), InternshipApplication.objects.count() + 1)
+
+    def test_application_action(self):
+        self.login(self.admin)
+        application = InternshipApplication.objects.filter(status='pending').first()
+        self.assertWithinBudget('admin-application-action', 'POST',
+                                reverse('admin-application-action', args=[application.pk, 'approve']))
+
+    def test_application_delete(self):
+        self.login(self.admin)
+        application = InternshipApplication.objects.first()
+        self.assertWithinBudget('admin-application-action', 'DELETE',
+                                reverse('admin-application-action', args=[application.pk, 'delete']),
+                                expected_status=204)
+
+
+class AsyncBudgetTests(BudgetTestCase):
+    def test_internship_list(self):
+        self.assertWithinBudget('async-internship-list', 'GET')
+
+    def test_internship_list_page(self):
+        response = self.assertWithinBudget('async-internship-list', 'GET',
+                                           reverse('async-internship-list') + '?page_size=50')
+        self.assertWithinBudget('async-internship-list', 'GET', response.json()['next'])
+
+    def test_internship_detail(self):
+        self.assertWithinBudget('async-internship-detail', 'GET',
+                                reverse('async-internship-detail', args=[self.internship.pk]))
+
+    def test_internship_search(self):
+        self.assertWithinBudget('async-internship-search', 'GET', reverse('async-internship-search') + '?query=python')
+
+    def test_internship_list_fields(self):
+        response = self.client.get(reverse('async-internship-list') + '?page_size=5&fields=id,title')
+        self.assertEqual(set(response.json()['results'][0]), {'id', 'title'})
+        self.assertEqual(self.client.get(reverse('async-internship-list') + '?omit=nope').status_code, 400)
+
+    def test_internship_list_image_variants(self):
+        for query in ('?page_size=10&fields=id,image_variants', '?fields=image_variants'):
+            self.assertWithinBudget('async-internship-list', 'GET', reverse('async-internship-list') + query)
+        self.assertWithinBudget('async-internship-detail', 'GET',
+                                reverse('async-internship-detail', args=[self.internship.pk]) + '?fields=image_variants')
+
+    def test_about(self):
+        self.assertWithinBudget('async-about-api', 'GET')
+
+    def test_user_applications(self):
+        self.login(self.user)
+        self.assertWithinBudget('async-user-applications', 'GET')
@@ -0,0 +1,31 @@
+from django.urls import reverse
+
+from main_app.models import Company, Internship, InternshipCategory
+from main_app.tests.base import IsolatedAPITestCase
+
+
+class CatalogCacheTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        company = Company.objects.create(name='Acme')
+        category = InternshipCategory.objects.create(name='IT')
+        for n in range(3):
+            Internship.objects.create(company=company, category=category, title=f'Intern {n}',
+                                      description='d', full_description='f')
+
+    def test_cached_stream_honours_accept(self):
+        b''.join(self.client.get(reverse('internship-list')).streaming_content)
+        response = self.client.get(reverse('internship-list'), HTTP_ACCEPT='application/json; indent=2')
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertIn(b'\n  {', response.content)
+        response = self.client.get(reverse('internship-list'), HTTP_ACCEPT='text/html')
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
+
+    def test_cached_per_host(self):
+        url = reverse('internship-list') + '?page_size=1'
+        self.client.get(url, HTTP_HOST='evil.example')
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertTrue(response.data['next'].startswith('http://testserver/'))
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
@@ -0,0 +1,58 @@
+import io
+import os
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from main_app import contact_spool
+from main_app.models import ContactMessage
+from main_app.tests.base import IsolatedAPITestCase
+
+
+class ContactSpoolTests(IsolatedAPITestCase):
+    def test_create_throttled(self):
+        data = {'first_name': 'A', 'last_name': 'B', 'email': 'flood@example.com', 'message': 'Hi'}
+        for n in range(5):
+            self.assertEqual(self.client.post(reverse('contact-message'), data, format='json').status_code, 202)
+        response = self.client.post(reverse('contact-message'), data, format='json')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(self.client.post(reverse('contact-message'), data, format='json',
+                                          REMOTE_ADDR='10.0.0.9').status_code, 202)
+        # Reading is not limited.
+        self.assertEqual(self.client.get(reverse('contact-message')).status_code, 200)
+
+    def test_spool_batches_and_drops_duplicates(self):
+        url = reverse('contact-message')
+        for n in range(5):
+            # From several addresses, under the per-IP limit.
+            self.client.post(url, {'first_name': 'Ali', 'last_name': 'V', 'email': f'burst{n}@example.com',
+                                   'message': 'Spam?'}, format='json', REMOTE_ADDR=f'10.0.0.{n}')
+            self.client.post(url, {'first_name': 'ali ', 'last_name': 'V', 'email': f'BURST{n}@example.com',
+                                   'message': 'Spam? '}, format='json', REMOTE_ADDR=f'10.0.0.{n}')
+        self.assertEqual(self.client.post(url, {'email': 'bad'}, format='json').status_code, 400)
+        with CaptureQueriesContext(connection) as captured:
+            self.assertEqual(contact_spool.flush(), 5)
+        # One query for the recent messages, one INSERT for the batch.
+        self.assertEqual(len([query for query in captured if query['sql'].startswith('INSERT')]), 1)
+        # Resent within the window: dropped against the stored rows.
+        self.client.post(url, {'first_name': 'Ali', 'last_name': 'V', 'email': 'burst0@example.com',
+                               'message': 'Spam?'}, format='json')
+        self.client.post(url, {'first_name': 'Ali', 'last_name': 'V', 'email': 'Burst1@Example.com',
+                               'message': 'Spam?'}, format='json')
+        self.assertEqual(contact_spool.flush(), 0)
+        self.assertEqual(ContactMessage.objects.filter(email__istartswith='burst').count(), 5)
+
+    def test_spool_recovers_abandoned_batch(self):
+        self.client.post(reverse('contact-message'), {'first_name': 'A', 'last_name': 'B', 'email': 'lost@example.com',
+                                                      'message': 'Hello'}, format='json')
+        # A flusher that claimed the spool and died leaves an unlocked batch behind.
+        os.rename(os.path.join(self.spool_dir, 'contact.jsonl'), os.path.join(self.spool_dir, 'dead.batch'))
+        with open(os.path.join(self.spool_dir, 'dead.batch'), 'a') as f:
+            f.write('{"first_name": "cut sh')
+        with self.assertLogs('main_app.contact_spool', 'WARNING'):
+            call_command('flush_contact_spool', stdout=io.StringIO())
+        self.assertTrue(ContactMessage.objects.filter(email='lost@example.com').exists())
+        self.assertEqual(os.listdir(self.spool_dir), ['spool.lock'])
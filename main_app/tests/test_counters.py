@@ -0,0 +1,111 @@
+import io
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+from core import counters
+from main_app.models import Company, Internship, InternshipApplication, InternshipCategory, StatCounter
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+
+class FakeThread:
+    """
+    Records the background refresh instead of starting it.
+    """
+    started = []
+
+    def __init__(self, target, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.started.append(self)
+
+    def run(self):
+        # The refresh closes its own connection, which is the test's here.
+        with mock.patch.object(counters, 'connection'):
+            self.target()
+
+
+class CounterTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user', 'user@example.com', PASSWORD)
+        cls.internship = Internship.objects.create(
+            company=Company.objects.create(name='Acme'), category=InternshipCategory.objects.create(name='IT'),
+            title='Intern', description='d', full_description='f',
+        )
+
+    def setUp(self):
+        super().setUp()
+        counters._snapshot.update(values=None, fetched_at=0.0, refreshing=False)
+        FakeThread.started = []
+
+    def counts(self):
+        return self.client.get(reverse('about-api')).data
+
+    def test_signals_keep_counts(self):
+        self.assertEqual(self.counts(), {'internship_count': 1, 'application_count': 0, 'user_count': 1})
+
+        other = User.objects.create_user('other', 'other@example.com', PASSWORD)
+        application = InternshipApplication.objects.create(user=other, internship=self.internship,
+                                                           file='apply/cv.pdf', description='d')
+        self.assertEqual(self.counts(), {'internship_count': 1, 'application_count': 1, 'user_count': 2})
+
+        application.delete()
+        other.delete()
+        self.internship.delete()
+        self.assertEqual(self.counts(), {'internship_count': 0, 'application_count': 0, 'user_count': 1})
+        self.assertEqual(counters.reconcile(), {})
+
+    def test_missing_counter_row_starts_from_count(self):
+        StatCounter.objects.filter(name=StatCounter.USERS).delete()
+        User.objects.create_user('other', 'other@example.com', PASSWORD)
+        self.assertEqual(StatCounter.objects.get(name=StatCounter.USERS).value, 2)
+
+    @override_settings(STAT_COUNTERS_TTL=60, STAT_COUNTERS_STALE_TTL=300)
+    @mock.patch.object(counters.threading, 'Thread', FakeThread)
+    def test_stale_while_revalidate(self):
+        self.assertEqual(counters.get_counts()[StatCounter.INTERNSHIPS], 1)
+        Internship.objects.create(company=self.internship.company, category=self.internship.category,
+                                  title='Intern 2', description='d', full_description='f')
+
+        # Marked stale: served as is while one refresh runs in the background.
+        with self.assertNumQueries(0):
+            self.assertEqual(counters.get_counts()[StatCounter.INTERNSHIPS], 1)
+            self.assertEqual(counters.get_counts()[StatCounter.INTERNSHIPS], 1)
+        self.assertEqual(len(FakeThread.started), 1)
+
+        FakeThread.started[0].run()
+        self.assertFalse(counters._snapshot['refreshing'])
+        with self.assertNumQueries(0):
+            self.assertEqual(counters.get_counts()[StatCounter.INTERNSHIPS], 2)
+
+    @override_settings(STAT_COUNTERS_TTL=60, STAT_COUNTERS_STALE_TTL=300)
+    @mock.patch.object(counters.threading, 'Thread', FakeThread)
+    def test_expired_snapshot_reloads_inline(self):
+        counters.get_counts()
+        counters._snapshot['fetched_at'] -= 360
+        with self.assertNumQueries(1):
+            counters.get_counts()
+        self.assertEqual(FakeThread.started, [])
+
+    def test_reconcile_counters(self):
+        StatCounter.objects.filter(name=StatCounter.INTERNSHIPS).update(value=5)
+        StatCounter.objects.filter(name=StatCounter.APPLICATIONS).delete()
+        Internship.objects.bulk_create([Internship(company=self.internship.company,
+                                                   category=self.internship.category,
+                                                   title='Imported', description='d', full_description='f')])
+
+        stdout = io.StringIO()
+        call_command('reconcile_counters', stdout=stdout)
+        self.assertIn('internships: 5 -> 2', stdout.getvalue())
+        self.assertIn('Fixed 1 counter(s).', stdout.getvalue())
+        self.assertEqual(dict(StatCounter.objects.values_list('name', 'value')),
+                         {StatCounter.INTERNSHIPS: 2, StatCounter.APPLICATIONS: 0, StatCounter.USERS: 1})
+
+        stdout = io.StringIO()
+        call_command('reconcile_counters', stdout=stdout)
+        self.assertIn('All counters are accurate.', stdout.getvalue())
@@ -0,0 +1,72 @@
+import os
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from main_app.models import Company, Internship, InternshipApplication, InternshipCategory
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+
+class ApplicationFileTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('applicant', 'applicant@example.com', PASSWORD)
+        cls.other = User.objects.create_user('other', 'other@example.com', PASSWORD)
+        cls.admin = User.objects.create_user('admin', 'admin@example.com', PASSWORD, is_staff=True)
+        internship = Internship.objects.create(
+            company=Company.objects.create(name='Acme'), category=InternshipCategory.objects.create(name='IT'),
+            title='Intern', description='d', full_description='f',
+        )
+        cls.application = InternshipApplication.objects.create(user=cls.user, internship=internship,
+                                                               file='apply/cv.pdf')
+
+    def application_with_file(self, content=b'%PDF-1.4 0123456789'):
+        path = os.path.join(self.media_root, self.application.file.name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return self.application, content, reverse('application-file', args=[self.application.pk])
+
+    def test_access(self):
+        _, _, url = self.application_with_file()
+        self.assertEqual(self.client.get(url).status_code, 401)
+        self.login(self.other)
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.login(self.admin)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_range(self):
+        _, content, url = self.application_with_file()
+        self.login(self.user)
+        response = self.client.get(url, HTTP_RANGE='bytes=2-5')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.getvalue(), content[2:6])
+        self.assertEqual(response['Content-Range'], f'bytes 2-5/{len(content)}')
+        self.assertEqual(response['Content-Length'], '4')
+        self.assertEqual(self.client.get(url, HTTP_RANGE='bytes=-3').getvalue(), content[-3:])
+        self.assertEqual(self.client.get(url, HTTP_RANGE='bytes=10-').getvalue(), content[10:])
+        response = self.client.get(url, HTTP_RANGE=f'bytes={len(content)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(content)}')
+        # Several ranges: the whole file.
+        self.assertEqual(self.client.get(url, HTTP_RANGE='bytes=0-1,4-5').getvalue(), content)
+
+    def test_conditional(self):
+        _, content, url = self.application_with_file()
+        self.login(self.user)
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MATCH='"other"').status_code, 412)
+        response = self.client.get(url, HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+        response = self.client.get(url, HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.getvalue(), content)
+
+    def test_accel_redirect(self):
+        application, _, url = self.application_with_file()
+        self.login(self.user)
+        with self.settings(PRIVATE_FILES_SERVER='x-accel-redirect', PRIVATE_FILES_ACCEL_PREFIX='/protected/'):
+            response = self.client.get(url)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected/{application.file.name}')
+        self.assertEqual(response.content, b'')
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+from main_app.models import Company, Internship, InternshipApplication, InternshipCategory
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+
+class ExportTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user('admin', 'admin@example.com', PASSWORD, is_staff=True)
+        internship = Internship.objects.create(
+            company=Company.objects.create(name='Acme'), category=InternshipCategory.objects.create(name='IT'),
+            title='Intern', description='d', full_description='f',
+        )
+        InternshipApplication.objects.create(user=cls.admin, internship=internship, file='apply/cv.pdf',
+                                             description='=HYPERLINK("http://x")')
+
+    def test_csv_escapes_formulas(self):
+        self.login(self.admin)
+        response = self.client.get(reverse('admin-application-export', args=['csv']))
+        row = next(csv.reader(io.StringIO(response.getvalue().decode().splitlines()[1])))
+        self.assertEqual(row[3], '\'=HYPERLINK("http://x")')
+        response = self.client.get(reverse('admin-application-export', args=['ndjson']))
+        self.assertEqual(json.loads(response.getvalue().splitlines()[0])['description'], '=HYPERLINK("http://x")')
+
+    def export(self, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('export_applications', *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_command_csv(self):
+        stdout, stderr = self.export()
+        header, row = csv.reader(io.StringIO(stdout))
+        self.assertEqual(header[3], 'description')
+        self.assertEqual(row[3], '\'=HYPERLINK("http://x")')
+        self.assertIn('Exported 1 applications', stderr)
+
+    def test_command_ndjson(self):
+        stdout, stderr = self.export('--format', 'ndjson', '--status', 'pending')
+        [line] = stdout.splitlines()
+        self.assertEqual(json.loads(line)['description'], '=HYPERLINK("http://x")')
+        self.assertIn('Exported 1 applications', stderr)
+        stdout, stderr = self.export('--format', 'ndjson', '--status', 'approved')
+        self.assertEqual(stdout, '')
+        self.assertIn('Exported 0 applications', stderr)
+
+    def test_command_output_file(self):
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        stdout, _ = self.export('--output', path)
+        self.assertEqual(stdout, '')
+        with open(path, encoding='utf-8', newline='') as f:
+            self.assertEqual(len(list(csv.reader(f))), 2)
+
+    def test_command_invalid_filter(self):
+        with self.assertRaises(CommandError):
+            self.export('--date-from', 'yesterday')
@@ -0,0 +1,64 @@
+import io
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+
+from main_app import images
+from main_app.models import Company, Internship, InternshipCategory
+from main_app.serializers import InternshipSerializer
+from main_app.tests.base import IsolatedAPITestCase
+
+
+class ImageVariantTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        company = Company.objects.create(name='Acme')
+        category = InternshipCategory.objects.create(name='IT')
+        cls.first, cls.second = [
+            Internship.objects.create(company=company, category=category, title=f'Intern {n}',
+                                      description='d', full_description='f')
+            for n in range(2)
+        ]
+
+    def save_image(self, name):
+        buffer = io.BytesIO()
+        Image.new('RGB', (400, 300), 'red').save(buffer, 'PNG')
+        default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    def test_replaced_with_image(self):
+        self.save_image('internships/a.png')
+        self.save_image('internships/b.png')
+        pk = self.first.pk
+        Internship.objects.filter(pk=pk).update(image='internships/a.png')
+        images.store_variants(pk, 'internships/a.png', images.render_variants('internships/a.png'))
+        old_files = images.variant_files(Internship.objects.get(pk=pk).image_variants)
+        self.assertTrue(all(default_storage.exists(name) for name in old_files))
+
+        Internship.objects.filter(pk=pk).update(image='internships/b.png')
+        internship = Internship.objects.get(pk=pk)
+        self.assertIsNone(InternshipSerializer(internship).data['image_variants'])
+        images.store_variants(pk, 'internships/b.png', images.render_variants('internships/b.png'))
+        internship.refresh_from_db()
+        self.assertEqual(InternshipSerializer(internship).data['image_variants']['thumbnail']['width'], 320)
+        self.assertFalse(any(default_storage.exists(name) for name in old_files))
+
+    def test_shared_variants_kept_while_in_use(self):
+        self.save_image('internships/shared.png')
+        self.save_image('internships/other.png')
+        variants = images.render_variants('internships/shared.png')
+        for internship in (self.first, self.second):
+            Internship.objects.filter(pk=internship.pk).update(image='internships/shared.png')
+            images.store_variants(internship.pk, 'internships/shared.png', variants)
+        shared_files = images.variant_files(variants)
+        other = images.render_variants('internships/other.png')
+
+        Internship.objects.filter(pk=self.first.pk).update(image='internships/other.png')
+        images.store_variants(self.first.pk, 'internships/other.png', other)
+        self.assertTrue(all(default_storage.exists(name) for name in shared_files))
+
+        second = Internship.objects.get(pk=self.second.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            second.image = None
+            second.save()
+        self.assertFalse(any(default_storage.exists(name) for name in shared_files))
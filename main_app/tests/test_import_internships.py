@@ -0,0 +1,133 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from core import counters
+from main_app import cache, search
+from main_app.models import Company, Internship, InternshipCategory, StatCounter
+from main_app.tests.base import IsolatedAPITestCase
+
+CSV = (
+    "external_id,title,company,category,published,description,full_description,apply_url\n"
+    "a-1,Backend intern,Acme,IT,2024-05-01,Django work,Full text,https://acme.example/apply\n"
+    "a-2,Designer intern,Globex,Design,,Figma work,,\n"
+)
+
+
+class ImportInternshipsTests(IsolatedAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir, ignore_errors=True)
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        return path
+
+    def run_import(self, path, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('import_internships', path, *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_csv(self):
+        Company.objects.create(name='Acme')
+        stdout, stderr = self.run_import(self.write('rows.csv', CSV))
+
+        self.assertIn('2 created, 0 updated, 0 skipped', stdout)
+        self.assertEqual(stderr, '')
+        backend = Internship.objects.get(external_id='a-1')
+        self.assertEqual((backend.company.name, backend.category.name), ('Acme', 'IT'))
+        self.assertEqual(str(backend.published), '2024-05-01')
+        self.assertEqual(backend.apply_url, 'https://acme.example/apply')
+        self.assertEqual(Company.objects.filter(name='Acme').count(), 1)
+        self.assertTrue(InternshipCategory.objects.filter(name='Design').exists())
+        self.assertIsNone(Internship.objects.get(external_id='a-2').published)
+
+    def test_jsonl_skips_invalid_rows(self):
+        path = self.write('rows.jsonl', '\n'.join([
+            '{"external_id": "j-1", "title": "Data intern", "company": "Acme", "category": "IT"}',
+            '{not json',
+            '{"external_id": "j-2", "company": "Acme", "category": "IT"}',
+            '["a", "list"]',
+            '{"title": "Dated", "company": "Acme", "category": "IT", "published": "01/05/2024"}',
+            '{"title": "Linked", "company": "Acme", "category": "IT", "apply_url": "not a url"}',
+            '',
+            '{"title": "Anonymous", "company": "Acme", "category": "IT"}',
+        ]) + '\n')
+        stdout, stderr = self.run_import(path)
+
+        self.assertIn('7 rows', stdout)
+        self.assertIn('2 created, 0 updated, 5 skipped', stdout)
+        self.assertIn('line 2: skipped, invalid JSON', stderr)
+        self.assertIn("line 3: skipped, 'title' is required", stderr)
+        self.assertIn('line 4: skipped, invalid JSON', stderr)
+        self.assertIn("line 5: skipped, 'published' is not a YYYY-MM-DD date", stderr)
+        self.assertIn("line 6: skipped, 'apply_url' is not a valid URL", stderr)
+        self.assertEqual(sorted(Internship.objects.values_list('title', flat=True)), ['Anonymous', 'Data intern'])
+
+    def test_upsert_on_external_id(self):
+        self.run_import(self.write('first.csv', CSV))
+        path = self.write('second.jsonl', '\n'.join([
+            '{"external_id": "a-1", "title": "Old title", "company": "Acme", "category": "IT"}',
+            '{"external_id": "a-1", "title": "Senior backend intern", "company": "Initech", "category": "IT"}',
+            '{"external_id": "a-3", "title": "QA intern", "company": "Acme", "category": "IT"}',
+        ]) + '\n')
+        stdout, _ = self.run_import(path)
+
+        self.assertIn('1 created, 1 updated, 0 skipped', stdout)
+        self.assertEqual(Internship.objects.count(), 3)
+        updated = Internship.objects.get(external_id='a-1')
+        self.assertEqual((updated.title, updated.company.name), ('Senior backend intern', 'Initech'))
+        self.assertIsNone(updated.published)
+
+    def test_updates_search_index_and_counters(self):
+        self.run_import(self.write('rows.csv', CSV))
+        self.run_import(self.write('rows.jsonl', (
+            '{"external_id": "a-2", "title": "Illustrator intern", "company": "Globex", "category": "Design"}\n'
+            '{"title": "Support intern", "company": "Acme", "category": "IT"}\n'
+        )))
+
+        self.assertEqual(counters.get_counts()[StatCounter.INTERNSHIPS], 3)
+        self.assertEqual(counters.reconcile(), {})
+        illustrator = Internship.objects.get(external_id='a-2').pk
+        self.assertEqual([hit[0] for hit in search.search('illustrator')[0]], [illustrator])
+        self.assertEqual(search.search('designer')[0], [])
+        self.assertEqual(len(search.search('support')[0]), 1)
+
+    def test_cache_invalidated_per_committed_chunk(self):
+        version = cache.get_version()
+        index = search.index_internships
+        calls = []
+
+        def fail_second_chunk(queryset):
+            calls.append(queryset)
+            if len(calls) == 2:
+                raise RuntimeError('boom')
+            index(queryset)
+
+        with mock.patch.object(search, 'index_internships', side_effect=fail_second_chunk):
+            with self.assertRaises(RuntimeError):
+                self.run_import(self.write('rows.csv', CSV), '--chunk-size', '1')
+
+        self.assertEqual(list(Internship.objects.values_list('external_id', flat=True)), ['a-1'])
+        self.assertNotEqual(cache.get_version(), version)
+
+    def test_nothing_imported_keeps_cache(self):
+        version = cache.get_version()
+        stdout, _ = self.run_import(self.write('rows.jsonl', '{"title": ""}\n'))
+        self.assertIn('0 created, 0 updated, 1 skipped', stdout)
+        self.assertEqual(cache.get_version(), version)
+
+    def test_format_required_for_unknown_extension(self):
+        with self.assertRaisesMessage(CommandError, '--format'):
+            call_command('import_internships', self.write('rows.txt', CSV))
+        stdout, _ = self.run_import(self.write('rows.txt', CSV), '--format', 'csv')
+        self.assertIn('2 created', stdout)
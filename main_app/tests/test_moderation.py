@@ -0,0 +1,54 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from main_app import moderation
+from main_app.models import Company, Internship, InternshipApplication, InternshipCategory
+
+
+class SetStatusByIdsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('applicant', 'applicant@example.com', 'x')
+        internship = Internship.objects.create(
+            company=Company.objects.create(name='Acme'), category=InternshipCategory.objects.create(name='IT'),
+            title='Intern', description='d', full_description='f',
+        )
+        cls.applications = [
+            InternshipApplication.objects.create(user=user, internship=internship, file=f'apply/cv-{n}.pdf')
+            for n in range(3)
+        ]
+
+    def test_outcomes(self):
+        decided = self.applications[0]
+        InternshipApplication.objects.filter(pk=decided.pk).update(status='rejected')
+        ids = [application.pk for application in self.applications]
+        updated, outcomes = moderation.set_status_by_ids(ids + [0], 'approved')
+        self.assertEqual(updated, 2)
+        self.assertEqual(outcomes[decided.pk], {'outcome': moderation.ALREADY_DECIDED, 'status': 'rejected'})
+        self.assertEqual(outcomes[ids[1]], {'outcome': moderation.UPDATED, 'status': 'approved'})
+        self.assertEqual(outcomes[0], {'outcome': moderation.NOT_FOUND, 'status': None})
+
+    def test_decided_concurrently(self):
+        ids = [application.pk for application in self.applications]
+        table = InternshipApplication._meta.db_table
+        update = QuerySet.update
+
+        def racing_update(queryset, **kwargs):
+            # Another reviewer gets in between the read and the UPDATE.
+            with connection.cursor() as cursor:
+                cursor.execute(f"UPDATE {table} SET status = 'rejected' WHERE id = %s", [ids[0]])
+                cursor.execute(f"DELETE FROM {table} WHERE id = %s", [ids[1]])
+            return update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', racing_update):
+            updated, outcomes = moderation.set_status_by_ids(ids, 'approved')
+        self.assertEqual(updated, 1)
+        self.assertEqual(outcomes, {
+            ids[0]: {'outcome': moderation.ALREADY_DECIDED, 'status': 'rejected'},
+            ids[1]: {'outcome': moderation.NOT_FOUND, 'status': None},
+            ids[2]: {'outcome': moderation.UPDATED, 'status': 'approved'},
+        })
@@ -0,0 +1,90 @@
+import io
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+
+from main_app import search
+from main_app.models import Company, Internship, InternshipCategory
+from main_app.tests.base import IsolatedAPITestCase
+
+
+class SearchTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(name='Acme')
+        cls.category = InternshipCategory.objects.create(name='IT')
+        cls.in_description = Internship.objects.create(
+            company=cls.company, category=cls.category, title='Backend intern',
+            description='Work with the python team', full_description='f',
+        )
+        cls.in_title = Internship.objects.create(
+            company=cls.company, category=cls.category, title='Python intern',
+            description='Backend work', full_description='f',
+        )
+
+    def hit_ids(self, query, **kwargs):
+        return [pk for pk, _, _ in search.search(query, **kwargs)[0]]
+
+    def indexed_ids(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT rowid FROM {search.FTS_TABLE} ORDER BY rowid")
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_title_match_ranks_first(self):
+        self.assertEqual(self.hit_ids('python'), [self.in_title.pk, self.in_description.pk])
+        self.assertEqual(self.hit_ids('backend'), [self.in_description.pk, self.in_title.pk])
+
+    def test_highlight(self):
+        response = self.client.get(reverse('internship-search'), {'query': 'pyth'})
+        self.assertEqual([row['id'] for row in response.data], [self.in_title.pk, self.in_description.pk])
+        self.assertIn('<mark>Python</mark>', response.data[0]['highlight'])
+        self.assertIn('<mark>python</mark>', response.data[1]['highlight'])
+
+    def test_user_operators_are_quoted(self):
+        self.assertEqual(search.build_match_query('python OR "NEAR('), '"python"* "OR"* "NEAR"*')
+        self.assertEqual(self.hit_ids('python OR nothing'), [])
+
+    def test_reindexed_on_company_rename(self):
+        self.assertEqual(self.hit_ids('globex'), [])
+        self.company.name = 'Globex'
+        self.company.save()
+        self.assertEqual(sorted(self.hit_ids('globex')), [self.in_description.pk, self.in_title.pk])
+        self.assertEqual(self.hit_ids('acme'), [])
+
+    def test_reindexed_on_category_rename(self):
+        self.category.name = 'Engineering'
+        self.category.save()
+        self.assertEqual(len(self.hit_ids('engineering')), 2)
+
+    def test_removed_on_delete(self):
+        self.in_title.delete()
+        self.assertEqual(self.hit_ids('python'), [self.in_description.pk])
+        self.assertEqual(self.indexed_ids(), [self.in_description.pk])
+
+    def test_rebuild_search_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.FTS_TABLE}")
+        # A row the signals never saw.
+        Internship.objects.bulk_create([Internship(company=self.company, category=self.category,
+                                                   title='Python data intern', description='d',
+                                                   full_description='f')])
+        self.assertEqual(self.hit_ids('python'), [])
+
+        stdout = io.StringIO()
+        call_command('rebuild_search_index', '--batch-size', '2', stdout=stdout)
+        self.assertIn('Indexed 3 internships', stdout.getvalue())
+        self.assertEqual(len(self.hit_ids('python')), 3)
+        self.assertEqual(self.indexed_ids(), sorted(Internship.objects.values_list('pk', flat=True)))
+
+    @override_settings(INTERNSHIP_FULL_TEXT_SEARCH=False)
+    def test_icontains_fallback(self):
+        response = self.client.get(reverse('internship-search'), {'query': 'python'})
+        self.assertEqual(sorted(row['id'] for row in response.data), [self.in_description.pk, self.in_title.pk])
+        self.assertNotIn('highlight', response.data[0])
+        self.assertEqual(self.client.get(reverse('internship-search'), {'query': 'team'}).data[0]['id'],
+                         self.in_description.pk)
+        with self.assertRaisesMessage(CommandError, 'only available'):
+            call_command('rebuild_search_index')
@@ -0,0 +1,64 @@
+import gzip
+import os
+import shutil
+import tempfile
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+
+class StaticFilesTests(SimpleTestCase):
+    """
+    collectstatic output (hashed names, .gz variants) served by StaticFilesMiddleware.
+    """
+    def setUp(self):
+        source, root = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, source, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        with open(os.path.join(source, 'app.css'), 'w') as f:
+            f.write("body { background: url('logo.png'); }\n" * 50)
+        with open(os.path.join(source, 'logo.png'), 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n' + b'\x00' * 512)
+        settings_override = override_settings(
+            STATIC_ROOT=root, STATICFILES_DIRS=[source],
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        call_command('collectstatic', interactive=False, verbosity=0)
+        self.css_url = staticfiles_storage.url('app.css')
+
+    def test_collectstatic_fingerprints_and_compresses(self):
+        self.assertNotEqual(self.css_url, '/static/app.css')
+        name = self.css_url.removeprefix('/static/')
+        self.assertTrue(staticfiles_storage.exists(name + '.gz'))
+        self.assertFalse(staticfiles_storage.exists(staticfiles_storage.stored_name('logo.png') + '.gz'))
+
+    def test_serves_gzip_variant_with_immutable_caching(self):
+        response = self.client.get(self.css_url, HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Type'], 'text/css; charset=utf-8')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+        with open(staticfiles_storage.path(self.css_url.removeprefix('/static/')), 'rb') as f:
+            self.assertEqual(gzip.decompress(response.getvalue()), f.read())
+
+    def test_serves_plain_file_without_accept_encoding(self):
+        response = self.client.get(self.css_url)
+        self.assertNotIn('Content-Encoding', response)
+        self.assertIn('logo.', response.getvalue().decode())
+        self.assertNotIn('immutable', self.client.get('/static/app.css')['Cache-Control'])
+
+    def test_if_none_match(self):
+        etag = self.client.get(self.css_url, HTTP_ACCEPT_ENCODING='gzip')['ETag']
+        response = self.client.get(self.css_url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        # The plain representation has its own ETag.
+        self.assertEqual(self.client.get(self.css_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_unknown_and_gz_paths_fall_through(self):
+        self.assertEqual(self.client.get('/static/missing.css').status_code, 404)
+        self.assertEqual(self.client.get(self.css_url + '.gz').status_code, 404)
@@ -0,0 +1,42 @@
+import os
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from core import throttling
+from main_app.models import Company, Internship, InternshipCategory
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+
+class ThrottlingTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('applicant', 'applicant@example.com', PASSWORD)
+        cls.internship = Internship.objects.create(
+            company=Company.objects.create(name='Acme'), category=InternshipCategory.objects.create(name='IT'),
+            title='Intern', description='d', full_description='f',
+        )
+
+    def test_buckets_are_shared_and_refill(self):
+        path = os.path.join(self.media_root, 'buckets')
+        worker_a, worker_b = throttling.BucketTable(path, 64), throttling.BucketTable(path, 64)
+        self.assertEqual(worker_a.consume('k', 2, 100), 0)
+        self.assertEqual(worker_b.consume('k', 2, 100), 0)
+        wait = worker_a.consume('k', 2, 100)
+        self.assertGreater(wait, 0)
+        self.assertLessEqual(wait, 0.01)
+        self.assertEqual(worker_b.consume('other', 2, 100), 0)
+        time.sleep(wait + 0.005)
+        self.assertEqual(worker_b.consume('k', 2, 100), 0)
+
+    def test_apply_throttled_per_user(self):
+        self.login(self.user)
+        with self.settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK,
+                                           'DEFAULT_THROTTLE_RATES': {'apply_user': '1/hour'}}):
+            data = {'internship': self.internship.pk, 'description': 'Hello'}
+            self.assertEqual(self.client.post(reverse('apply-to-internship'), data).status_code, 400)
+            response = self.client.post(reverse('apply-to-internship'), data)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '3600')
@@ -0,0 +1,47 @@
+import hashlib
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from main_app import uploads
+from main_app.models import Company, Internship, InternshipCategory, UploadSession
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+
+class UploadSessionTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('applicant', 'applicant@example.com', PASSWORD)
+        cls.other = User.objects.create_user('other', 'other@example.com', PASSWORD)
+        cls.internship = Internship.objects.create(
+            company=Company.objects.create(name='Acme'), category=InternshipCategory.objects.create(name='IT'),
+            title='Intern', description='d', full_description='f',
+        )
+
+    def test_reuses_only_own_blobs(self):
+        content = b'%PDF-1.4 known cv'
+        digest = hashlib.sha256(content).hexdigest()
+        self.login(self.user)
+        self.client.post(reverse('apply-to-internship'), {
+            'internship': self.internship.pk, 'file': SimpleUploadedFile('cv.pdf', content), 'description': 'Hi',
+        }, format='multipart')
+
+        response = self.client.post(reverse('upload-session'),
+                                    {'filename': 'cv.pdf', 'size': len(content), 'sha256': digest}, format='json')
+        self.assertTrue(response.data['is_complete'])
+        response = self.client.post(reverse('upload-session'),
+                                    {'filename': 'cv.pdf', 'size': len(content) + 1, 'sha256': digest}, format='json')
+        self.assertEqual(response.status_code, 422)
+
+        # Someone else knowing the digest has to send the bytes.
+        self.login(self.other)
+        response = self.client.post(reverse('upload-session'),
+                                    {'filename': 'cv.pdf', 'size': len(content), 'sha256': digest}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(response.data['is_complete'])
+        url = reverse('upload-session-detail', args=[response.data['id']])
+        response = self.client.generic('PATCH', url, content, content_type='application/offset+octet-stream',
+                                       HTTP_UPLOAD_OFFSET='0')
+        self.assertTrue(response.data['is_complete'])
+        self.assertEqual(UploadSession.objects.get(pk=response.data['id']).blob, uploads.find_blob(digest))
@@ -0,0 +1,256 @@
+"""
+Content-addressed storage for application files, with resumable chunked uploads.
+
+Files are stored once per SHA-256 digest under a sharded layout::
+
+    apply/sha256/ab/cd/abcd…ef.pdf
+
+so the same CV attached to many applications costs no extra disk. A client
+that sends the digest up front skips the transfer entirely when it has
+uploaded that blob before; anyone else's identical content is only
+deduplicated after its bytes have been received and hashed.
+
+Chunked uploads append to a partial file outside MEDIA_ROOT and hash it
+incrementally while writing. The running hash is kept per process; a
+worker that did not see the previous chunks rebuilds it from the partial
+file once and carries on.
+"""
+import fcntl
+import hashlib
+import os
+import posixpath
+import threading
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from .models import InternshipApplication, UploadSession
+
+CAS_DIR = 'apply/sha256'
+READ_SIZE = 64 * 1024
+
+_hashers = {}
+_hashers_lock = threading.Lock()
+
+
+class UploadError(Exception):
+    """
+    Raised for client errors; ``status`` is the HTTP status to answer with.
+    """
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def max_size():
+    return getattr(settings, 'CHUNKED_UPLOAD_MAX_SIZE', 20 * 1024 * 1024)
+
+
+def max_chunk_size():
+    return getattr(settings, 'CHUNKED_UPLOAD_MAX_CHUNK_SIZE', 4 * 1024 * 1024)
+
+
+def temp_dir():
+    return str(getattr(settings, 'CHUNKED_UPLOAD_TEMP_DIR', os.path.join(settings.BASE_DIR, '.uploads')))
+
+
+def _shard(digest):
+    return f"{CAS_DIR}/{digest[:2]}/{digest[2:4]}"
+
+
+def _extension(filename):
+    ext = posixpath.splitext(filename)[1].lower()
+    return ext if ext.isascii() and len(ext) <= 10 else ''
+
+
+def blob_name(digest, filename):
+    return f"{_shard(digest)}/{digest}{_extension(filename)}"
+
+
+def find_blob(digest):
+    """
+    Storage name of the blob with this digest, whatever its extension, or ``None``.
+    """
+    shard = _shard(digest)
+    try:
+        _, files = default_storage.listdir(shard)
+    except FileNotFoundError:
+        return None
+    for name in files:
+        if name.split('.', 1)[0] == digest:
+            return f"{shard}/{name}"
+    return None
+
+
+def store_file(uploaded_file):
+    """
+    Store a whole uploaded file (single-request upload) content-addressed.
+
+    Returns the storage name; an existing identical blob is reused.
+    """
+    hasher = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        hasher.update(chunk)
+    digest = hasher.hexdigest()
+    existing = find_blob(digest)
+    if existing:
+        return existing
+    uploaded_file.seek(0)
+    return default_storage.save(blob_name(digest, uploaded_file.name), uploaded_file)
+
+
+def partial_path(session):
+    return os.path.join(temp_dir(), f"{session.pk}.part")
+
+
+def owned_blob(user, digest):
+    """
+    Storage name of the blob with this digest if ``user`` has already
+    uploaded or applied with it, else ``None``.
+
+    A digest alone proves nothing about having the content, so another
+    user's blob is never handed out (nor its existence revealed) this way.
+    """
+    name = find_blob(digest)
+    if name is None:
+        return None
+    if (UploadSession.objects.filter(user=user, blob=name).exists()
+            or InternshipApplication.objects.filter(user=user, file=name).exists()):
+        return name
+    return None
+
+
+def create_session(user, filename, size, sha256=''):
+    if size < 0 or size > max_size():
+        raise UploadError(f"File size must be between 0 and {max_size()} bytes.", status=413)
+    sha256 = (sha256 or '').lower()
+    session = UploadSession(user=user, filename=filename, size=size, sha256=sha256)
+    existing = owned_blob(user, sha256) if sha256 else None
+    if existing:
+        if default_storage.size(existing) != size:
+            raise UploadError("'size' does not match the file with this checksum.", status=422)
+        # Content this user has sent before: nothing to transfer.
+        session.offset = size
+        session.blob = existing
+        session.completed_at = timezone.now()
+        session.save()
+        return session
+    session.save()
+    os.makedirs(temp_dir(), exist_ok=True)
+    open(partial_path(session), 'wb').close()
+    if size == 0:
+        _complete(session, hashlib.sha256())
+    return session
+
+
+def _hasher_for(session, path):
+    with _hashers_lock:
+        offset, hasher = _hashers.get(session.pk, (None, None))
+    if offset == session.offset:
+        return hasher
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as partial:
+        remaining = session.offset
+        while remaining:
+            data = partial.read(min(READ_SIZE, remaining))
+            if not data:
+                break
+            hasher.update(data)
+            remaining -= len(data)
+    return hasher
+
+
+def append_chunk(session, offset, stream, length):
+    """
+    Write ``length`` bytes from ``stream`` at ``offset`` and return the updated session.
+
+    The partial file is locked while writing so two requests for the same
+    session can't interleave; a stale ``offset`` answers 409 with the
+    current one, which the client resumes from.
+    """
+    if session.is_complete:
+        raise UploadError("Upload is already complete.", status=409)
+    if length is None or length < 0:
+        raise UploadError("Content-Length is required.", status=411)
+    if length > max_chunk_size():
+        raise UploadError(f"Chunks may not exceed {max_chunk_size()} bytes.", status=413)
+
+    path = partial_path(session)
+    if not os.path.exists(path):
+        raise UploadError("Upload session has expired.", status=410)
+    with open(path, 'r+b') as partial:
+        fcntl.flock(partial, fcntl.LOCK_EX)
+        try:
+            session.refresh_from_db(fields=['offset', 'blob'])
+            if offset != session.offset:
+                raise UploadError(f"Offset mismatch, resume from {session.offset}.", status=409)
+            if session.offset + length > session.size:
+                raise UploadError("Chunk goes past the declared file size.", status=413)
+
+            hasher = _hasher_for(session, path)
+            partial.seek(session.offset)
+            partial.truncate()
+            remaining = length
+            while remaining:
+                data = stream.read(min(READ_SIZE, remaining))
+                if not data:
+                    break
+                partial.write(data)
+                hasher.update(data)
+                remaining -= len(data)
+            partial.flush()
+            os.fsync(partial.fileno())
+
+            written = length - remaining
+            session.offset += written
+            UploadSession.objects.filter(pk=session.pk).update(offset=session.offset)
+            if remaining:
+                _forget(session)
+                raise UploadError(f"Connection dropped, resume from {session.offset}.", status=400)
+            with _hashers_lock:
+                _hashers[session.pk] = (session.offset, hasher)
+        finally:
+            fcntl.flock(partial, fcntl.LOCK_UN)
+
+    if session.offset == session.size:
+        _complete(session, hasher)
+    return session
+
+
+def _forget(session):
+    with _hashers_lock:
+        _hashers.pop(session.pk, None)
+
+
+def _complete(session, hasher):
+    path = partial_path(session)
+    digest = hasher.hexdigest()
+    _forget(session)
+    if session.sha256 and session.sha256 != digest:
+        os.remove(path)
+        session.delete()
+        raise UploadError("Checksum mismatch, upload discarded.", status=422)
+
+    name = find_blob(digest)
+    if name:
+        os.remove(path)
+    else:
+        name = blob_name(digest, session.filename)
+        target = default_storage.path(name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(path, target)
+
+    session.sha256 = digest
+    session.blob = name
+    session.completed_at = timezone.now()
+    session.save(update_fields=['sha256', 'blob', 'completed_at'])
+
+
+def abort_session(session):
+    _forget(session)
+    try:
+        os.remove(partial_path(session))
+    except FileNotFoundError:
+        pass
+    session.delete()
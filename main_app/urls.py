@@ -1,13 +1,19 @@
 from django.urls import path
+from . import async_views
 from .views import (
     ContactMessageView,
     InternshipListView,
     InternshipDetailView,
     InternshipSearchView,
     ApplyToInternshipView,
+    UploadSessionView,
+    UploadSessionDetailView,
     AboutView,
     AdminAboutView,
     AdminApplicationView,
+    AdminApplicationBulkStatusView,
+    AdminApplicationExportView,
+    ApplicationFileView,
     UserApplicationsView,
     ChangeLanguageAPI,
 )
@@ -18,16 +24,30 @@ urlpatterns = [
     path('internships/<int:pk>/', InternshipDetailView.as_view(), name='internship-detail'),
     path('internships/search/', InternshipSearchView.as_view(), name='internship-search'),
     path('apply/', ApplyToInternshipView.as_view(), name='apply-to-internship'),
+    path('uploads/', UploadSessionView.as_view(), name='upload-session'),
+    path('uploads/<uuid:pk>/', UploadSessionDetailView.as_view(), name='upload-session-detail'),
     path('about/', AboutView.as_view(), name='about-api'),
     path('my-applications/', UserApplicationsView.as_view(), name='user-applications'),
+    path('applications/<int:pk>/file/', ApplicationFileView.as_view(), name='application-file'),
 
     # for admin
     path('admin/about/', AdminAboutView.as_view(), name='admin-about-api'),
 
     # Foydalanuvchi applicationlarini boshqarish
     path('applications/admin/', AdminApplicationView.as_view(), name='admin-applications'),
+    path('applications/admin/bulk-status/', AdminApplicationBulkStatusView.as_view(),
+         name='admin-application-bulk-status'),
+    path('applications/admin/export/<str:export_format>/', AdminApplicationExportView.as_view(),
+         name='admin-application-export'),
     path('applications/admin/<int:pk>/<str:action>/', AdminApplicationView.as_view(), name='admin-application-action'),
 
+    # async (ASGI) read path
+    path('async/internships/', async_views.internship_list, name='async-internship-list'),
+    path('async/internships/<int:pk>/', async_views.internship_detail, name='async-internship-detail'),
+    path('async/internships/search/', async_views.internship_search, name='async-internship-search'),
+    path('async/about/', async_views.about, name='async-about-api'),
+    path('async/my-applications/', async_views.user_applications, name='async-user-applications'),
+
     # language
     path('change-language/', ChangeLanguageAPI.as_view(), name='change-language'),
 ]
@@ -1,40 +1,67 @@
-from django.contrib.auth.models import User
+import io
+import os
+
+from django.core.files.storage import default_storage
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.utils.translation import activate
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
+from rest_framework.exceptions import NotFound
 from rest_framework.generics import ListAPIView, RetrieveAPIView, ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser, IsAuthenticatedOrReadOnly, IsAuthenticated
-from .models import Internship, ContactMessage, InternshipApplication
+from rest_framework.utils.urls import replace_query_param
+from core import counters
+from core.throttling import IPRateThrottle, UserRateThrottle
+from . import contact_spool, downloads, exports, moderation, search, streaming, uploads
+from .cache import cache_catalog_response
+from .models import Internship, ContactMessage, InternshipApplication, StatCounter, UploadSession
+from .pagination import KeysetCursorPagination, ReviewQueuePagination
 from .serializers import (
     InternshipSerializer,
+    InternshipSearchResultSerializer,
     ContactMessageSerializer,
     InternshipApplicationSerializer,
+    ApplicationReviewSerializer,
+    ApplicationBulkStatusSerializer,
+    UploadSessionSerializer,
 )
 from django.conf import settings
 
+FIELDS_PARAMETER = openapi.Parameter(
+    'fields', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+    description="Comma-separated fields to return, e.g. 'id,title,company'.",
+)
+OMIT_PARAMETER = openapi.Parameter(
+    'omit', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+    description="Comma-separated fields to leave out.",
+)
+
 
 class AboutView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get(self, request, *args, **kwargs):
-        internship_count = Internship.objects.count()
-        application_count = InternshipApplication.objects.count()
-        user_count = User.objects.count()
+        counts = counters.get_counts()
 
         return Response({
-            'internship_count': internship_count,
-            'application_count': application_count,
-            'user_count': user_count,
+            'internship_count': counts[StatCounter.INTERNSHIPS],
+            'application_count': counts[StatCounter.APPLICATIONS],
+            'user_count': counts[StatCounter.USERS],
         })
 
 class ContactMessageView(APIView):
     """
     API endpoint for managing contact messages.
     """
+    throttle_scope = 'contact'
+
+    def get_throttles(self):
+        # Only sending a message is public and worth limiting.
+        return [IPRateThrottle()] if self.request.method == 'POST' else []
 
     @swagger_auto_schema(
         operation_description="Retrieve a list of all contact messages or a single message by ID.",
@@ -75,6 +102,7 @@ class ContactMessageView(APIView):
                 "Message created successfully!",
                 ContactMessageSerializer
             ),
+            202: "Message accepted; it is stored shortly (spooled ingestion).",
             400: "Bad Request",
         },
     )
@@ -83,10 +111,13 @@ class ContactMessageView(APIView):
         Create a new contact message.
         """
         serializer = ContactMessageSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response({"message": "Message sent successfully!"}, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if contact_spool.enabled():
+            contact_spool.enqueue(serializer.validated_data)
+            return Response({"message": "Message sent successfully!"}, status=status.HTTP_202_ACCEPTED)
+        serializer.save()
+        return Response({"message": "Message sent successfully!"}, status=status.HTTP_201_CREATED)
 
     @swagger_auto_schema(
         operation_description="Update a contact message by ID.",
@@ -159,16 +190,40 @@ class InternshipListView(ListCreateAPIView):
     """
     List all internships or create a new one (Admins only for creating).
     """
-    queryset = Internship.objects.all()
+    queryset = Internship.objects.select_related('company', 'category')
     serializer_class = InternshipSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method != 'GET':
+            return queryset
+        selected = InternshipSerializer.selected_fields(self.request, summary=True)
+        # created_at is the pagination key.
+        return InternshipSerializer.project_queryset(queryset, selected, always=['created_at'])
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), 'summary': self.request.method == 'GET'}
+
+    def list(self, request, *args, **kwargs):
+        # The unpaginated list is the big one: stream it from values() rows.
+        if self.paginator.is_requested(request) or not streaming.can_stream(request):
+            return super().list(request, *args, **kwargs)
+        return streaming.streaming_json_response(self.get_serializer(), self.filter_queryset(self.get_queryset()))
 
     @swagger_auto_schema(
-        operation_description="Retrieve a list of all internships.",
+        operation_description=(
+            "Retrieve a list of all internships. Pass `page_size` (max 100) or `cursor` "
+            "to get a cursor-paginated page with `next`/`previous` links. Items leave out "
+            "`full_description` unless it is named in `fields`."
+        ),
+        manual_parameters=[FIELDS_PARAMETER, OMIT_PARAMETER],
         responses={
             200: InternshipSerializer(many=True)
         },
     )
+    @cache_catalog_response
     def get(self, request, *args, **kwargs):
         """
         List all internships.
@@ -196,17 +251,25 @@ class InternshipDetailView(RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, or delete an internship (Admins only for update/delete).
     """
-    queryset = Internship.objects.all()
+    queryset = Internship.objects.select_related('company', 'category')
     serializer_class = InternshipSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method != 'GET':
+            return queryset
+        return InternshipSerializer.project_queryset(queryset, InternshipSerializer.selected_fields(self.request))
+
     @swagger_auto_schema(
         operation_description="Retrieve details of a specific internship by ID.",
+        manual_parameters=[FIELDS_PARAMETER, OMIT_PARAMETER],
         responses={
             200: InternshipSerializer,
             404: "Not Found"
         },
     )
+    @cache_catalog_response
     def get(self, request, *args, **kwargs):
         """
         Retrieve an internship by ID.
@@ -264,36 +327,206 @@ class InternshipDetailView(RetrieveUpdateDestroyAPIView):
 
 
 class InternshipSearchView(APIView):
+    """
+    Search internships. A text query is answered from the full-text index,
+    ranked by relevance and returned with a highlighted snippet.
+    """
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Search internships by text, category and company. Pass `page_size` or `cursor` "
+            "to get a cursor-paginated page with `next`/`previous` links."
+        ),
+        manual_parameters=[
+            openapi.Parameter('query', openapi.IN_QUERY, description="Search text.", type=openapi.TYPE_STRING),
+            openapi.Parameter('category', openapi.IN_QUERY, description="Category name filter.",
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('company', openapi.IN_QUERY, description="Company name filter.",
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="Opaque cursor from a previous page.",
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="Page size (max 100).",
+                              type=openapi.TYPE_INTEGER),
+            FIELDS_PARAMETER,
+            OMIT_PARAMETER,
+        ],
+        responses={200: InternshipSearchResultSerializer(many=True)},
+    )
+    @cache_catalog_response
     def get(self, request):
         query = request.query_params.get('query', '')
         category = request.query_params.get('category', None)
         company = request.query_params.get('company', None)
-        internships = Internship.objects.all()
+        internships = Internship.objects.select_related('company', 'category')
 
-        if query:
-            internships = internships.filter(
-                Q(title__icontains=query) | Q(description__icontains=query)
-            )
         if category:
             internships = internships.filter(category__name__icontains=category)
         if company:
             internships = internships.filter(company__name__icontains=company)
 
-        serializer = InternshipSerializer(internships, many=True)
+        if query and search.is_enabled():
+            return self.ranked_response(request, query, internships, filtered=bool(category or company))
+        if query:
+            internships = internships.filter(
+                Q(title__icontains=query) | Q(description__icontains=query)
+            )
+
+        context = {'request': request, 'summary': True}
+        selected = InternshipSerializer.selected_fields(request, summary=True)
+        internships = InternshipSerializer.project_queryset(internships, selected, always=['created_at'])
+        paginator = KeysetCursorPagination()
+        page = paginator.paginate_queryset(internships, request, view=self)
+        if page is not None:
+            serializer = InternshipSerializer(page, many=True, context=context)
+            return paginator.get_paginated_response(serializer.data)
+        serializer = InternshipSerializer(internships, many=True, context=context)
         return Response(serializer.data)
 
+    def ranked_response(self, request, query, internships, filtered):
+        paginator = KeysetCursorPagination()
+        paginated = paginator.is_requested(request)
+        limit = paginator.get_page_size(request) if paginated else None
+
+        cursor = None
+        encoded = request.query_params.get(paginator.cursor_query_param)
+        if paginated and encoded:
+            try:
+                cursor = search.decode_cursor(encoded)
+            except search.InvalidCursor:
+                raise NotFound(paginator.invalid_cursor_message)
+
+        hits, has_more = search.search(
+            query,
+            queryset=internships if filtered else None,
+            limit=limit,
+            cursor=cursor,
+        )
+        selected = InternshipSearchResultSerializer.selected_fields(request, summary=True)
+        objects = InternshipSearchResultSerializer.project_queryset(internships, selected).in_bulk(
+            [pk for pk, _, _ in hits]
+        )
+        results = []
+        for pk, score, snippet in hits:
+            internship = objects.get(pk)
+            if internship is not None:
+                internship.search_highlight = snippet
+                results.append(internship)
+        data = InternshipSearchResultSerializer(results, many=True, context={'request': request, 'summary': True}).data
+        if not paginated:
+            return Response(data)
+
+        next_cursor, previous_cursor = search.page_cursors(hits, has_more, cursor)
+        url = request.build_absolute_uri()
+        next_url = next_cursor and replace_query_param(url, paginator.cursor_query_param, next_cursor)
+        previous_url = previous_cursor and replace_query_param(url, paginator.cursor_query_param, previous_cursor)
+        return Response({
+            'next': next_url,
+            'previous': previous_url,
+            'results': data,
+        })
+
 
 class ApplyToInternshipView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'apply'
+    throttle_classes = [UserRateThrottle, IPRateThrottle]
 
     def post(self, request):
-        serializer = InternshipApplicationSerializer(data=request.data)
+        serializer = InternshipApplicationSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             serializer.save(user=request.user)
             return Response({"message": "Application submitted successfully!"}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def upload_response(session, status_code=status.HTTP_200_OK):
+    response = Response(UploadSessionSerializer(session).data, status=status_code)
+    response['Upload-Offset'] = session.offset
+    response['Upload-Length'] = session.size
+    return response
+
+
+class UploadSessionView(APIView):
+    """
+    Start a resumable upload of an application file.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Start an upload session. If 'sha256' matches a file you have uploaded before, "
+            "the session is complete right away and nothing needs to be sent."
+        ),
+        request_body=UploadSessionSerializer,
+        responses={201: UploadSessionSerializer, 400: "Bad Request", 413: "File too large.",
+                   422: "'size' does not match the file with this checksum."}
+    )
+    def post(self, request):
+        serializer = UploadSessionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            session = uploads.create_session(request.user, **serializer.validated_data)
+        except uploads.UploadError as e:
+            return Response({"error": str(e)}, status=e.status)
+        return upload_response(session, status.HTTP_201_CREATED)
+
+
+class UploadSessionDetailView(APIView):
+    """
+    Check, continue or abort an upload session.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get_session(self, request, pk):
+        try:
+            return UploadSession.objects.get(pk=pk, user=request.user)
+        except UploadSession.DoesNotExist:
+            raise NotFound("Upload session not found.")
+
+    @swagger_auto_schema(
+        operation_description="Current state of the upload; resume from 'offset' (also sent as Upload-Offset).",
+        responses={200: UploadSessionSerializer, 404: "Not Found"}
+    )
+    def get(self, request, pk):
+        return upload_response(self.get_session(request, pk))
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Append the raw request body at the offset given in the Upload-Offset header. "
+            "A wrong offset answers 409 with the current one."
+        ),
+        manual_parameters=[
+            openapi.Parameter('Upload-Offset', openapi.IN_HEADER, description="Byte offset of this chunk.",
+                              type=openapi.TYPE_INTEGER, required=True),
+        ],
+        responses={200: UploadSessionSerializer, 404: "Not Found", 409: "Offset mismatch.", 413: "Too large."}
+    )
+    def patch(self, request, pk):
+        session = self.get_session(request, pk)
+        try:
+            offset = int(request.headers['Upload-Offset'])
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except (KeyError, ValueError):
+            return Response({"error": "Upload-Offset and Content-Length headers are required."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            session = uploads.append_chunk(session, offset, request.stream or io.BytesIO(), length)
+        except uploads.UploadError as e:
+            response = Response({"error": str(e)}, status=e.status)
+            response['Upload-Offset'] = session.offset
+            return response
+        return upload_response(session)
+
+    @swagger_auto_schema(
+        operation_description="Abort the upload and discard what was sent.",
+        responses={204: "Upload session deleted.", 404: "Not Found"}
+    )
+    def delete(self, request, pk):
+        uploads.abort_session(self.get_session(request, pk))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 class AdminApplicationView(APIView):
     """
     Admin view for managing internship applications.
@@ -301,16 +534,39 @@ class AdminApplicationView(APIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     @swagger_auto_schema(
-        operation_description="Retrieve a list of all pending applications.",
-        responses={200: InternshipApplicationSerializer(many=True)}
+        operation_description=(
+            "Pending applications, oldest first, in keyset pages. "
+            "Follow 'next' for the following page."
+        ),
+        manual_parameters=[
+            openapi.Parameter('internship', openapi.IN_QUERY, description="Internship ID.",
+                              type=openapi.TYPE_INTEGER),
+            openapi.Parameter('company', openapi.IN_QUERY, description="Company ID.", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="Page cursor from 'next'/'previous'.",
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="Applications per page (max 100).",
+                              type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: ApplicationReviewSerializer(many=True), 400: "Bad Request"}
     )
     def get(self, request):
         """
-        Get all pending internship applications.
+        Get the pending internship applications review queue.
         """
-        applications = InternshipApplication.objects.filter(status='pending')
-        serializer = InternshipApplicationSerializer(applications, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        try:
+            applications = exports.filter_applications(
+                InternshipApplication.objects.filter(status='pending'),
+                internship=request.query_params.get('internship'),
+                company=request.query_params.get('company'),
+            )
+        except exports.InvalidFilter as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        applications = applications.select_related('user', 'internship__company')
+
+        paginator = ReviewQueuePagination()
+        page = paginator.paginate_queryset(applications, request, view=self)
+        serializer = ApplicationReviewSerializer(page, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         operation_description="Approve or reject a specific application by ID.",
@@ -329,31 +585,25 @@ class AdminApplicationView(APIView):
             404: "Not Found"
         }
     )
-    def post(self, request, pk):
+    def post(self, request, pk, action=None):
         """
-        Approve or reject an application. Requires 'approve' or 'reject' as action in query params.
+        Approve or reject an application. The action ('approve' or 'reject') comes from the URL or query params.
         """
-        action = request.query_params.get('action', None)
-
-        try:
-            application = InternshipApplication.objects.get(pk=pk)
-        except InternshipApplication.DoesNotExist:
-            return Response({"error": "Application not found"}, status=status.HTTP_404_NOT_FOUND)
-
-        if action == 'approve':
-            application.status = 'approved'
-            application.save()
-            return Response({"status": "Tasdiqlangan"}, status=status.HTTP_200_OK)
-        elif action == 'reject':
-            application.status = 'rejected'
-            application.save()
-            return Response({"status": "Rad etilgan"}, status=status.HTTP_200_OK)
-        else:
+        action = action or request.query_params.get('action', None)
+        new_status, message = {
+            'approve': ('approved', "Tasdiqlangan"),
+            'reject': ('rejected', "Rad etilgan"),
+        }.get(action, (None, None))
+        if new_status is None:
             return Response(
                 {"error": "Invalid action. Use 'approve' or 'reject'."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        if not InternshipApplication.objects.filter(pk=pk).update(status=new_status):
+            return Response({"error": "Application not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"status": message}, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         operation_description="Delete a specific application by ID.",
         responses={
@@ -361,7 +611,7 @@ class AdminApplicationView(APIView):
             404: "Not Found"
         }
     )
-    def delete(self, request, pk):
+    def delete(self, request, pk, action=None):
         """
         Delete a specific application by ID.
         """
@@ -373,6 +623,119 @@ class AdminApplicationView(APIView):
             return Response({"error": "Application not found"}, status=status.HTTP_404_NOT_FOUND)
 
 
+class ApplicationFileView(APIView):
+    """
+    Download the file attached to an application: for the applicant and for admins.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def perform_content_negotiation(self, request, force=False):
+        # The response is the file itself, whatever the client says it accepts.
+        return super().perform_content_negotiation(request, force=True)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "The application's file. Supports Range (206) and conditional requests "
+            "(If-None-Match / If-Modified-Since)."
+        ),
+        responses={200: "The file.", 206: "Partial content.", 304: "Not Modified", 404: "Not Found",
+                   416: "Range Not Satisfiable"}
+    )
+    def get(self, request, pk):
+        applications = InternshipApplication.objects.filter(pk=pk)
+        if not request.user.is_staff:
+            # Someone else's application is indistinguishable from a missing one.
+            applications = applications.filter(user=request.user)
+        name = applications.values_list('file', flat=True).first()
+        if not name:
+            raise NotFound("Application not found")
+        extension = os.path.splitext(name)[1]
+        return downloads.serve_file(request, default_storage.path(name), f"application-{pk}{extension}")
+
+
+class AdminApplicationBulkStatusView(APIView):
+    """
+    Approve or reject many pending applications at once.
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Set 'status' (approved or rejected) on pending applications selected by 'ids' "
+            "or by filters (internship, company, date_from, date_to). Decided applications are left alone. "
+            "With 'ids', the response lists the outcome for each id."
+        ),
+        request_body=ApplicationBulkStatusSerializer,
+        responses={200: openapi.Response("Number of updated applications and per-id outcomes."), 400: "Bad Request"}
+    )
+    def post(self, request):
+        serializer = ApplicationBulkStatusSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        if 'ids' in data:
+            updated, outcomes = moderation.set_status_by_ids(data['ids'], data['status'])
+            return Response({
+                "updated": updated,
+                "results": [{"id": pk, **outcome} for pk, outcome in outcomes.items()],
+            }, status=status.HTTP_200_OK)
+
+        try:
+            applications = exports.filter_applications(
+                InternshipApplication.objects.all(),
+                **{name: data[name] for name in ApplicationBulkStatusSerializer.FILTERS if name in data}
+            )
+        except exports.InvalidFilter as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        updated = moderation.set_status_by_filter(applications, data['status'])
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
+
+class AdminApplicationExportView(APIView):
+    """
+    Stream internship applications as CSV or NDJSON for admins.
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Export applications as a CSV or NDJSON stream ('csv' or 'ndjson' in the URL).",
+        manual_parameters=[
+            openapi.Parameter('status', openapi.IN_QUERY, description="pending, approved or rejected.",
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('internship', openapi.IN_QUERY, description="Internship ID.",
+                              type=openapi.TYPE_INTEGER),
+            openapi.Parameter('company', openapi.IN_QUERY, description="Company ID.", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('date_from', openapi.IN_QUERY, description="Applied at or after (ISO date/datetime).",
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('date_to', openapi.IN_QUERY, description="Applied at or before (ISO date/datetime).",
+                              type=openapi.TYPE_STRING),
+        ],
+        responses={200: "Export stream.", 400: "Bad Request", 404: "Unknown format."}
+    )
+    def get(self, request, export_format):
+        if export_format not in exports.FORMATS:
+            return Response({"error": "Format must be 'csv' or 'ndjson'."}, status=status.HTTP_404_NOT_FOUND)
+        params = request.query_params
+        try:
+            queryset = exports.get_queryset(
+                status=params.get('status'),
+                internship=params.get('internship'),
+                company=params.get('company'),
+                date_from=params.get('date_from'),
+                date_to=params.get('date_to'),
+            )
+        except exports.InvalidFilter as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(
+            exports.iter_export(export_format, queryset),
+            content_type=exports.FORMATS[export_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="applications.{export_format}"'
+        return response
+
+
 class AdminAboutView(APIView):
     """
     API endpoint for admin statistics and managing about information.
@@ -398,14 +761,12 @@ class AdminAboutView(APIView):
         """
         Retrieve admin statistics.
         """
-        internship_count = Internship.objects.count()
-        application_count = InternshipApplication.objects.count()
-        user_count = User.objects.count()
+        counts = counters.get_counts()
 
         return Response({
-            'internship_count': internship_count,
-            'application_count': application_count,
-            'user_count': user_count,
+            'internship_count': counts[StatCounter.INTERNSHIPS],
+            'application_count': counts[StatCounter.APPLICATIONS],
+            'user_count': counts[StatCounter.USERS],
         }, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -494,6 +855,8 @@ class UserApplicationsView(APIView):
     def get(self, request, *args, **kwargs):
         user = request.user
         applications = InternshipApplication.objects.filter(user=user)
+        if streaming.can_stream(request):
+            return streaming.streaming_json_response(InternshipApplicationSerializer(), applications)
         serializer = InternshipApplicationSerializer(applications, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -0,0 +1,27 @@
+"""
+Async (ASGI) version of the profile read endpoint; see ``main_app/async_views.py``.
+"""
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+
+from core.async_views import json_response, method_not_allowed
+from .authenticate import login_required
+
+
+@login_required
+async def user_profile(request, user):
+    if request.method != 'GET':
+        return method_not_allowed(request)
+    # ``user`` may come from the cached JWT flags with its other fields deferred,
+    # and a lazy load is not allowed here: read everything in one query instead.
+    row = await User.objects.filter(pk=user.pk).values(
+        'first_name', 'last_name', 'email', 'profile__phone_number', 'profile__profile_picture',
+    ).afirst()
+    return json_response({
+        'first_name': row['first_name'],
+        'last_name': row['last_name'],
+        'phone_number': row['profile__phone_number'],
+        'email': row['email'],
+        'profile_picture': default_storage.url(row['profile__profile_picture'])
+        if row['profile__profile_picture'] else None,
+    })
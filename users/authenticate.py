@@ -1,5 +1,21 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.settings import api_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from core.async_views import json_response
+from .models import CachedUser
+
+# User fields kept in the flags cache; every other field is loaded on first access.
+CACHED_USER_FIELDS = ('is_active', 'is_staff', 'is_superuser')
+
 
 class EmailBackend(ModelBackend):
     def authenticate(self, request, email=None, password=None, **kwargs):
@@ -9,3 +25,90 @@ class EmailBackend(ModelBackend):
                 return user
         except get_user_model().DoesNotExist:
             return None
+
+
+def get_flags_cache():
+    return caches[getattr(settings, 'USER_FLAGS_CACHE_ALIAS', 'default')]
+
+
+def flags_key(user_id):
+    return f'user-flags:{user_id}'
+
+
+def evict_user_flags(user_id):
+    get_flags_cache().delete(flags_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that builds ``request.user`` from the token's user id
+    and a short-lived cache of the user's active/staff/superuser flags, so an
+    authenticated request does not read the user row.
+
+    The user is a ``CachedUser`` with every other field deferred: the first
+    read of e.g. ``user.email`` or ``user.password`` loads the rest of the row
+    in one query. A cache miss loads the full row, like ``JWTAuthentication``.
+    Saving or deleting a user evicts its cache entry (see ``users/signals.py``);
+    queryset ``update()`` does not, so such changes apply within
+    ``USER_FLAGS_CACHE_TIMEOUT`` seconds.
+    """
+    def get_user(self, validated_token):
+        if jwt_settings.CHECK_REVOKE_TOKEN:
+            # Needs the password hash on every request; nothing to save.
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        cache = get_flags_cache()
+        key = flags_key(user_id)
+        flags = cache.get(key)
+        if flags is None:
+            # Miss: the same single query JWTAuthentication runs, and the full row is at hand anyway.
+            user = super().get_user(validated_token)
+            cache.set(key, tuple(getattr(user, name) for name in CACHED_USER_FIELDS),
+                      getattr(settings, 'USER_FLAGS_CACHE_TIMEOUT', 60))
+            return user
+
+        user = self.token_user(user_id, dict(zip(CACHED_USER_FIELDS, flags)))
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+    def token_user(self, user_id, flags):
+        values = {CachedUser._meta.get_field(jwt_settings.USER_ID_FIELD).attname: user_id, **flags}
+        # from_db() wants the loaded values in model field order; the rest become deferred.
+        field_names = [field.attname for field in CachedUser._meta.concrete_fields if field.attname in values]
+        return CachedUser.from_db(CachedUser.objects.db, field_names, [values[name] for name in field_names])
+
+
+async def aauthenticate_request(request):
+    """
+    Run the REST framework authentication classes for a plain (async) Django view.
+
+    Returns the authenticated user or ``None``; invalid credentials raise
+    ``rest_framework.exceptions.AuthenticationFailed``.
+    """
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        result = await sync_to_async(authentication_class().authenticate)(request)
+        if result is not None:
+            return result[0]
+    return None
+
+
+def login_required(view):
+    """
+    Authenticate with the REST framework authentication classes and pass
+    the user to ``view``; answer 401 like ``IsAuthenticated`` otherwise.
+    """
+    async def wrapper(request, *args, **kwargs):
+        try:
+            user = await aauthenticate_request(request)
+        except AuthenticationFailed as e:
+            data = e.detail if isinstance(e.detail, (list, dict)) else {'detail': e.detail}
+            return json_response(data, status=401)
+        if user is None:
+            return json_response({'detail': 'Authentication credentials were not provided.'}, status=401)
+        return await view(request, user, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from users import tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired outstanding JWTs and their blacklist entries in small batches, "
+        "each in its own short transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Tokens deleted per transaction.")
+        parser.add_argument('--sleep', type=float, default=0.0,
+                            help="Seconds to pause between batches, to let other writers in.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be positive.")
+        now = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lt=now).order_by('pk')
+        last_pk = 0
+        pruned = 0
+        while True:
+            # Walking the primary key keeps every batch an index range scan.
+            ids = list(expired.filter(pk__gt=last_pk).values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            last_pk = ids[-1]
+            # Cascades to BlacklistedToken.
+            OutstandingToken.objects.filter(pk__in=ids).delete()
+            pruned += len(ids)
+            if options['sleep']:
+                time.sleep(options['sleep'])
+        if pruned:
+            tokens.bump_version()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} expired token(s)."))
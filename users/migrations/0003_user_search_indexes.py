@@ -0,0 +1,33 @@
+from django.db import migrations
+
+# Case-insensitive indexes for prefix search in UserListView; SQLite uses
+# them for LIKE 'abc%' (Django's istartswith), which is case-insensitive.
+INDEXED_COLUMNS = ('email', 'first_name', 'last_name')
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for column in INDEXED_COLUMNS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS users_user_{column}_nocase_idx ON auth_user ({column} COLLATE NOCASE)"
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for column in INDEXED_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS users_user_{column}_nocase_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_alter_customuser_options_alter_userprofile_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
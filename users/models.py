@@ -2,9 +2,13 @@ from django.contrib.auth.models import AbstractUser, Group, Permission
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
+from django.dispatch import Signal
 
 User = get_user_model()
 
+# Sent by CachedUser.refresh_from_db() with ``instance`` and ``fields``, the deferred fields it just loaded.
+deferred_fields_loaded = Signal()
+
 class UserProfile(models.Model):
     user = models.OneToOneField(
         User,  # Use the 'User' alias instead of calling get_user_model() again
@@ -28,6 +32,25 @@ class UserProfile(models.Model):
         verbose_name_plural = _("User Profiles")
 
 
+class CachedUser(User):
+    """
+    The user ``CachedJWTAuthentication`` builds from a token and the cached
+    flags, with every other field deferred (see ``users/authenticate.py``).
+    """
+    class Meta:
+        proxy = True
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        # Reading one deferred field loads all of them, in one query instead of one per field.
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred and set(fields) <= deferred:
+            fields = deferred
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        loaded = deferred - self.get_deferred_fields()
+        if loaded:
+            deferred_fields_loaded.send(sender=type(self), instance=self, fields=loaded)
+
+
 class CustomUser(AbstractUser):
     email = models.EmailField(_("Email Address"), unique=True)
     USERNAME_FIELD = 'email'
@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UserListPagination(CursorPagination):
+    """
+    Keyset pages of users by id, always on.
+    """
+    ordering = ('id',)
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -1,7 +1,9 @@
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from rest_framework import serializers
+from core.serializers import SparseFieldsetMixin
 from django.contrib.auth.password_validation import validate_password
 from users.models import UserProfile
 
@@ -28,7 +30,9 @@ class RegisterSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({_('password'): _('Passwords must match')})
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
+        # The user and the profile created by users.signals commit together.
         validated_data.pop('confirm_password')
         user = User(
             username=validated_data['username'],
@@ -40,7 +44,7 @@ class RegisterSerializer(serializers.ModelSerializer):
         user.save()
         return user
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'first_name', 'last_name', 'email', 'username']
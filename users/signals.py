@@ -1,24 +1,63 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import UserProfile
+from .authenticate import evict_user_flags
+from .models import CachedUser, UserProfile, deferred_fields_loaded
+
+# User fields copied onto the profile.
+PROFILE_FIELDS = ('first_name', 'last_name', 'email')
+
+
+def _loaded_profile_fields(user):
+    # Only fields already loaded: reading a deferred one would cost a query.
+    return {name: user.__dict__[name] for name in PROFILE_FIELDS if name in user.__dict__}
+
+
+@receiver(post_init, sender=User)
+@receiver(post_init, sender=CachedUser)
+def remember_profile_fields(sender, instance, **kwargs):
+    instance._profile_fields = _loaded_profile_fields(instance)
+
+
+@receiver(deferred_fields_loaded, sender=CachedUser)
+def remember_loaded_profile_fields(sender, instance, fields, **kwargs):
+    """
+    Record the values of deferred fields just loaded from the database as
+    the originals, so loading them does not count as a change.
+    """
+    instance._profile_fields = {
+        **getattr(instance, '_profile_fields', {}),
+        **{name: instance.__dict__[name] for name in PROFILE_FIELDS if name in fields and name in instance.__dict__},
+    }
+
 
 @receiver(post_save, sender=User)
-def create_or_update_user_profile(sender, instance, created, **kwargs):
+@receiver(post_save, sender=CachedUser)
+def sync_user_profile(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Create the profile with a new user; afterwards copy first_name, last_name
+    and email over in one UPDATE, and only when one of them changed.
+    """
     if created:
-        UserProfile.objects.create(
-            user=instance,
-            first_name=instance.first_name,
-            last_name=instance.last_name,
-            email=instance.email
-        )
-    else:
-        profile = instance.profile
-        profile.first_name = instance.first_name
-        profile.last_name = instance.last_name
-        profile.email = instance.email
-        profile.save()
+        UserProfile.objects.create(user=instance, **{name: getattr(instance, name) for name in PROFILE_FIELDS})
+        instance._profile_fields = _loaded_profile_fields(instance)
+        return
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    instance.profile.save()
+    saved = _loaded_profile_fields(instance)
+    if update_fields is not None:
+        saved = {name: value for name, value in saved.items() if name in update_fields}
+    # Fields set on a deferred instance without being loaded have no original value and count as changed.
+    original = getattr(instance, '_profile_fields', {})
+    changed = {name: value for name, value in saved.items() if name not in original or original[name] != value}
+    if changed and not UserProfile.objects.filter(user=instance).update(**changed):
+        UserProfile.objects.create(user=instance, **{name: getattr(instance, name) for name in PROFILE_FIELDS})
+    instance._profile_fields = {**original, **saved}
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=CachedUser)
+def evict_cached_user_flags(sender, instance, **kwargs):
+    # After commit, so a concurrent request can't re-cache the old flags.
+    user_id = instance.pk
+    transaction.on_commit(lambda: evict_user_flags(user_id))
@@ -0,0 +1,92 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+from users.authenticate import CachedJWTAuthentication
+from users.models import CachedUser, UserProfile
+
+
+class CachedJWTAuthenticationTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('holder', 'holder@example.com', PASSWORD,
+                                            first_name='Holder', last_name='Name')
+
+    def test_cached_flags_skip_user_lookup(self):
+        self.login(self.user)
+        self.client.get(reverse('user-applications'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('user-applications'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q['sql'] for q in queries if '"auth_user"' in q['sql']])
+
+    def test_deactivation_evicts_cached_flags(self):
+        self.login(self.user)
+        self.assertEqual(self.client.get(reverse('user-applications')).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.client.get(reverse('user-applications')).status_code, 401)
+
+    def test_async_profile_with_cached_flags(self):
+        self.login(self.user)
+        for _ in range(2):  # the second request authenticates from the warm cache
+            response = self.client.get(reverse('async-user-profile'))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['email'], self.user.email)
+            self.assertEqual(response.json()['first_name'], self.user.first_name)
+
+    def test_deferred_fields_load_on_access(self):
+        self.login(self.user)
+        response = self.client.post(reverse('change-password'), {
+            'old_password': PASSWORD, 'new_password': 'An0ther-secret!', 'confirm_password': 'An0ther-secret!',
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('An0ther-secret!'))
+        self.assertEqual(self.user.profile.email, self.user.email)
+
+    def test_change_password_with_cached_flags(self):
+        self.login(self.user)
+        self.client.get(reverse('user-applications'))  # warms the flags cache
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('change-password'), {
+                'old_password': PASSWORD, 'new_password': 'An0ther-secret!',
+                'confirm_password': 'An0ther-secret!',
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q['sql'] for q in queries if 'profile' in q['sql'].lower()])
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('An0ther-secret!'))
+        self.assertEqual(self.user.profile.first_name, self.user.first_name)
+        self.assertEqual(self.user.profile.email, self.user.email)
+
+    def cached_user(self):
+        authentication = CachedJWTAuthentication()
+        token = authentication.get_validated_token(str(AccessToken.for_user(self.user)))
+        authentication.get_user(token)  # warms the flags cache
+        return authentication.get_user(token)
+
+    def test_deferred_load_skips_profile_sync(self):
+        user = self.cached_user()
+        self.assertIsInstance(user, CachedUser)
+        self.assertIn('email', user.get_deferred_fields())
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual((user.email, user.first_name, user.last_name),
+                             (self.user.email, 'Holder', 'Name'))
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]['sql'].startswith('SELECT'))
+        self.assertEqual(user.get_deferred_fields(), set())
+
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+        self.assertFalse([q['sql'] for q in queries if 'users_userprofile' in q['sql']])
+
+    def test_changed_deferred_field_syncs_profile(self):
+        user = self.cached_user()
+        user.first_name = 'Renamed'
+        user.save()
+        self.assertEqual(UserProfile.objects.get(user=self.user).first_name, 'Renamed')
@@ -0,0 +1,92 @@
+"""
+Query-count and wall-time budgets of the users endpoints (see ``main_app.tests.budget``).
+"""
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from main_app.tests.budget import PASSWORD, SEED, BudgetTestCase
+
+# (url name, method) -> (max queries, max milliseconds)
+BUDGETS = {
+    ('register', 'POST'): (6, 200),
+    ('login', 'POST'): (2, 200),
+    ('user-list', 'GET'): (3, 200),
+    ('user-count', 'GET'): (1, 150),
+    ('user-profile', 'GET'): (2, 150),
+    ('user-profile', 'PUT'): (3, 150),
+    ('user-profile', 'DELETE'): (2, 150),
+    ('user-logout', 'POST'): (7, 150),
+    ('change-password', 'POST'): (5, 200),
+    ('async-user-profile', 'GET'): (2, 150),
+}
+
+
+class UserBudgetTests(BudgetTestCase):
+    budgets = BUDGETS
+    urlconf = 'users.urls'
+
+    def test_register(self):
+        self.assertWithinBudget('register', 'POST', expected_status=201, data={
+            'username': 'newcomer', 'first_name': 'New', 'last_name': 'Comer',
+            'email': 'newcomer@example.com', 'password': PASSWORD, 'confirm_password': PASSWORD,
+        }, format='json')
+
+    def test_login(self):
+        # The project also names django.contrib.auth's login view 'login', so reverse() can't be used here.
+        response = self.assertWithinBudget('login', 'POST', '/users/login/',
+                                           data={'email': self.user.email, 'password': PASSWORD}, format='json')
+        self.assertIn('access_token', response.data)
+
+    def test_user_list(self):
+        self.login(self.admin)
+        response = self.assertWithinBudget('user-list', 'GET')
+        self.assertEqual(response.data['user_count'], SEED['users'] + 1)
+        self.assertEqual(len(response.data['users']), 50)
+        self.assertWithinBudget('user-list', 'GET', response.data['next'])
+
+    def test_user_list_search_and_fields(self):
+        self.login(self.admin)
+        response = self.assertWithinBudget('user-list', 'GET', reverse('user-list') + '?search=USER1&fields=id,email')
+        self.assertTrue(response.data['users'])
+        for row in response.data['users']:
+            self.assertEqual(set(row), {'id', 'email'})
+            self.assertTrue(row['email'].startswith('user1'))
+
+    def test_user_list_rejects_unknown_fields(self):
+        self.login(self.admin)
+        self.assertEqual(self.client.get(reverse('user-list') + '?fields=id,password').status_code, 400)
+
+    def test_user_list_is_admin_only(self):
+        self.assertEqual(self.client.get(reverse('user-list')).status_code, 401)
+        self.login(self.user)
+        self.assertEqual(self.client.get(reverse('user-list')).status_code, 403)
+
+    def test_user_count(self):
+        self.assertWithinBudget('user-count', 'GET')
+
+    def test_profile(self):
+        self.login(self.user)
+        self.assertWithinBudget('user-profile', 'GET')
+
+    def test_profile_update(self):
+        self.login(self.user)
+        self.assertWithinBudget('user-profile', 'PUT', data={'phone_number': '+998901112233'}, format='json')
+
+    def test_profile_picture_delete(self):
+        self.login(self.user)
+        self.assertWithinBudget('user-profile', 'DELETE', expected_status=400)
+
+    def test_logout(self):
+        self.login(self.user)
+        refresh = RefreshToken.for_user(self.user)
+        self.assertWithinBudget('user-logout', 'POST', data={'refresh_token': str(refresh)}, format='json')
+
+    def test_change_password(self):
+        self.login(self.user)
+        self.assertWithinBudget('change-password', 'POST', data={
+            'old_password': PASSWORD, 'new_password': 'An0ther-secret!', 'confirm_password': 'An0ther-secret!',
+        }, format='json')
+
+    def test_async_profile(self):
+        self.login(self.user)
+        self.assertWithinBudget('async-user-profile', 'GET')
@@ -0,0 +1,34 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from users.models import UserProfile
+
+
+class ProfileSyncTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('synced', 'synced@example.com', 'x', first_name='Old')
+
+    def test_profile_created_with_user(self):
+        self.assertEqual(UserProfile.objects.get(user=self.user).first_name, 'Old')
+
+    def test_unchanged_fields_skip_profile_write(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.last_login = timezone.now()
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+        self.assertFalse([q['sql'] for q in queries if 'users_userprofile' in q['sql']])
+
+    def test_changed_fields_update_profile_once(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.first_name = 'New'
+        user.email = 'new@example.com'
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+        profile_queries = [q['sql'] for q in queries if 'users_userprofile' in q['sql']]
+        self.assertEqual(len(profile_queries), 1)
+        self.assertTrue(profile_queries[0].startswith('UPDATE'))
+        profile = UserProfile.objects.get(user=user)
+        self.assertEqual((profile.first_name, profile.email), ('New', 'new@example.com'))
@@ -0,0 +1,50 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+
+class AuthThrottlingTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('holder', 'holder@example.com', PASSWORD)
+        cls.other = User.objects.create_user('other', 'other@example.com', PASSWORD)
+
+    def test_login_throttled_per_email(self):
+        data = {'email': self.user.email.upper(), 'password': 'wrong-password'}
+        for n in range(5):
+            response = self.client.post('/users/login/', data, format='json', REMOTE_ADDR=f'10.0.0.{n}')
+            self.assertEqual(response.status_code, 401)
+        # A new address does not help: the account's bucket is empty.
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post('/users/login/', data, format='json', REMOTE_ADDR='10.0.1.1')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response['Retry-After']), 0)
+        self.assertEqual(len(captured), 0)
+        # Other accounts are unaffected.
+        response = self.client.post('/users/login/', {'email': self.other.email, 'password': PASSWORD},
+                                    format='json', REMOTE_ADDR='10.0.1.1')
+        self.assertEqual(response.status_code, 200)
+
+    def test_login_throttled_per_ip(self):
+        for n in range(20):
+            self.client.post('/users/login/', {'email': f'nobody{n}@example.com', 'password': 'x'}, format='json')
+        response = self.client.post('/users/login/', {'email': self.user.email, 'password': PASSWORD},
+                                    format='json')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+
+    def test_login_throttle_ignores_spoofed_forwarded_for(self):
+        for n in range(20):
+            self.client.post('/users/login/', {'email': f'nobody{n}@example.com', 'password': 'x'}, format='json',
+                             HTTP_X_FORWARDED_FOR=f'10.0.0.{n}')
+        response = self.client.post('/users/login/', {'email': self.user.email, 'password': PASSWORD},
+                                    format='json', HTTP_X_FORWARDED_FOR='10.0.1.1')
+        self.assertEqual(response.status_code, 429)
+
+    def test_register_throttled_per_ip(self):
+        for n in range(10):
+            self.client.post(reverse('register'), {'email': f'bad{n}'}, format='json')
+        self.assertEqual(self.client.post(reverse('register'), {'email': 'bad'}, format='json').status_code, 429)
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from users import tokens
+from main_app.tests.base import PASSWORD, IsolatedAPITestCase
+
+
+class TokenBlacklistTests(IsolatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('holder', 'holder@example.com', PASSWORD)
+
+    def setUp(self):
+        super().setUp()
+        tokens.reset()
+
+    def test_bloom_filter(self):
+        bloom = tokens.BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f'in-{i}')
+        self.assertTrue(all(f'in-{i}' in bloom for i in range(1000)))
+        false_positives = sum(f'out-{i}' in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_unlisted_token_skips_blacklist_query(self):
+        refresh = str(tokens.RefreshToken.for_user(self.user))
+        tokens.blacklist_filter()
+        with CaptureQueriesContext(connection) as queries:
+            tokens.RefreshToken(refresh)
+        self.assertEqual(len(queries), 0)
+
+    def test_logged_out_token_is_rejected(self):
+        refresh = tokens.RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"token {refresh.access_token}")
+        tokens.blacklist_filter()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('user-logout'), {'refresh_token': str(refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(tokens.might_be_blacklisted(refresh['jti']))
+        with self.assertRaises(TokenError):
+            tokens.RefreshToken(str(refresh))
+
+    def test_blacklisting_elsewhere_extends_filter(self):
+        tokens.blacklist_filter()
+        refresh = tokens.RefreshToken.for_user(self.user)
+        # Blacklisted by another process: this one's filter only learns of it through the version.
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=refresh['jti']))
+        tokens.bump_version()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(tokens.might_be_blacklisted(refresh['jti']))
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('expires_at', queries[0]['sql'])
+        with self.assertRaises(TokenError):
+            tokens.RefreshToken(str(refresh))
+
+    def test_prune_tokens(self):
+        live = tokens.RefreshToken.for_user(self.user)
+        for _ in range(5):
+            tokens.RefreshToken.for_user(self.user).blacklist()
+        OutstandingToken.objects.exclude(jti=live['jti']).update(expires_at=timezone.now() - timedelta(days=1))
+        call_command('prune_tokens', batch_size=2, stdout=StringIO())
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [live['jti']])
+        self.assertFalse(BlacklistedToken.objects.exists())
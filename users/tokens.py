@@ -0,0 +1,137 @@
+"""
+Refresh tokens whose blacklist check usually skips the database.
+
+Each process keeps a bloom filter of the blacklisted token ids (jti). A
+token that is not in the filter is certainly not blacklisted; only a
+filter hit (a blacklisted token, or a rare false positive) queries
+``BlacklistedToken``.
+
+Blacklisting bumps a version key in the shared cache after commit; a
+process whose filter was built for an older version adds just the
+``BlacklistedToken`` rows past the highest primary key it has seen on its
+next check. Only once the filter is older than
+``TOKEN_BLACKLIST_FILTER_MAX_AGE`` seconds is it rebuilt from every live
+entry, which also drops expired and pruned ones. A blacklisting whose
+transaction commits after one with a higher key (possible on databases
+with concurrent writers) reaches other processes at that rebuild.
+"""
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+VERSION_KEY = 'token-blacklist:version'
+
+
+class BloomFilter:
+    """
+    A fixed-size bloom filter of strings, sized for ``capacity`` items at
+    the given false-positive ``error_rate``.
+    """
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing (Kirsch-Mitzenmacher): two 64-bit halves of one digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        a, b = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return ((a + i * b) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+def get_cache():
+    return caches[getattr(settings, 'TOKEN_BLACKLIST_CACHE_ALIAS', 'default')]
+
+
+def get_version():
+    return get_cache().get(VERSION_KEY)
+
+
+def bump_version():
+    get_cache().set(VERSION_KEY, time.time_ns(), None)
+
+
+_lock = threading.Lock()
+_state = {'filter': None, 'version': None, 'built_at': 0.0, 'last_id': 0}
+
+
+def _rebuild(version):
+    rows = list(
+        BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        .values_list('pk', 'token__jti').iterator()
+    )
+    capacity = max(getattr(settings, 'TOKEN_BLACKLIST_FILTER_CAPACITY', 100000), 2 * len(rows))
+    bloom = BloomFilter(capacity, getattr(settings, 'TOKEN_BLACKLIST_FILTER_ERROR_RATE', 0.001))
+    for _, jti in rows:
+        bloom.add(jti)
+    last_id = max((pk for pk, _ in rows), default=0)
+    with _lock:
+        _state.update(filter=bloom, version=version, built_at=time.monotonic(), last_id=last_id)
+    return bloom
+
+
+def _catch_up(bloom, version, last_id):
+    rows = list(BlacklistedToken.objects.filter(pk__gt=last_id).values_list('pk', 'token__jti'))
+    with _lock:
+        for _, jti in rows:
+            bloom.add(jti)
+        if _state['filter'] is bloom:
+            _state.update(version=version, last_id=max([_state['last_id']] + [pk for pk, _ in rows]))
+    return bloom
+
+
+def blacklist_filter():
+    """
+    This process's bloom filter, first extended with tokens blacklisted
+    since it last looked, or rebuilt if it is too old.
+    """
+    version = get_version()
+    max_age = getattr(settings, 'TOKEN_BLACKLIST_FILTER_MAX_AGE', 300)
+    with _lock:
+        bloom, seen_version, last_id = _state['filter'], _state['version'], _state['last_id']
+        expired = bloom is None or time.monotonic() - _state['built_at'] >= max_age
+    if expired:
+        return _rebuild(version)
+    if seen_version != version:
+        return _catch_up(bloom, version, last_id)
+    return bloom
+
+
+def might_be_blacklisted(jti):
+    return jti in blacklist_filter()
+
+
+def reset():
+    with _lock:
+        _state.update(filter=None, version=None, built_at=0.0, last_id=0)
+
+
+class RefreshToken(tokens.RefreshToken):
+    def check_blacklist(self):
+        if might_be_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        with _lock:
+            if _state['filter'] is not None:
+                _state['filter'].add(self.payload[api_settings.JTI_CLAIM])
+        transaction.on_commit(bump_version)
+        return blacklisted
@@ -1,4 +1,5 @@
 from django.urls import path
+from users import async_views
 from users.views import (
     RegisterAPIView,
     LoginAPIView,
@@ -16,4 +17,7 @@ urlpatterns = [
     path('profile/', UserProfileView.as_view(), name='user-profile'),
     path('logout/', LogoutView.as_view(), name='user-logout'),
     path('change-password/', ChangePasswordView.as_view(), name='change-password'),
+
+    # async (ASGI) read path
+    path('async/profile/', async_views.user_profile, name='async-user-profile'),
 ]
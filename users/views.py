@@ -1,10 +1,11 @@
 from django.contrib.auth import authenticate
 from rest_framework.generics import ListAPIView
-from rest_framework.permissions import IsAuthenticated
+from django.db.models import Q
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+from users.tokens import RefreshToken
 from datetime import timedelta
 from .models import UserProfile
 from .serializers import (
@@ -12,21 +13,30 @@ from .serializers import (
     UserProfileSerializer, ChangePasswordSerializer
 )
 from django.contrib.auth.models import User
+from core import counters
+from core.throttling import EmailRateThrottle, IPRateThrottle
+from .pagination import UserListPagination
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+# Name of the users counter in STAT_COUNTED_MODELS
+USER_COUNTER = 'users'
+
 
 class RegisterAPIView(APIView):
     """
     User registration endpoint.
     """
+    throttle_scope = 'register'
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
 
     @swagger_auto_schema(
         operation_description="Register a new user.",
         request_body=RegisterSerializer,
         responses={
             201: openapi.Response("User created successfully"),
-            400: "Bad Request"
+            400: "Bad Request",
+            429: "Too many attempts; see Retry-After"
         },
         tags=["User Registration"]
     )
@@ -42,6 +52,8 @@ class LoginAPIView(APIView):
     """
     User login endpoint.
     """
+    throttle_scope = 'login'
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
 
     @swagger_auto_schema(
         operation_description="Log in a user and get tokens.",
@@ -49,7 +61,8 @@ class LoginAPIView(APIView):
         responses={
             200: openapi.Response("Tokens returned successfully"),
             401: "Invalid credentials",
-            400: "Bad Request"
+            400: "Bad Request",
+            429: "Too many attempts; see Retry-After"
         },
         tags=["User Login"]
     )
@@ -75,22 +88,51 @@ class LoginAPIView(APIView):
 
 class UserListView(ListAPIView):
     """
-    List all users.
+    List users for admins, in keyset pages by id.
     """
     queryset = User.objects.all()
     serializer_class = UserListSerializer
+    pagination_class = UserListPagination
+    permission_classes = [IsAdminUser]
+
+    def get_queryset(self):
+        users = super().get_queryset()
+        search = self.request.query_params.get('search', '').strip()
+        if search:
+            # As an id IN (...) subquery SQLite answers the OR from the three
+            # NOCASE prefix indexes (users migration 0003), even with a cursor.
+            matches = User.objects.filter(
+                Q(email__istartswith=search) | Q(first_name__istartswith=search) | Q(last_name__istartswith=search)
+            )
+            users = users.filter(pk__in=matches.values('pk'))
+        fields = UserListSerializer.selected_fields(self.request)
+        return UserListSerializer.project_queryset(users, fields or UserListSerializer.Meta.fields)
 
     @swagger_auto_schema(
-        operation_description="Retrieve a list of all users.",
-        responses={200: UserListSerializer(many=True)},
+        operation_description=(
+            "Retrieve users in pages of 'page_size' (max 200); follow 'next' for more. "
+            "'user_count' is the total number of users, from the maintained counter."
+        ),
+        manual_parameters=[
+            openapi.Parameter('search', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="Prefix of the email, first name or last name (case-insensitive)."),
+            openapi.Parameter('fields', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="Comma-separated fields to return, e.g. 'id,email'."),
+            openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="Page cursor from 'next'/'previous'."),
+            openapi.Parameter('page_size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                              description="Users per page (max 200)."),
+        ],
+        responses={200: UserListSerializer(many=True), 400: "Bad Request"},
         tags=["User Management"]
     )
     def get(self, request, *args, **kwargs):
-        users = self.get_queryset()
-        serializer = self.get_serializer(users, many=True)
-        user_count = users.count()
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
         return Response({
-            'user_count': user_count,
+            'user_count': counters.get_counts()[USER_COUNTER],
+            'next': self.paginator.get_next_link(),
+            'previous': self.paginator.get_previous_link(),
             'users': serializer.data
         })
 
@@ -106,7 +148,7 @@ class UserCountView(APIView):
         tags=["User Management"]
     )
     def get(self, request, *args, **kwargs):
-        user_count = User.objects.count()
+        user_count = counters.get_counts()[USER_COUNTER]
         return Response({'user_count': user_count}, status=status.HTTP_200_OK)
 
 
@@ -218,6 +260,6 @@ class ChangePasswordView(APIView):
             user = request.user
             new_password = serializer.validated_data['new_password']
             user.set_password(new_password)
-            user.save()
+            user.save(update_fields=['password'])
             return Response({"message": "Password changed successfully!"}, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)